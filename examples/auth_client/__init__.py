@@ -0,0 +1,29 @@
+"""
+Authentication Client Kütüphanesi
+Örnek server'lar için bağlantı havuzlu, token'ı kendiliğinden yenileyen client'lar
+
+  • JWTClient / BearerClient      - requests.Session tabanlı, thread-safe
+  • AsyncJWTClient / AsyncBearerClient - aiohttp tabanlı, asyncio için (pip install aiohttp)
+"""
+
+from .errors import AuthError
+from .sync_client import BearerClient, JWTClient
+from .tokens import TokenPair, token_expiry
+
+__all__ = [
+    "AuthError",
+    "BearerClient",
+    "JWTClient",
+    "TokenPair",
+    "token_expiry",
+    "AsyncBearerClient",
+    "AsyncJWTClient",
+]
+
+
+def __getattr__(name):
+    # aiohttp isteğe bağlıdır; async client'lar yalnızca kullanıldığında import edilir
+    if name in ("AsyncBearerClient", "AsyncJWTClient"):
+        from . import async_client
+        return getattr(async_client, name)
+    raise AttributeError(name)
@@ -0,0 +1,179 @@
+"""
+Asenkron Client
+aiohttp üzerinde bağlantı havuzu ile çalışan asyncio client'ları (pip install aiohttp)
+
+Dönen yanıtların gövdesi önceden okunur; await response.json() / response.text()
+bağlantı havuza döndükten sonra da kullanılabilir.
+"""
+
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError("async client için aiohttp gerekli: pip install aiohttp")
+
+from .errors import AuthError
+from .sync_client import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT
+from .tokens import DEFAULT_REFRESH_MARGIN, TokenPair
+
+
+class _PooledClient:
+    def __init__(self, base_url, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session = None
+
+    @property
+    def session(self):
+        # ClientSession çalışan bir event loop içinde oluşturulmalı
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    def _url(self, path):
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def _send(self, method, path, token=None, headers=None, **kwargs):
+        headers = dict(headers or {})
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        async with self.session.request(method, self._url(path), headers=headers, **kwargs) as response:
+            await response.read()
+            return response
+
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path, **kwargs):
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path, **kwargs):
+        return await self.request("DELETE", path, **kwargs)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+class AsyncBearerClient(_PooledClient):
+    """Sabit API token ile istek gönderen asyncio client"""
+
+    def __init__(self, base_url, token, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.token = token
+
+    async def request(self, method, path, **kwargs):
+        return await self._send(method, path, token=self.token, **kwargs)
+
+
+class AsyncJWTClient(_PooledClient):
+    """JWTClient'ın asyncio karşılığı
+
+    Eşzamanlı task'lar yenileme gerektiğini fark ettiğinde tek bir /refresh (veya
+    /login) isteği gönderilir; diğer task'lar asyncio.Lock üzerinde bekleyip sonucu kullanır.
+    """
+
+    def __init__(self, base_url, username=None, password=None,
+                 refresh_margin=DEFAULT_REFRESH_MARGIN, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.username = username
+        self.password = password
+        self.refresh_margin = refresh_margin
+        self._tokens = None
+        self._lock = asyncio.Lock()
+        self.logins = 0
+        self.refreshes = 0
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    async def login(self, username=None, password=None):
+        """Kullanıcı adı / şifre ile yeni token çifti alır ve login yanıtını döner"""
+        if username is not None:
+            self.username, self.password = username, password
+        async with self._lock:
+            return await self._login()
+
+    async def _login(self):
+        if self.username is None or self.password is None:
+            raise AuthError("Token yenilenemedi ve login bilgisi yok")
+        response = await self._send(
+            "POST", "/login", json={"username": self.username, "password": self.password}
+        )
+        self.logins += 1
+        if response.status != 200:
+            raise AuthError("Login başarısız", response.status, await response.text())
+        data = await response.json()
+        self._tokens = TokenPair(data["access_token"], data.get("refresh_token"))
+        return data
+
+    async def _refresh(self):
+        response = await self._send("POST", "/refresh", token=self._tokens.refresh_token)
+        self.refreshes += 1
+        if response.status != 200:
+            raise AuthError("Token yenileme başarısız", response.status, await response.text())
+        data = await response.json()
+        self._tokens = self._tokens.with_access_token(data["access_token"])
+
+    async def _renew(self, stale, force=False):
+        async with self._lock:
+            current = self._tokens
+            if current is not None and current.access_valid(self.refresh_margin):
+                # Kilidi beklerken başka bir task yenilediyse onun token'ını kullan
+                if current is not stale or not force:
+                    return current
+
+            if current is not None and current.refresh_valid():
+                try:
+                    await self._refresh()
+                    return self._tokens
+                except AuthError as e:
+                    if e.status_code not in (401, 422):
+                        raise
+            await self._login()
+            return self._tokens
+
+    async def _valid_tokens(self):
+        tokens = self._tokens
+        if tokens is not None and tokens.access_valid(self.refresh_margin):
+            return tokens
+        return await self._renew(tokens)
+
+    async def access_token(self):
+        """Geçerli access token; süresi dolmak üzereyse önce yeniler"""
+        return (await self._valid_tokens()).access_token
+
+    async def request(self, method, path, **kwargs):
+        """Authorization header'ı ekleyerek istek gönderir; 401'de bir kez yenileyip tekrarlar"""
+        tokens = await self._valid_tokens()
+        response = await self._send(method, path, token=tokens.access_token, **kwargs)
+        if response.status == 401:
+            tokens = await self._renew(tokens, force=True)
+            response = await self._send(method, path, token=tokens.access_token, **kwargs)
+        return response
+
+    async def logout(self):
+        """Access token'ı server'da iptal eder ve yerel token'ları siler"""
+        async with self._lock:
+            tokens, self._tokens = self._tokens, None
+        if tokens is None:
+            return None
+        return await self._send("POST", "/logout", token=tokens.access_token)
+
+    def stats(self):
+        return {"logins": self.logins, "refreshes": self.refreshes}
@@ -0,0 +1,10 @@
+"""Client hataları"""
+
+
+class AuthError(Exception):
+    """Login / token yenileme başarısız oldu"""
+
+    def __init__(self, message, status_code=None, body=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
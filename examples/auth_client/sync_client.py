@@ -0,0 +1,178 @@
+"""
+Senkron Client
+requests.Session üzerinde bağlantı havuzu ile çalışan, thread-safe client'lar
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .errors import AuthError
+from .tokens import DEFAULT_REFRESH_MARGIN, TokenPair
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10.0
+
+# Bağlantı kurulamazsa (istek gönderilmeden) tekrar deneme sayısı
+DEFAULT_CONNECT_RETRIES = 2
+
+
+def _session(pool_size, retries):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _PooledClient:
+    def __init__(self, base_url, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 retries=DEFAULT_CONNECT_RETRIES):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = _session(pool_size, retries)
+
+    def _url(self, path):
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _send(self, method, path, token=None, headers=None, **kwargs):
+        headers = dict(headers or {})
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, self._url(path), headers=headers, **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BearerClient(_PooledClient):
+    """Sabit API token ile istek gönderen client (bearer_token_example)"""
+
+    def __init__(self, base_url, token, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.token = token
+
+    def request(self, method, path, **kwargs):
+        return self._send(method, path, token=self.token, **kwargs)
+
+
+class JWTClient(_PooledClient):
+    """Login olup access token'ı süresi dolmadan yenileyen client (jwt_token_example)
+
+    Aynı anda birden fazla thread yenileme gerektiğini fark ederse yalnızca biri
+    /refresh (veya gerekirse /login) isteği gönderir; diğerleri onun sonucunu kullanır.
+    """
+
+    def __init__(self, base_url, username=None, password=None,
+                 refresh_margin=DEFAULT_REFRESH_MARGIN, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.username = username
+        self.password = password
+        self.refresh_margin = refresh_margin
+        self._tokens = None
+        self._lock = threading.Lock()
+        self.logins = 0
+        self.refreshes = 0
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def login(self, username=None, password=None):
+        """Kullanıcı adı / şifre ile yeni token çifti alır ve login yanıtını döner"""
+        if username is not None:
+            self.username, self.password = username, password
+        with self._lock:
+            return self._login()
+
+    def _login(self):
+        if self.username is None or self.password is None:
+            raise AuthError("Token yenilenemedi ve login bilgisi yok")
+        response = self._send(
+            "POST", "/login", json={"username": self.username, "password": self.password}
+        )
+        self.logins += 1
+        if response.status_code != 200:
+            raise AuthError("Login başarısız", response.status_code, response.text)
+        data = response.json()
+        self._tokens = TokenPair(data["access_token"], data.get("refresh_token"))
+        return data
+
+    def _refresh(self):
+        response = self._send("POST", "/refresh", token=self._tokens.refresh_token)
+        self.refreshes += 1
+        if response.status_code != 200:
+            raise AuthError("Token yenileme başarısız", response.status_code, response.text)
+        self._tokens = self._tokens.with_access_token(response.json()["access_token"])
+
+    def _renew(self, stale, force=False):
+        with self._lock:
+            current = self._tokens
+            if current is not None and current.access_valid(self.refresh_margin):
+                # Kilidi beklerken başka bir thread yenilediyse onun token'ını kullan
+                if current is not stale or not force:
+                    return current
+
+            if current is not None and current.refresh_valid():
+                try:
+                    self._refresh()
+                    return self._tokens
+                except AuthError as e:
+                    if e.status_code not in (401, 422):
+                        raise
+            self._login()
+            return self._tokens
+
+    def _valid_tokens(self):
+        tokens = self._tokens
+        if tokens is not None and tokens.access_valid(self.refresh_margin):
+            return tokens
+        return self._renew(tokens)
+
+    def access_token(self):
+        """Geçerli access token; süresi dolmak üzereyse önce yeniler"""
+        return self._valid_tokens().access_token
+
+    def request(self, method, path, **kwargs):
+        """Authorization header'ı ekleyerek istek gönderir
+
+        Server token'ı 401 ile reddederse (örn. iptal edilmişse) token bir kez
+        yenilenip istek tekrarlanır.
+        """
+        tokens = self._valid_tokens()
+        response = self._send(method, path, token=tokens.access_token, **kwargs)
+        if response.status_code == 401:
+            tokens = self._renew(tokens, force=True)
+            response = self._send(method, path, token=tokens.access_token, **kwargs)
+        return response
+
+    def logout(self):
+        """Access token'ı server'da iptal eder ve yerel token'ları siler"""
+        with self._lock:
+            tokens, self._tokens = self._tokens, None
+        if tokens is None:
+            return None
+        return self._send("POST", "/logout", token=tokens.access_token)
+
+    def stats(self):
+        return {"logins": self.logins, "refreshes": self.refreshes}
@@ -0,0 +1,56 @@
+"""
+Token Durumu
+Access / refresh token çifti ve süre hesapları
+"""
+
+import base64
+import json
+import time
+
+# Access token süresinin bitmesine bu kadar saniye kala yenilenir
+DEFAULT_REFRESH_MARGIN = 60
+
+
+def token_expiry(token):
+    """JWT payload'ındaki exp değerini (epoch saniye) döner; okunamazsa None
+
+    İmza doğrulanmaz: değer yalnızca ne zaman yenileneceğine karar vermek için kullanılır,
+    token'ın geçerliliğine server karar verir.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenPair:
+    """Bir login'den elde edilen access ve refresh token"""
+
+    __slots__ = ("access_token", "refresh_token", "access_expires_at", "refresh_expires_at")
+
+    def __init__(self, access_token, refresh_token=None):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.access_expires_at = token_expiry(access_token)
+        self.refresh_expires_at = token_expiry(refresh_token) if refresh_token else None
+
+    def with_access_token(self, access_token):
+        """Refresh token aynı kalarak yeni access token'lı çift"""
+        return TokenPair(access_token, self.refresh_token)
+
+    def access_valid(self, margin=DEFAULT_REFRESH_MARGIN, now=None):
+        """Access token en az margin saniye daha geçerliyse True"""
+        if self.access_expires_at is None:
+            return True
+        now = time.time() if now is None else now
+        return self.access_expires_at - margin > now
+
+    def refresh_valid(self, now=None):
+        if not self.refresh_token:
+            return False
+        if self.refresh_expires_at is None:
+            return True
+        now = time.time() if now is None else now
+        return self.refresh_expires_at > now
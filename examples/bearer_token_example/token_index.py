@@ -0,0 +1,241 @@
+"""
+API Token İndeksi
+Ham token yerine anahtarlı hash'ini saklayan SQLite tabanlı token deposu
+
+  • Token'lar BLAKE2b (anahtarlı) özeti ile indekslenir; ham token hiçbir yerde saklanmaz
+  • Arama, saldırganın hesaplayamadığı bir özet üzerinden yapıldığı için
+    karşılaştırma süresi ham token hakkında bilgi sızdırmaz
+  • Token'lara son kullanma zamanı verilebilir; kullanıcıya göre toplu iptal yapılabilir
+  • Süresi dolan token'lar listelenmez ve en fazla PURGE_INTERVAL saniyede bir silinir
+  • Veritabanı dosyası mmap ile okunur; restart sonrası token'lar belleğe yüklenmez
+  • Listeleme eklenme sırasıyla (id) keyset sayfalama ile yapılır; user/role filtreleri indekslidir
+  • Her yazma işlemi ortak bir değişiklik sayacını artırır (generation()); birden fazla
+    worker process aynı dosyayı kullandığında önbellekler bu sayaçla geçersiz kılınır
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+DIGEST_SIZE = 32
+
+# Üretilen token'ların sabit ön eki
+TOKEN_SCHEME = "api_token_"
+
+# Listelemede sabit ön ekten sonra gösterilecek karakter sayısı; token'ları ayırt etmeye
+# yeter, token'ın geri kalanı hakkında bilgi vermez
+TOKEN_PREFIX_LENGTH = 8
+
+# SQLite mmap boyutu (byte)
+MMAP_SIZE = 256 * 1024 * 1024
+
+# iter_tokens() her sorguda okuduğu satır sayısı
+ITER_CHUNK_SIZE = 500
+
+# Süresi dolmuş token'ların silinmesi arasında geçen en kısa süre (saniye)
+PURGE_INTERVAL = 60
+
+_COLUMNS = "token_hash, token_prefix, user, role, created_at, expires_at"
+
+
+def token_prefix(token):
+    """Listelemede gösterilen ön ek: sabit kısım ve ardından gelen ilk TOKEN_PREFIX_LENGTH karakter"""
+    start = len(TOKEN_SCHEME) if token.startswith(TOKEN_SCHEME) else 0
+    return token[:start + TOKEN_PREFIX_LENGTH]
+
+
+class TokenIndex:
+    """Anahtarlı hash ile indekslenmiş API token deposu"""
+
+    def __init__(self, path, key):
+        self.path = path
+        self._key = key.encode() if isinstance(key, str) else key
+        self._local = threading.local()
+        self._next_purge = 0
+        conn = self._connection()
+        with conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(api_tokens)")}
+            if columns and "id" not in columns:
+                # Eski şemada sayfalama için sabit bir sıra anahtarı (id) yoktu
+                conn.execute("ALTER TABLE api_tokens RENAME TO api_tokens_old")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_tokens ("
+                " id INTEGER PRIMARY KEY,"
+                " token_hash BLOB NOT NULL UNIQUE,"
+                " token_prefix TEXT NOT NULL,"
+                " user TEXT NOT NULL,"
+                " role TEXT NOT NULL,"
+                " created_at INTEGER NOT NULL,"
+                " expires_at INTEGER"
+                ")"
+            )
+            if columns and "id" not in columns:
+                conn.execute(
+                    f"INSERT INTO api_tokens ({_COLUMNS}) "
+                    f"SELECT {_COLUMNS} FROM api_tokens_old ORDER BY created_at"
+                )
+                conn.execute("DROP TABLE api_tokens_old")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_api_tokens_user ON api_tokens (user, id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_api_tokens_role ON api_tokens (role, id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_api_tokens_expires_at "
+                "ON api_tokens (expires_at) WHERE expires_at IS NOT NULL"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS index_meta ("
+                " key TEXT PRIMARY KEY,"
+                " value INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO index_meta (key, value) VALUES ('generation', 0)"
+            )
+
+    def _connection(self):
+        # sqlite3 bağlantıları thread'ler arasında paylaşılmaz
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _bump_generation(conn):
+        conn.execute("UPDATE index_meta SET value = value + 1 WHERE key = 'generation'")
+
+    def generation(self):
+        """Token listesi her değiştiğinde artan sayaç (tüm process'lerde ortak)"""
+        return self._connection().execute(
+            "SELECT value FROM index_meta WHERE key = 'generation'"
+        ).fetchone()[0]
+
+    def digest(self, token):
+        """Token'ın anahtarlı BLAKE2b özeti"""
+        if not isinstance(token, str):
+            raise TypeError(f"token metin olmalı, {type(token).__name__} verildi")
+        return hashlib.blake2b(
+            token.encode(), key=self._key, digest_size=DIGEST_SIZE
+        ).digest()
+
+    def add(self, token, user, role, expires_in=None, replace=True):
+        """Token'ı ekler; expires_in saniye sonra geçersiz olur (None = süresiz)"""
+        now = int(time.time())
+        self.purge_if_due(now)
+        expires_at = now + int(expires_in) if expires_in else None
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                f"{verb} INTO api_tokens ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.digest(token), token_prefix(token), user, role, now, expires_at)
+            )
+            if cursor.rowcount:
+                self._bump_generation(conn)
+        return expires_at
+
+    def lookup(self, token):
+        """Geçerli token için {"user", "role"} döner, aksi halde None"""
+        row = self._connection().execute(
+            "SELECT user, role, expires_at FROM api_tokens WHERE token_hash = ?",
+            (self.digest(token),)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[2] is not None and row[2] <= time.time():
+            return None
+        return {"user": row[0], "role": row[1]}
+
+    def revoke(self, tokens):
+        """Verilen token'ları iptal eder ve silinen kayıt sayısını döner"""
+        conn = self._connection()
+        with conn:
+            cursor = conn.executemany(
+                "DELETE FROM api_tokens WHERE token_hash = ?",
+                ((self.digest(token),) for token in tokens)
+            )
+            if cursor.rowcount:
+                self._bump_generation(conn)
+        return cursor.rowcount
+
+    def revoke_user(self, user):
+        """Kullanıcının tüm token'larını iptal eder"""
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM api_tokens WHERE user = ?", (user,))
+            if cursor.rowcount:
+                self._bump_generation(conn)
+        return cursor.rowcount
+
+    def purge_expired(self, now=None):
+        """Süresi dolmuş token'ları siler"""
+        now = int(time.time()) if now is None else now
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM api_tokens WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,)
+            )
+            if cursor.rowcount:
+                self._bump_generation(conn)
+        return cursor.rowcount
+
+    def purge_if_due(self, now=None):
+        """Son silmeden bu yana PURGE_INTERVAL geçtiyse süresi dolmuş token'ları siler"""
+        now = int(time.time()) if now is None else now
+        if now < self._next_purge:
+            return 0
+        self._next_purge = now + PURGE_INTERVAL
+        return self.purge_expired(now)
+
+    def page_tokens(self, user=None, role=None, after=None, limit=100):
+        """Eklenme sırasıyla bir sayfa token döner: (token'lar, sonraki_anahtar)
+
+        after, bir önceki sayfanın son anahtarıdır; sonraki_anahtar son sayfada None olur.
+        Süresi dolmuş (henüz silinmemiş) token'lar atlanır.
+        """
+        conditions = ["(expires_at IS NULL OR expires_at > ?)"]
+        params = [int(time.time())]
+        if user is not None:
+            conditions.append("user = ?")
+            params.append(user)
+        if role is not None:
+            conditions.append("role = ?")
+            params.append(role)
+        if after is not None:
+            conditions.append("id > ?")
+            params.append(after)
+        rows = self._connection().execute(
+            "SELECT id, token_prefix, user, role, expires_at FROM api_tokens"
+            f" WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?",
+            (*params, limit + 1)
+        ).fetchall()
+        tokens = [
+            {
+                "token_prefix": prefix,
+                "user": token_user,
+                "role": token_role,
+                "expires_at": expires_at
+            }
+            for _, prefix, token_user, token_role, expires_at in rows[:limit]
+        ]
+        next_key = rows[limit - 1][0] if len(rows) > limit else None
+        return tokens, next_key
+
+    def iter_tokens(self, user=None, role=None, after=None):
+        """Tüm token'ları parça parça okuyan generator"""
+        while True:
+            tokens, after = self.page_tokens(user=user, role=role, after=after, limit=ITER_CHUNK_SIZE)
+            yield from tokens
+            if after is None:
+                return
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM api_tokens").fetchone()[0]
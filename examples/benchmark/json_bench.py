@@ -0,0 +1,153 @@
+"""
+JSON Serileştirme Mikro Benchmark'ı
+Endpoint yanıtlarının jsonify maliyetini Flask'ın varsayılan provider'ı ile
+FastJSONProvider (stdlib ve orjson backend'leri) arasında karşılaştırır
+
+Yanıtlar server'ların döndüğü gövdelerle aynı yapıda örnek verilerdir; ölçülen süre
+jsonify çağrısının (serileştirme + Response nesnesi) kendisidir, ağ ve routing dahil değildir.
+
+Kullanım:
+  python json_bench.py
+  python json_bench.py --number 2000 --output results/json.json
+"""
+
+from datetime import datetime, timezone
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.json_provider import FastJSONProvider, orjson
+
+from loadtest import git_commit
+
+ROLES = ("admin", "operator", "user")
+
+
+def _users(count):
+    return [
+        {"username": f"user{i:05d}", "role": ROLES[i % 3], "email": f"user{i:05d}@example.com"}
+        for i in range(count)
+    ]
+
+
+def _events(count):
+    return [
+        {
+            "seq": i,
+            "ts": 1767225600.0 + i * 0.37,
+            "type": "auth.login" if i % 4 else "auth.login_failed",
+            "source": f"user{i % 50:05d}",
+            "data": {"ip": f"10.0.{i % 256}.{i * 7 % 256}"}
+        }
+        for i in range(count)
+    ]
+
+
+# Endpoint -> örnek yanıt gövdesi
+PAYLOADS = {
+    "POST /api/login": {
+        "message": "Giriş başarılı",
+        "access_token": "eyJhbGciOiJIUzI1NiJ9." + "a" * 280 + ".signature",
+        "refresh_token": "eyJhbGciOiJIUzI1NiJ9." + "b" * 240 + ".signature",
+        "user": {"username": "admin", "role": "admin", "email": "admin@example.com"},
+        "token_info": {"access_token_expires_in": "15 minutes", "refresh_token_expires_in": "30 days"}
+    },
+    "GET /api/protected": {
+        "message": "JWT token ile korunan endpoint'e erişildi",
+        "user": "user1",
+        "role": "user",
+        "email": "user1@example.com"
+    },
+    "GET /api/admin/auth-stats": {
+        "rejections": {"missing_header": 120, "invalid_token": 8, "admin_required": 3},
+        "total": 131,
+        "rate_limited": {"login:ip": 4, "login:user": 12}
+    },
+    "GET /api/users?limit=100": {"users": _users(100), "next_cursor": "WyJ1c2VyMDAwOTkiXQ"},
+    "GET /api/list-tokens?limit=1000": {
+        "message": "Mevcut API token'ları",
+        "tokens": [
+            {"token_prefix": f"api_token_{i:06d}", "user": f"user{i % 40}", "role": ROLES[i % 3],
+             "expires_at": None if i % 2 else 1767225600 + i}
+            for i in range(1000)
+        ],
+        "next_cursor": None
+    },
+    "GET /api/admin/events?limit=1000": {"events": _events(1000), "count": 1000},
+}
+
+
+def providers(app):
+    candidates = [("flask-default", DefaultJSONProvider(app)), ("stdlib", FastJSONProvider(app, "stdlib"))]
+    if orjson is not None:
+        candidates.append(("orjson", FastJSONProvider(app, "orjson")))
+    return candidates
+
+
+def measure(candidates, payload, number, repeat):
+    """Provider başına çağrı başına en iyi süre (mikro saniye) ve gövde boyutu
+
+    Provider'lar her turda sırayla ölçülür; makinedeki dalgalanma hepsine eşit dağılır.
+    """
+    best = {name: float("inf") for name, _ in candidates}
+    for _ in range(repeat):
+        for name, provider in candidates:
+            elapsed = timeit.timeit(lambda: provider.response(payload), number=number)
+            best[name] = min(best[name], elapsed / number * 1e6)
+    sizes = {name: len(provider.response(payload).get_data()) for name, provider in candidates}
+    return best, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="jsonify serileştirme maliyeti karşılaştırması")
+    parser.add_argument("--number", type=int, default=100, help="Ölçüm başına çağrı sayısı")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    # Provider'lar uygulamaya zayıf referans tutar; app ölçüm boyunca yaşamalıdır
+    app = Flask("json_bench")
+    candidates = providers(app)
+    names = [name for name, _ in candidates]
+    if orjson is None:
+        print("ℹ️  orjson kurulu değil; yalnızca stdlib karşılaştırılıyor (pip install orjson)")
+
+    print(f"\n{'Endpoint':<34}" + "".join(f"{name:>16}" for name in names) + f"{'hızlanma':>11}")
+    results = []
+    with app.app_context():
+        for endpoint, payload in PAYLOADS.items():
+            costs, sizes = measure(candidates, payload, args.number, args.repeat)
+            row = {
+                "endpoint": endpoint,
+                "us_per_call": {name: round(cost, 2) for name, cost in costs.items()},
+                "bytes": sizes
+            }
+            baseline = row["us_per_call"]["flask-default"]
+            best = min(row["us_per_call"].values())
+            row["speedup"] = round(baseline / best, 2)
+            results.append(row)
+            print(f"{endpoint:<34}" + "".join(f"{row['us_per_call'][name]:>13.1f} µs" for name in names)
+                  + f"{row['speedup']:>10.1f}x")
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "providers": names,
+                "results": results
+            }, f, indent=2)
+        print(f"\n💾 Sonuçlar kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
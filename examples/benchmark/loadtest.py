@@ -0,0 +1,267 @@
+"""
+Authentication Server Yük Testi
+client.py senaryolarını eşzamanlı olarak çalıştırıp throughput ve gecikme ölçer
+
+Kullanım:
+  python loadtest.py --scenario protected --concurrency 32 --duration 30
+  python loadtest.py --scenario all --output results/$(git rev-parse --short HEAD).json
+  python loadtest.py --compare results/eski.json results/yeni.json --threshold 10
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+JWT_BASE_URL = "http://localhost:5002/api"
+BEARER_BASE_URL = "http://localhost:5001/api"
+
+
+class Scenario:
+    """Bir yük testi senaryosu
+
+    setup(session) her worker için bir kez çalışır ve bir durum nesnesi döner; hata
+    verirse o worker bir bağlantı hatası sayılıp durur.
+    request(session, state) ölçülen tek isteği yapar ve Response döner.
+    """
+
+    def __init__(self, name, description, request, setup=None):
+        self.name = name
+        self.description = description
+        self.request = request
+        self.setup = setup or (lambda session, args: None)
+
+
+def _login(session, args):
+    response = session.post(
+        f"{args.jwt_url}/login",
+        json={"username": args.username, "password": args.password}
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def login_request(session, state, args):
+    return session.post(
+        f"{args.jwt_url}/login",
+        json={"username": args.username, "password": args.password}
+    )
+
+
+def protected_request(session, state, args):
+    return session.get(f"{args.jwt_url}/protected", headers=_bearer(state["access_token"]))
+
+
+def refresh_request(session, state, args):
+    return session.post(f"{args.jwt_url}/refresh", headers=_bearer(state["refresh_token"]))
+
+
+def logout_request(session, state, args):
+    # Her logout yeni bir token'ı iptal eder; login süresi ölçüme dahil edilmez
+    token = _login(session, args)["access_token"]
+    start = time.perf_counter()
+    response = session.post(f"{args.jwt_url}/logout", headers=_bearer(token))
+    response.elapsed_override = time.perf_counter() - start
+    return response
+
+
+def generate_token_request(session, state, args):
+    return session.post(
+        f"{args.bearer_url}/generate-token",
+        json={"user": "loadtest", "role": "user"}
+    )
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in [
+        Scenario("login", "POST /api/login (JWT)", login_request),
+        Scenario("protected", "GET /api/protected (JWT)", protected_request, setup=_login),
+        Scenario("refresh", "POST /api/refresh (JWT)", refresh_request, setup=_login),
+        Scenario("logout", "POST /api/logout (JWT, her istekte yeni login)", logout_request),
+        Scenario("generate-token", "POST /api/generate-token (Bearer)", generate_token_request),
+    ]
+}
+
+
+def percentile(sorted_values, fraction):
+    """Sıralı listede nearest-rank yüzdelik değeri"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(scenario, args):
+    """Senaryoyu args.concurrency worker ile args.duration saniye çalıştırır"""
+    latencies = []
+    status_counts = {}
+    errors = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.warmup + args.duration
+    measure_from = time.perf_counter() + args.warmup
+
+    def worker():
+        session = requests.Session()
+        try:
+            state = scenario.setup(session, args)
+        except requests.RequestException:
+            # Örn. login rate limit'e takıldı (429); worker ölçüm yapamaz, diğerleri devam eder
+            with lock:
+                errors.append(1)
+            return
+        local_latencies = []
+        local_status = {}
+        local_errors = 0
+        while True:
+            start = time.perf_counter()
+            if start >= deadline:
+                break
+            try:
+                response = scenario.request(session, state, args)
+            except requests.RequestException:
+                local_errors += 1
+                continue
+            elapsed = getattr(response, "elapsed_override", time.perf_counter() - start)
+            if start < measure_from:
+                continue
+            local_latencies.append(elapsed)
+            local_status[response.status_code] = local_status.get(response.status_code, 0) + 1
+        with lock:
+            latencies.extend(local_latencies)
+            for status, count in local_status.items():
+                status_counts[status] = status_counts.get(status, 0) + count
+            errors.append(local_errors)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(worker) for _ in range(args.concurrency)]
+        for future in futures:
+            future.result()
+
+    latencies.sort()
+    total = len(latencies)
+    failed = sum(count for status, count in status_counts.items() if status >= 400)
+    return {
+        "scenario": scenario.name,
+        "description": scenario.description,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "requests": total,
+        "failed_responses": failed,
+        "connection_errors": sum(errors),
+        "status_counts": {str(status): count for status, count in sorted(status_counts.items())},
+        "throughput_rps": round(total / args.duration, 2),
+        "latency_ms": {
+            "mean": round(sum(latencies) / total * 1000, 3) if total else 0.0,
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if total else 0.0,
+        }
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(result):
+    latency = result["latency_ms"]
+    print(f"  {result['scenario']:<15} {result['throughput_rps']:>10.1f} req/s  "
+          f"p50={latency['p50']:.2f}ms  p95={latency['p95']:.2f}ms  p99={latency['p99']:.2f}ms  "
+          f"hata={result['failed_responses'] + result['connection_errors']}")
+
+
+def compare(old_path, new_path, threshold):
+    """İki sonuç dosyasını karşılaştırır; gerileme varsa 1 döner"""
+    with open(old_path) as f:
+        old = {r["scenario"]: r for r in json.load(f)["results"]}
+    with open(new_path) as f:
+        new = {r["scenario"]: r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"\n📊 Karşılaştırma (eşik %{threshold}): {old_path} → {new_path}")
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name], new[name]
+        checks = [
+            ("throughput", before["throughput_rps"], after["throughput_rps"], False),
+            ("p50", before["latency_ms"]["p50"], after["latency_ms"]["p50"], True),
+            ("p95", before["latency_ms"]["p95"], after["latency_ms"]["p95"], True),
+            ("p99", before["latency_ms"]["p99"], after["latency_ms"]["p99"], True),
+        ]
+        for metric, a, b, lower_is_better in checks:
+            change = (b - a) / a * 100 if a else 0.0
+            worse = change > threshold if lower_is_better else change < -threshold
+            regressions += worse
+            marker = "❌" if worse else "✅"
+            print(f"  {marker} {name:<15} {metric:<10} {a:>10.2f} → {b:>10.2f} ({change:+.1f}%)")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Authentication server yük testi")
+    parser.add_argument("--scenario", default="protected",
+                        help=f"Senaryo adı, virgülle ayrılmış liste veya 'all' ({', '.join(SCENARIOS)})")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Ölçüm süresi (saniye)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Ölçülmeyen ısınma süresi (saniye)")
+    parser.add_argument("--jwt-url", default=JWT_BASE_URL)
+    parser.add_argument("--bearer-url", default=BEARER_BASE_URL)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", nargs=2, metavar=("ESKI", "YENI"),
+                        help="İki sonuç dosyasını karşılaştır")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Gerileme sayılacak yüzde değişim")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare, args.threshold))
+
+    names = list(SCENARIOS) if args.scenario == "all" else args.scenario.split(",")
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Bilinmeyen senaryo: {', '.join(unknown)}")
+
+    print(f"\n🏁 Yük testi: {args.concurrency} eşzamanlı worker, {args.duration:g} sn")
+    results = []
+    for name in names:
+        result = run_scenario(SCENARIOS[name], args)
+        print_result(result)
+        results.append(result)
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "jwt_url": args.jwt_url,
+                "bearer_url": args.bearer_url,
+                "results": results
+            }, f, indent=2)
+        print(f"\n💾 Sonuçlar kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+"""
+Sensör Simülatörü ve Soak Testi
+Binlerce yangın sensörünü modelleyip /api/yangin_uyarisi yolunu saatlerce yük altında tutar
+
+Hedef, dashboard'un backend'idir (app.py, varsayılan http://localhost:5000/api; bu depoda
+yer almaz). examples/ altındaki Bearer ve JWT örnek server'ları /api/yangin_uyarisi sunmaz.
+
+  • Her sensör üstel dağılımlı rastgele aralıklarla tetiklenir (ortalama --mean-interval sn)
+  • Sensörler process havuzuna bölünür; her process sensörlerini kendi thread'leriyle sürer
+  • Her process bir kez login olur ve token'ı tüm sensörleri için kullanır; token süresi
+    dolarsa (401) process yine tek bir login ile yeniler. Böylece kullanıcı başına login
+    rate limit'i (varsayılan 5/dakika) yalnızca process sayısı kadar login görür
+  • Her uyarının kaynak değeri tekildir. Bağlantı hatası, 429 ve 5xx durumunda aynı kaynak
+    ile yeniden denenir
+  • Her rapor aralığında gecikme yüzdelikleri, planlanan ana göre gecikme (lag), server
+    process'inin bellek kullanımı (RSS), kaybolan ve tekrarlanmış olabilecek protokol
+    çalıştırmaları yazılır; sonunda ilk ve son aralık karşılaştırılır
+
+Kullanım:
+  python sensor_sim.py --sensors 5000 --processes 4 --duration 4h --server-pid 12345
+  python sensor_sim.py --sensors 200 --mean-interval 5 --duration 10m --output results/soak.json
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+
+import requests
+
+from loadtest import git_commit, percentile
+
+FIRE_BASE_URL = "http://localhost:5000/api"
+
+# Thread başına bekleyebilecek en fazla tetiklenme; aşılırsa simülatör yetişemiyordur
+MAX_BACKLOG_PER_THREAD = 50
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(text):
+    """"90", "90s", "30m", "4h" -> saniye"""
+    text = text.strip().lower()
+    unit = DURATION_UNITS.get(text[-1:])
+    try:
+        return float(text[:-1]) * unit if unit else float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz süre: {text!r}")
+
+
+def server_rss(pid):
+    """Process'in ve alt process'lerinin (örn. gunicorn worker'ları) toplam RSS'i (byte)"""
+    if pid is None:
+        return None
+    total = 0
+    pending = [pid]
+    try:
+        while pending:
+            current = pending.pop()
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+    except (OSError, ValueError):
+        return total or None
+    return total
+
+
+class _Window:
+    """Bir rapor aralığındaki ölçümler"""
+
+    FIELDS = ("sent", "accepted", "completed", "dropped", "possible_duplicates",
+              "duplicates", "retries", "relogins", "skipped")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.latencies = []
+        self.protocol_latencies = []
+        self.lags = []
+        self.counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, **counts):
+        with self.lock:
+            for name, value in counts.items():
+                self.counts[name] += value
+
+    def record(self, latency=None, protocol_latency=None, lag=None):
+        with self.lock:
+            if latency is not None:
+                self.latencies.append(latency)
+            if protocol_latency is not None:
+                self.protocol_latencies.append(protocol_latency)
+            if lag is not None:
+                self.lags.append(lag)
+
+    def drain(self):
+        with self.lock:
+            data = {
+                "latencies": self.latencies,
+                "protocol_latencies": self.protocol_latencies,
+                "lags": self.lags,
+                "counts": self.counts
+            }
+            self.reset()
+        return data
+
+
+class SensorWorker:
+    """Bir process'e düşen sensörleri süren simülatör"""
+
+    def __init__(self, sensor_ids, args, run_id):
+        self.sensor_ids = sensor_ids
+        self.args = args
+        self.run_id = run_id
+        self.window = _Window()
+        self.token = None  # process'teki tüm sensörlerin ortak access token'ı
+        self._login_lock = threading.Lock()
+        self.sequence = 0
+        self.backlog = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _token(self, stale=None):
+        """Ortak token'ı döner; yoksa veya stale ile aynıysa tek bir login ile yeniler"""
+        token = self.token
+        if token is not None and token != stale:
+            return token
+        with self._login_lock:
+            # Kilidi beklerken başka bir thread token'ı yenilemiş olabilir
+            if self.token is not None and self.token != stale:
+                return self.token
+            response = self._session().post(
+                f"{self.args.url}/login",
+                json={"username": self.args.username, "password": self.args.password},
+                timeout=self.args.timeout
+            )
+            response.raise_for_status()
+            self.token = response.json()["access_token"]
+            if stale is not None:
+                self.window.add(relogins=1)
+            return self.token
+
+    def trip(self, sensor_id, due):
+        """Sensörün tek bir tetiklenmesi: uyarıyı gönderir, gerekirse yeniden dener"""
+        started = time.time()
+        with self._lock:
+            self.sequence += 1
+            kaynak = f"sim-{self.run_id}-{sensor_id}-{self.sequence}"
+        self.window.record(lag=started - due)
+        try:
+            self._trip(kaynak, started)
+        finally:
+            with self._lock:
+                self.backlog -= 1
+
+    def _trip(self, kaynak, started):
+        session = self._session()
+        uncertain = False  # server'a ulaşmış olabilecek başarısız bir deneme var mı
+        response = None
+        stale = None
+        for attempt in range(self.args.retries + 1):
+            if attempt:
+                self.window.add(retries=1)
+                time.sleep(min(2 ** attempt * 0.1, 2.0))
+            try:
+                token = self._token(stale)
+            except (requests.RequestException, KeyError, ValueError):
+                continue
+            try:
+                sent = time.perf_counter()
+                response = session.post(
+                    f"{self.args.url}/yangin_uyarisi",
+                    json={"kaynak": kaynak},
+                    headers={"Authorization": f"Bearer {token}"},
+                    timeout=self.args.timeout
+                )
+                self.window.record(latency=time.perf_counter() - sent)
+                self.window.add(sent=1)
+            except requests.RequestException:
+                uncertain = True
+                response = None
+                continue
+
+            if response.status_code == 401:
+                stale = token
+                continue
+            if response.status_code == 429 or response.status_code >= 500:
+                uncertain = uncertain or response.status_code >= 500
+                continue
+            break
+
+        if response is None or not response.ok:
+            self.window.add(dropped=1)
+            return
+
+        self.window.add(accepted=1, possible_duplicates=int(uncertain))
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if data.get("duplicate") or data.get("durum") == "duplicate":
+            self.window.add(duplicates=1)
+        self.window.add(completed=1)
+        self.window.record(protocol_latency=time.time() - started)
+
+    def run(self, results, index, deadline, stop):
+        rng = random.Random()
+        rate = 1.0 / self.args.mean_interval
+        now = time.time()
+        schedule = [(now + rng.expovariate(rate), sensor_id) for sensor_id in self.sensor_ids]
+        heapq.heapify(schedule)
+        max_backlog = self.args.threads * MAX_BACKLOG_PER_THREAD
+        window_index = 0
+        next_report = now + self.args.report_interval
+
+        with ThreadPoolExecutor(max_workers=self.args.threads) as pool:
+            while not stop.is_set():
+                now = time.time()
+                if now >= deadline:
+                    break
+                if now >= next_report:
+                    results.put((index, window_index, self.window.drain()))
+                    window_index += 1
+                    next_report += self.args.report_interval
+                due, sensor_id = schedule[0]
+                if due > now:
+                    stop.wait(min(due, next_report, deadline) - now)
+                    continue
+                heapq.heapreplace(schedule, (due + rng.expovariate(rate), sensor_id))
+                with self._lock:
+                    if self.backlog >= max_backlog:
+                        self.window.add(skipped=1)
+                        continue
+                    self.backlog += 1
+                pool.submit(self.trip, sensor_id, due)
+            # Süre dolduğunda henüz başlamamış tetiklenmeler iptal edilir, başlamış olanlar beklenir
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        self.window.add(skipped=self.backlog)
+        # Son aralık, devam eden tetiklenmeler bittikten sonra gönderilir
+        results.put((index, window_index, self.window.drain()))
+        results.put((index, None, None))
+
+
+def _sensor_process(index, sensor_ids, args, run_id, results, deadline, stop):
+    try:
+        SensorWorker(sensor_ids, args, run_id).run(results, index, deadline, stop)
+    except KeyboardInterrupt:
+        results.put((index, None, None))
+
+
+def summarize_window(elapsed, reports, rss):
+    latencies = sorted(value for report in reports for value in report["latencies"])
+    protocol = sorted(value for report in reports for value in report["protocol_latencies"])
+    lags = sorted(value for report in reports for value in report["lags"])
+    counts = dict.fromkeys(_Window.FIELDS, 0)
+    for report in reports:
+        for name, value in report["counts"].items():
+            counts[name] += value
+    return dict(
+        counts,
+        elapsed_s=round(elapsed, 1),
+        latency_ms={
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+        },
+        protocol_ms={
+            "p50": round(percentile(protocol, 0.50) * 1000, 3),
+            "p95": round(percentile(protocol, 0.95) * 1000, 3),
+        },
+        lag_ms_p95=round(percentile(lags, 0.95) * 1000, 3),
+        server_rss_mb=round(rss / 1024 / 1024, 2) if rss is not None else None
+    )
+
+
+def print_window(window):
+    latency = window["latency_ms"]
+    elapsed = int(window["elapsed_s"])
+    rss = f"{window['server_rss_mb']:.1f}MB" if window["server_rss_mb"] is not None else "-"
+    print(f"  ⏱️  {elapsed // 3600:02d}:{elapsed % 3600 // 60:02d}:{elapsed % 60:02d}  "
+          f"{window['accepted']:>7} uyarı  p50={latency['p50']:.1f}ms  p95={latency['p95']:.1f}ms  "
+          f"p99={latency['p99']:.1f}ms  lag95={window['lag_ms_p95']:.0f}ms  "
+          f"kayıp={window['dropped']}  olası-tekrar={window['possible_duplicates']}  RSS={rss}")
+
+
+def drift_report(windows):
+    """İlk ve son tam aralık arasındaki gecikme ve bellek değişimi"""
+    active = [window for window in windows if window["accepted"]]
+    if len(active) < 2:
+        return None
+    first, last = active[0], active[-1]
+
+    def change(a, b):
+        return round((b - a) / a * 100, 1) if a else None
+
+    report = {
+        "p50_change_pct": change(first["latency_ms"]["p50"], last["latency_ms"]["p50"]),
+        "p95_change_pct": change(first["latency_ms"]["p95"], last["latency_ms"]["p95"]),
+        "p99_change_pct": change(first["latency_ms"]["p99"], last["latency_ms"]["p99"]),
+    }
+    if first["server_rss_mb"] is not None and last["server_rss_mb"] is not None:
+        growth = last["server_rss_mb"] - first["server_rss_mb"]
+        hours = (last["elapsed_s"] - first["elapsed_s"]) / 3600
+        report["rss_growth_mb"] = round(growth, 2)
+        report["rss_growth_mb_per_hour"] = round(growth / hours, 2) if hours else None
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yangın sensörü simülatörü ve soak testi")
+    parser.add_argument("--url", default=FIRE_BASE_URL, help="Yangın API adresi")
+    parser.add_argument("--sensors", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=16, help="Process başına thread sayısı")
+    parser.add_argument("--mean-interval", type=float, default=60.0,
+                        help="Bir sensörün iki tetiklenmesi arasındaki ortalama süre (saniye)")
+    parser.add_argument("--duration", type=parse_duration, default=parse_duration("10m"),
+                        help="Test süresi (örn. 600, 30m, 4h)")
+    parser.add_argument("--report-interval", type=parse_duration, default=parse_duration("60s"))
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=10.0, help="İstek zaman aşımı (saniye)")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--server-pid", type=int, help="Bellek kullanımı izlenecek server process'i")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    if args.sensors < 1 or args.processes < 1 or args.mean_interval <= 0:
+        parser.error("--sensors, --processes ve --mean-interval pozitif olmalı")
+    processes = min(args.processes, args.sensors)
+    run_id = secrets.token_hex(3)
+
+    print(f"\n🔥 Sensör simülasyonu: {args.sensors} sensör, {processes} process × {args.threads} thread, "
+          f"ortalama {args.sensors / args.mean_interval:.1f} uyarı/sn, {args.duration:g} sn (run {run_id})")
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    stop = context.Event()
+    started = time.time()
+    deadline = started + args.duration
+    workers = [
+        context.Process(
+            target=_sensor_process,
+            args=(index, list(range(index, args.sensors, processes)), args, run_id,
+                  results, deadline, stop),
+            daemon=True
+        )
+        for index in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    pending = {}  # aralık no -> process raporları
+    windows = []
+    finished = 0
+    try:
+        while finished < processes:
+            index, window_index, report = results.get()
+            if window_index is None:
+                finished += 1
+                continue
+            pending.setdefault(window_index, []).append(report)
+            if len(pending[window_index]) == processes:
+                window = summarize_window(time.time() - started, pending.pop(window_index),
+                                          server_rss(args.server_pid))
+                windows.append(window)
+                print_window(window)
+    except KeyboardInterrupt:
+        print("\n⏹️  Durduruluyor...")
+        stop.set()
+    for worker in workers:
+        worker.join(timeout=args.timeout * (args.retries + 1))
+    # Bazı process'lerin raporlayamadığı aralıklar eldeki raporlarla özetlenir
+    for window_index in sorted(pending):
+        window = summarize_window(time.time() - started, pending[window_index],
+                                  server_rss(args.server_pid))
+        windows.append(window)
+        print_window(window)
+
+    totals = {name: sum(window[name] for window in windows) for name in _Window.FIELDS}
+    drift = drift_report(windows)
+    print(f"\n📊 Toplam: {totals['accepted']} uyarı kabul edildi, {totals['completed']} protokol tamamlandı, "
+          f"{totals['dropped']} kayıp, {totals['possible_duplicates']} olası tekrar, "
+          f"{totals['duplicates']} tekrar, {totals['skipped']} atlanan tetiklenme")
+    if drift:
+        print(f"📈 Gecikme değişimi (ilk → son aralık): p50 {drift['p50_change_pct']}%  "
+              f"p95 {drift['p95_change_pct']}%  p99 {drift['p99_change_pct']}%")
+        if "rss_growth_mb" in drift:
+            print(f"🧠 Server bellek artışı: {drift['rss_growth_mb']} MB "
+                  f"({drift['rss_growth_mb_per_hour']} MB/saat)")
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "run_id": run_id,
+                "url": args.url,
+                "sensors": args.sensors,
+                "processes": processes,
+                "mean_interval_s": args.mean_interval,
+                "totals": totals,
+                "drift": drift,
+                "windows": windows
+            }, f, indent=2)
+        print(f"\n💾 Sonuçlar kaydedildi: {args.output}")
+
+    sys.exit(1 if totals["dropped"] or totals["duplicates"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+Ortak Modüller
+Bearer token ve JWT token örnek server'larının paylaştığı yardımcı katmanlar
+"""
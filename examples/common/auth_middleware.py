@@ -0,0 +1,136 @@
+"""
+Authentication Middleware
+Flask routing'den önce çalışan, Authorization header'ını tek geçişte ayrıştıran WSGI katmanı
+
+  • Korunan path'lerde header eksik/bozuksa istek Flask'a hiç ulaşmadan reddedilir
+  • Hata yanıtları açılışta bir kez JSON'a çevrilir ve byte olarak saklanır
+  • Reddedilen istekler sebebe göre sayılır (stats())
+"""
+
+from collections import Counter
+import json
+import threading
+
+from flask import Response
+
+# Doğrulanan token'ın sahibi WSGI environ'da bu anahtarla taşınır
+PRINCIPAL_KEY = "auth.principal"
+
+BEARER_SCHEME = "bearer"
+
+# Sebep -> (HTTP status, yanıt gövdesi)
+DEFAULT_REJECTIONS = {
+    "missing_header": (401, {"error": "Authorization header eksik"}),
+    "malformed_header": (401, {"error": "Geçersiz Authorization header formatı"}),
+    "invalid_scheme": (401, {"error": "Geçersiz authentication scheme"}),
+    "invalid_token": (401, {"error": "Geçersiz API token"}),
+    "admin_required": (403, {"error": "Bu endpoint için admin yetkisi gerekli"}),
+}
+
+_STATUS_LINES = {401: "401 UNAUTHORIZED", 403: "403 FORBIDDEN"}
+
+
+def parse_bearer(header):
+    """'Bearer <token>' header'ını ayrıştırır, (token, hata sebebi) döner"""
+    if not header:
+        return None, "missing_header"
+    space = header.find(" ")
+    if space <= 0 or header.find(" ", space + 1) != -1 or space == len(header) - 1:
+        return None, "malformed_header"
+    if space != len(BEARER_SCHEME) or header[:space].lower() != BEARER_SCHEME:
+        return None, "invalid_scheme"
+    return header[space + 1:], None
+
+
+class _Rejection:
+    """Önceden serileştirilmiş hata yanıtı"""
+
+    __slots__ = ("status", "status_line", "body", "headers")
+
+    def __init__(self, status, payload):
+        self.status = status
+        self.status_line = _STATUS_LINES.get(status, str(status))
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()
+        self.headers = [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(self.body))),
+        ]
+        if status == 401:
+            self.headers.append(("WWW-Authenticate", "Bearer"))
+
+
+class AuthMiddleware:
+    """prefix altındaki (public_paths hariç) tüm path'leri koruyan WSGI middleware
+
+    authenticate(token) verilirse token da burada doğrulanır ve dönen değer
+    environ[PRINCIPAL_KEY] olarak view'lara taşınır; None dönerse istek
+    "invalid_token" sebebiyle reddedilir. Verilmezse yalnızca header formatı
+    kontrol edilir (örn. JWT doğrulaması flask_jwt_extended'e bırakılır).
+    """
+
+    def __init__(self, app, prefix="/api/", public_paths=(), authenticate=None,
+                 rejections=None):
+        self.app = app
+        self.prefix = prefix
+        self.public_paths = frozenset(public_paths)
+        self.authenticate = authenticate
+        self._rejections = {
+            reason: _Rejection(status, payload)
+            for reason, (status, payload) in dict(DEFAULT_REJECTIONS, **(rejections or {})).items()
+        }
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def install(cls, flask_app, **kwargs):
+        """Middleware'i flask_app.wsgi_app'in önüne yerleştirir"""
+        middleware = cls(flask_app.wsgi_app, **kwargs)
+        flask_app.wsgi_app = middleware
+        return middleware
+
+    def is_protected(self, path):
+        return path.startswith(self.prefix) and path not in self.public_paths
+
+    def authenticate_header(self, header):
+        """Header'ı ayrıştırıp doğrular, (principal, hata sebebi) döner"""
+        token, reason = parse_bearer(header)
+        if reason is not None:
+            return None, reason
+        if self.authenticate is None:
+            return token, None
+        principal = self.authenticate(token)
+        if principal is None:
+            return None, "invalid_token"
+        return principal, None
+
+    def __call__(self, environ, start_response):
+        if not self.is_protected(environ.get("PATH_INFO", "")):
+            return self.app(environ, start_response)
+
+        principal, reason = self.authenticate_header(environ.get("HTTP_AUTHORIZATION"))
+        if reason is not None:
+            rejection = self._reject(reason)
+            start_response(rejection.status_line, list(rejection.headers))
+            return [rejection.body]
+
+        environ[PRINCIPAL_KEY] = principal
+        return self.app(environ, start_response)
+
+    def _reject(self, reason):
+        with self._lock:
+            self._counts[reason] += 1
+        return self._rejections[reason]
+
+    def response(self, reason):
+        """View içinden dönülecek önceden serileştirilmiş hata yanıtı"""
+        rejection = self._reject(reason)
+        return Response(rejection.body, status=rejection.status, headers=rejection.headers)
+
+    def stats(self):
+        """Sebebe göre reddedilen istek sayıları"""
+        with self._lock:
+            counts = dict(self._counts)
+        return {
+            "rejections": counts,
+            "total": sum(counts.values())
+        }
@@ -0,0 +1,45 @@
+"""
+Toplu Kayıt Alımı
+Tek istekte çok sayıda kayıt kabul eden endpoint'ler için gövde okuyucu
+
+  • Gövde JSON dizisi veya NDJSON (application/x-ndjson) olabilir; NDJSON satır satır okunur
+  • Kayıtlar generator olarak döner; çağıran taraf hepsini belleğe almadan işleyebilir
+"""
+
+import json
+
+from flask import request
+
+from .pagination import NDJSON_MIMETYPE
+
+MAX_BATCH_ITEMS = 1000
+
+
+class BatchError(ValueError):
+    """Gövde okunamadı veya kayıt sayısı sınırı aşıldı"""
+
+
+def iter_batch(max_items=MAX_BATCH_ITEMS):
+    """İstek gövdesindeki kayıtları tek tek döner (max_items=None: sınırsız)"""
+    if request.mimetype == NDJSON_MIMETYPE:
+        items = (
+            _decode_line(number, line)
+            for number, line in enumerate(request.stream, 1)
+            if line.strip()
+        )
+    else:
+        items = request.get_json(silent=True)
+        if not isinstance(items, list):
+            raise BatchError("Kayıt listesi (JSON dizisi veya NDJSON) gerekli")
+
+    for count, item in enumerate(items, 1):
+        if max_items is not None and count > max_items:
+            raise BatchError(f"Tek istekte en fazla {max_items} kayıt gönderilebilir")
+        yield item
+
+
+def _decode_line(number, line):
+    try:
+        return json.loads(line)
+    except ValueError:
+        raise BatchError(f"{number}. satır geçerli JSON değil")
@@ -0,0 +1,155 @@
+"""
+Yanıt Sıkıştırma (gzip / brotli)
+Büyük JSON yanıtlarını istemcinin Accept-Encoding header'ına göre sıkıştırır
+
+  • brotli kuruluysa "br", her zaman "gzip" sunulur; istemcinin q değerleri eşitse br seçilir
+  • min_size byte'tan küçük gövdeler, akış (stream) yanıtları ve zaten kodlanmış yanıtlar
+    olduğu gibi gönderilir
+  • Güçlü ETag'li (örn. ResponseCache'ten gelen) yanıtların sıkıştırılmış hali ETag + kodlama
+    anahtarıyla saklanır; aynı gövde her istekte yeniden sıkıştırılmaz
+  • Sıkıştırılan yanıtın ETag'i zayıf (W/"...") yapılır; byte'lar farklı olduğu halde
+    If-None-Match ile yeniden doğrulama çalışmaya devam eder
+
+Sıkıştırma Flask içinde yapılır; önde sıkıştırma yapan bir proxy varsa Content-Encoding
+header'ı olan yanıtlara proxy tekrar dokunmaz.
+"""
+
+from collections import OrderedDict
+import gzip
+import threading
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bu boyuttan küçük gövdelerde sıkıştırma kazancı header maliyetini karşılamaz
+DEFAULT_MIN_SIZE = 1024
+
+# gzip seviyesi (1-9) ve brotli kalitesi (0-11); dinamik yanıtlar için hız/oran dengesi
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_BROTLI_QUALITY = 5
+
+# Sıkıştırılmış gövde önbelleğinin toplam boyut sınırı (byte)
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+COMPRESSIBLE_TYPES = frozenset((
+    "application/json",
+    "application/x-ndjson",
+    "text/plain",
+    "text/html",
+    "text/css",
+    "application/javascript",
+))
+
+
+class Compressor:
+    """Accept-Encoding'e göre gzip / brotli sıkıştırma ve sıkıştırılmış gövde önbelleği"""
+
+    def __init__(self, min_size=DEFAULT_MIN_SIZE, gzip_level=DEFAULT_GZIP_LEVEL,
+                 brotli_quality=DEFAULT_BROTLI_QUALITY, cache_bytes=DEFAULT_CACHE_BYTES,
+                 timer=None):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_bytes = cache_bytes
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+        self._cache = OrderedDict()  # (etag, kodlama) -> sıkıştırılmış gövde
+        self._cache_size = 0
+        self._lock = threading.Lock()
+        self.compressed = {encoding: 0 for encoding in self.encodings}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if timer is not None:
+            self.compress = timer(self.compress)
+
+    def install(self, flask_app):
+        """Yanıtları after_request'te sıkıştırır"""
+        flask_app.after_request(self.process_response)
+        return self
+
+    def negotiate(self, accept_encodings):
+        """Accept-Encoding'e göre kullanılacak kodlama; uygun kodlama yoksa None"""
+        best, best_quality = None, 0
+        for encoding in self.encodings:
+            quality = accept_encodings.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, body, encoding):
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def process_response(self, response):
+        if response.mimetype not in COMPRESSIBLE_TYPES:
+            return response
+        response.vary.add("Accept-Encoding")
+
+        if (response.status_code < 200 or response.status_code in (204, 206)
+                or response.is_streamed or response.direct_passthrough
+                or "Content-Encoding" in response.headers):
+            return response
+        encoding = self.negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+        body = response.get_data()
+        if len(body) < self.min_size:
+            return response
+
+        etag, weak = response.get_etag()
+        compressed = self._cached_body(etag, weak, body, encoding)
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        if etag is not None:
+            response.set_etag(etag, weak=True)
+        with self._lock:
+            self.compressed[encoding] += 1
+            self.bytes_in += len(body)
+            self.bytes_out += len(compressed)
+        return response
+
+    def _cached_body(self, etag, weak, body, encoding):
+        # Yalnızca güçlü ETag aynı gövdeyi (byte byte) garanti eder
+        if etag is None or weak:
+            return self.compress(body, encoding)
+
+        key = (etag, encoding)
+        with self._lock:
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return compressed
+            self.cache_misses += 1
+
+        compressed = self.compress(body, encoding)
+        if len(compressed) <= self.cache_bytes:
+            with self._lock:
+                if key not in self._cache:
+                    self._cache[key] = compressed
+                    self._cache_size += len(compressed)
+                while self._cache_size > self.cache_bytes:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cache_size -= len(evicted)
+        return compressed
+
+    def stats(self):
+        with self._lock:
+            return {
+                "encodings": list(self.encodings),
+                "min_size": self.min_size,
+                "compressed": dict(self.compressed),
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "ratio": round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None,
+                "cache_entries": len(self._cache),
+                "cache_bytes": self._cache_size,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses
+            }
@@ -0,0 +1,481 @@
+"""
+Olay Günlüğü (Event Journal)
+Alarm, sıfırlama ve authentication olaylarını diske yazan, yalnızca eklemeli günlük
+
+  • Olaylar segment dosyalarına (events-<ilk seq>.log) JSON satırları olarak eklenir;
+    segment dolduğunda yenisine geçilir, eski segmentler hiç değiştirilmez
+  • append() olayı kuyruğa koyar; yazıcı thread biriken olayları tek write + fsync ile
+    yazar (group commit). wait=True verilirse olay diske yazılana kadar beklenir
+  • Her olaya artan bir seq ve yazıldığı an (ts, dosya boyunca azalmayan) verilir
+  • Segment başına seyrek zaman indeksi ve kaynak (source) indeksi tutulur; kapanan
+    segmentlerin indeksi yanındaki .idx dosyasına yazılır
+  • query() zaman aralığı ve kaynağa göre yalnızca ilgili segmentleri ve satırları okur;
+    varsayılan olarak en yeni olaydan geriye doğru döner (order="asc" ile eskiden yeniye)
+  • Saklama sınırı segment bazındadır: yeni segmente geçilirken max_segments'ı aşan ve
+    retention süresinden eski segmentler dosyaları ve indeksleriyle birlikte silinir
+  • Birden fazla worker process aynı klasöre yazabilir: yazma sırasında dosya kilidi
+    alınır, diğer process'lerin eklediği satırlar indekse sonradan eklenir
+"""
+
+from bisect import bisect_left, bisect_right
+import fcntl
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from flask import request
+
+logger = logging.getLogger(__name__)
+
+# Bir segment bu boyutu aştığında yeni segmente geçilir (byte)
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+
+# Seyrek zaman indeksinde kaç olayda bir konum saklanacağı
+SPARSE_INDEX_INTERVAL = 128
+
+# Tek group commit'te yazılacak en fazla olay
+MAX_BATCH_EVENTS = 1000
+
+# Diskte (ve bellekte indeksi) tutulacak en fazla segment sayısı
+DEFAULT_MAX_SEGMENTS = 64
+
+DEFAULT_QUERY_LIMIT = 1000
+MAX_QUERY_LIMIT = 10_000
+QUERY_ORDERS = ("desc", "asc")
+
+_SEGMENT_PREFIX = "events-"
+_SEGMENT_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+
+
+class _Segment:
+    """Bir segment dosyasının bellek içi indeksi"""
+
+    def __init__(self, path, first_seq):
+        self.path = path
+        self.first_seq = first_seq
+        self.last_seq = first_seq - 1
+        self.min_ts = None
+        self.max_ts = None
+        self.size = 0          # İndekslenmiş byte sayısı
+        self.closed = False
+        self.sparse_ts = []    # Seyrek zaman indeksi: ts ve satırın konumu
+        self.sparse_offsets = []
+        self.sources = {}      # source -> ([ts, ...], [konum, ...])
+
+    def add(self, event, offset, size):
+        ts = event["ts"]
+        if self.min_ts is None:
+            self.min_ts = ts
+        if (self.last_seq - self.first_seq + 1) % SPARSE_INDEX_INTERVAL == 0:
+            self.sparse_ts.append(ts)
+            self.sparse_offsets.append(offset)
+        self.last_seq = event["seq"]
+        self.max_ts = ts
+        self.size = offset + size
+        source = event.get("source")
+        if source is not None:
+            timestamps, offsets = self.sources.setdefault(source, ([], []))
+            timestamps.append(ts)
+            offsets.append(offset)
+
+    def to_index(self):
+        return {
+            "first_seq": self.first_seq,
+            "last_seq": self.last_seq,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "size": self.size,
+            "sparse": [self.sparse_ts, self.sparse_offsets],
+            "sources": self.sources
+        }
+
+    @classmethod
+    def from_index(cls, path, data):
+        segment = cls(path, data["first_seq"])
+        segment.last_seq = data["last_seq"]
+        segment.min_ts = data["min_ts"]
+        segment.max_ts = data["max_ts"]
+        segment.size = data["size"]
+        segment.sparse_ts, segment.sparse_offsets = data["sparse"]
+        segment.sources = {
+            source: (timestamps, offsets)
+            for source, (timestamps, offsets) in data["sources"].items()
+        }
+        segment.closed = True
+        return segment
+
+    def overlaps(self, start, end):
+        if self.min_ts is None:
+            return False
+        return (start is None or self.max_ts >= start) and (end is None or self.min_ts <= end)
+
+
+class EventJournal:
+    """Segment'lere bölünmüş, group commit ile yazan olay günlüğü"""
+
+    def __init__(self, directory, segment_bytes=DEFAULT_SEGMENT_BYTES, sync=True,
+                 max_segments=DEFAULT_MAX_SEGMENTS, retention=None):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.sync = sync
+        self.max_segments = max_segments
+        self.retention = retention  # saniye; None ise yalnızca segment sayısı sınırlanır
+        self.removed_segments = 0
+        os.makedirs(directory, exist_ok=True)
+        self._segments = []
+        self._index_lock = threading.Lock()
+        self._last_ts = 0.0
+        self._queue = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._durable = threading.Condition()
+        self._durable_count = 0
+        self._submitted = 0
+        self.batches = 0
+        self.written = 0
+        with self._index_lock:
+            self._catch_up()
+
+    # --- Yazma -----------------------------------------------------------
+
+    def append(self, type, source=None, data=None, wait=False):
+        """Olayı günlüğe ekler; wait=True ise diske yazılınca olay kaydını döner"""
+        self._ensure_writer()
+        waiter = _Waiter() if wait else None
+        with self._durable:
+            self._submitted += 1
+        self._queue.put(({"type": type, "source": source, "data": data}, waiter))
+        if waiter is not None:
+            return waiter.wait()
+        return None
+
+    def flush(self, timeout=None):
+        """Şu ana kadar eklenen tüm olaylar diske yazılana kadar bekler"""
+        with self._durable:
+            target = self._submitted
+            return self._durable.wait_for(lambda: self._durable_count >= target, timeout)
+
+    def _ensure_writer(self):
+        # Thread, fork'tan sonra ilk kullanımda başlatılır
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="event-journal-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < MAX_BATCH_EVENTS:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                events = self._write_batch([event for event, _ in batch])
+            except Exception as e:
+                logger.exception("Olay günlüğüne yazılamadı (%d olay)", len(batch))
+                events = [e] * len(batch)
+            for (_, waiter), event in zip(batch, events):
+                if waiter is not None:
+                    waiter.set(event)
+            with self._durable:
+                self._durable_count += len(batch)
+                self._durable.notify_all()
+
+    def _write_batch(self, pending):
+        lock_path = os.path.join(self.directory, "LOCK")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                with self._index_lock:
+                    self._catch_up()
+                    segment = self._segments[-1] if self._segments else None
+                    if segment is None or segment.size >= self.segment_bytes:
+                        segment = self._rotate(segment)
+
+                    next_seq = segment.last_seq + 1
+                    ts = self._last_ts
+                    events, lines = [], []
+                    for event in pending:
+                        ts = max(round(time.time(), 6), ts)
+                        event = {"seq": next_seq, "ts": ts, **event}
+                        next_seq += 1
+                        events.append(event)
+                        lines.append(json.dumps(event, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+                    encoded = [line.encode() for line in lines]
+                    with open(segment.path, "ab") as f:
+                        f.write(b"".join(encoded))
+                        f.flush()
+                        if self.sync:
+                            os.fsync(f.fileno())
+
+                    offset = segment.size
+                    for event, line in zip(events, encoded):
+                        segment.add(event, offset, len(line))
+                        offset += len(line)
+                    self._last_ts = ts
+                    self.batches += 1
+                    self.written += len(events)
+                    return events
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rotate(self, segment):
+        first_seq = segment.last_seq + 1 if segment is not None else 1
+        if segment is not None:
+            self._write_index(segment)
+        path = os.path.join(self.directory, f"{_SEGMENT_PREFIX}{first_seq:016d}{_SEGMENT_SUFFIX}")
+        open(path, "ab").close()
+        new_segment = _Segment(path, first_seq)
+        self._segments.append(new_segment)
+        self._apply_retention()
+        return new_segment
+
+    def _apply_retention(self):
+        # Yazılan segment hiçbir zaman silinmez; dosya kilidi ve indeks kilidi tutulurken çağrılır
+        expire_before = time.time() - self.retention if self.retention is not None else None
+        while len(self._segments) > 1:
+            oldest = self._segments[0]
+            too_many = self.max_segments is not None and len(self._segments) > self.max_segments
+            expired = (expire_before is not None and oldest.max_ts is not None
+                       and oldest.max_ts < expire_before)
+            if not too_many and not expired:
+                break
+            self._segments.pop(0)
+            for path in (oldest.path, oldest.path[:-len(_SEGMENT_SUFFIX)] + _INDEX_SUFFIX):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self.removed_segments += 1
+
+    def _write_index(self, segment):
+        segment.closed = True
+        index_path = segment.path[:-len(_SEGMENT_SUFFIX)] + _INDEX_SUFFIX
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(segment.to_index(), f, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+
+    # --- İndeks ----------------------------------------------------------
+
+    def _catch_up(self):
+        """Diskteki segmentleri ve (başka process'lerin yazdığı) yeni satırları indeksler"""
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)
+        )
+        # Başka bir process'in saklama sınırı nedeniyle sildiği segmentler indeksten çıkar
+        present = {os.path.join(self.directory, name) for name in names}
+        self._segments = [segment for segment in self._segments if segment.path in present]
+        known = {segment.path for segment in self._segments}
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if path in known:
+                continue
+            index_path = path[:-len(_SEGMENT_SUFFIX)] + _INDEX_SUFFIX
+            try:
+                with open(index_path) as f:
+                    segment = _Segment.from_index(path, json.load(f))
+            except (OSError, ValueError, KeyError):
+                first_seq = int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+                segment = _Segment(path, first_seq)
+            self._segments.append(segment)
+        self._segments.sort(key=lambda segment: segment.first_seq)
+
+        for position, segment in enumerate(self._segments):
+            if segment.closed:
+                continue
+            self._scan(segment)
+            # Arkasından yeni bir segment açılmışsa bu segmente artık yazılmaz
+            if position < len(self._segments) - 1:
+                segment.closed = True
+
+        if self._segments and self._segments[-1].max_ts is not None:
+            self._last_ts = max(self._last_ts, self._segments[-1].max_ts)
+
+    def _scan(self, segment):
+        with open(segment.path, "rb") as f:
+            f.seek(segment.size)
+            offset = segment.size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Yarım yazılmış satır: yazan process bitirince tekrar okunur
+                    break
+                segment.add(json.loads(line), offset, len(line))
+                offset += len(line)
+
+    # --- Sorgu -----------------------------------------------------------
+
+    def query(self, start=None, end=None, source=None, type=None, limit=DEFAULT_QUERY_LIMIT,
+              order="desc"):
+        """[start, end] aralığındaki olayları döner (order="desc": en yeniden, "asc": en eskiden)
+
+        source verilirse yalnızca o kaynağın satırları okunur; type olay türüne göre süzer.
+        """
+        if order not in QUERY_ORDERS:
+            raise ValueError(f"order {' veya '.join(QUERY_ORDERS)} olmalı")
+        newest_first = order == "desc"
+        with self._index_lock:
+            self._catch_up()
+            segments = [s for s in self._segments if s.overlaps(start, end)]
+            plans = [
+                (segment, self._offsets(segment, start, end, source, newest_first))
+                for segment in segments
+            ]
+        if newest_first:
+            plans.reverse()
+
+        events = []
+        for segment, offsets in plans:
+            try:
+                f = open(segment.path, "rb")
+            except FileNotFoundError:
+                # Sorgu sırasında saklama sınırı nedeniyle silindi
+                continue
+            with f:
+                if newest_first:
+                    read = self._read_reverse(f, offsets, start, end)
+                else:
+                    read = self._read(f, offsets, end)
+                for event in read:
+                    if type is not None and event["type"] != type:
+                        continue
+                    if source is not None and event.get("source") != source:
+                        continue
+                    if start is not None and event["ts"] < start:
+                        continue
+                    if end is not None and event["ts"] > end:
+                        continue
+                    events.append(event)
+                    if len(events) >= limit:
+                        return events
+        return events
+
+    @staticmethod
+    def _offsets(segment, start, end, source, newest_first=False):
+        """Okunacak satırlar: konum listesi veya okunacak byte aralığı
+
+        Eskiden yeniye okumada (başlangıç konumu, indekslenmiş boyut), yeniden eskiye
+        okumada seyrek indeks blokları ([(ts, konum), ...], indekslenmiş boyut) döner.
+        """
+        if source is not None:
+            timestamps, offsets = segment.sources.get(source, ((), ()))
+            low = bisect_left(timestamps, start) if start is not None else 0
+            high = bisect_right(timestamps, end) if end is not None else len(timestamps)
+            return list(offsets[low:high])
+
+        if newest_first:
+            return list(zip(segment.sparse_ts, segment.sparse_offsets)), segment.size
+
+        position = 0
+        if start is not None:
+            # start'tan küçük son seyrek kayıttan itibaren oku
+            index = bisect_left(segment.sparse_ts, start) - 1
+            if index >= 0:
+                position = segment.sparse_offsets[index]
+        return position, segment.size
+
+    @staticmethod
+    def _read_reverse(f, offsets, start, end):
+        if isinstance(offsets, list):
+            for offset in reversed(offsets):
+                f.seek(offset)
+                yield json.loads(f.readline())
+            return
+
+        # Seyrek indeks blokları (her biri en fazla SPARSE_INDEX_INTERVAL olay) sondan okunur
+        blocks, boundary = offsets
+        for ts, position in reversed(blocks):
+            if end is None or ts <= end:
+                f.seek(position)
+                for line in reversed(f.read(boundary - position).splitlines()):
+                    yield json.loads(line)
+            if start is not None and ts < start:
+                return
+            boundary = position
+
+    @staticmethod
+    def _read(f, offsets, end):
+        if isinstance(offsets, list):
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+            return
+
+        position, size = offsets
+        f.seek(position)
+        while position < size:
+            line = f.readline()
+            position += len(line)
+            event = json.loads(line)
+            if end is not None and event["ts"] > end:
+                return
+            yield event
+
+    def stats(self):
+        with self._index_lock:
+            segments = len(self._segments)
+            last_seq = self._segments[-1].last_seq if self._segments else 0
+        return {
+            "segments": segments,
+            "removed_segments": self.removed_segments,
+            "last_seq": last_seq,
+            "batches": self.batches,
+            "written": self.written,
+            "pending": self._queue.qsize()
+        }
+
+
+def query_args():
+    """İstekteki start, end (unix zaman), source, type, limit ve order parametrelerini okur"""
+    args = {}
+    for name in ("start", "end"):
+        value = request.args.get(name)
+        if value is not None:
+            try:
+                args[name] = float(value)
+            except ValueError:
+                raise ValueError(f"{name} bir unix zaman damgası olmalı")
+    for name in ("source", "type"):
+        if request.args.get(name):
+            args[name] = request.args[name]
+    try:
+        args["limit"] = int(request.args.get("limit", DEFAULT_QUERY_LIMIT))
+    except ValueError:
+        raise ValueError("limit bir tam sayı olmalı")
+    if not 1 <= args["limit"] <= MAX_QUERY_LIMIT:
+        raise ValueError(f"limit 1 ile {MAX_QUERY_LIMIT} arasında olmalı")
+    args["order"] = request.args.get("order", "desc")
+    if args["order"] not in QUERY_ORDERS:
+        raise ValueError(f"order {' veya '.join(QUERY_ORDERS)} olmalı")
+    return args
+
+
+class _Waiter:
+    """append(wait=True) çağıranın group commit sonucunu beklediği nesne"""
+
+    __slots__ = ("_event", "_result")
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+
+    def set(self, result):
+        self._result = result
+        self._event.set()
+
+    def wait(self):
+        self._event.wait()
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
@@ -0,0 +1,78 @@
+"""
+Hızlı JSON Serileştirme
+Tüm jsonify yanıtlarının geçtiği, takılabilir (pluggable) JSON provider
+
+  • orjson kuruluysa onu, değilse stdlib json'u kullanır (JSON_BACKEND=auto|orjson|stdlib)
+  • Çıktı her zaman kompakttır: debug modunda da girintilenmez, sonda boşluk/yeni satır yoktur
+  • Gövde doğrudan byte olarak üretilir; str'e çevirip tekrar encode etme adımı yoktur
+  • jsonify(b'...') önceden serileştirilmiş bir gövdeyi yeniden serileştirmeden yanıt yapar
+  • orjson'un desteklemediği değerler (örn. 64 bitten büyük tamsayılar) stdlib ile yazılır;
+    datetime, Decimal, UUID gibi değerler Flask'ın varsayılan provider'ı ile aynı biçimde yazılır
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKENDS = ("auto", "orjson", "stdlib")
+
+# datetime Flask'taki gibi HTTP tarih formatında yazılsın diye default'a bırakılır
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Kompakt, byte üreten ve isteğe bağlı olarak orjson kullanan JSON provider"""
+
+    ensure_ascii = False
+
+    def __init__(self, app, backend="auto"):
+        super().__init__(app)
+        if backend not in BACKENDS:
+            raise ValueError(f"Bilinmeyen JSON backend: {backend} ({', '.join(BACKENDS)})")
+        if backend == "orjson" and orjson is None:
+            raise RuntimeError("JSON_BACKEND=orjson için orjson gerekli: pip install orjson")
+        self.backend = "orjson" if backend != "stdlib" and orjson is not None else "stdlib"
+
+    @classmethod
+    def install(cls, flask_app, backend="auto"):
+        """flask_app.json'u bu provider ile değiştirir"""
+        provider = cls(flask_app, backend)
+        flask_app.json = provider
+        return provider
+
+    def dumps_bytes(self, obj):
+        """Değeri kompakt JSON byte'larına çevirir"""
+        if self.backend == "orjson":
+            option = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+            try:
+                return orjson.dumps(obj, default=self.default, option=option)
+            except TypeError:
+                # orjson.JSONEncodeError; stdlib hata ise aynı hatayı tekrar verir
+                pass
+        return json.dumps(
+            obj, default=self.default, ensure_ascii=self.ensure_ascii,
+            sort_keys=self.sort_keys, separators=(",", ":")
+        ).encode()
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if self.backend == "orjson" and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """jsonify(); tek bir bytes argümanı önceden serileştirilmiş gövde kabul edilir"""
+        if len(args) == 1 and not kwargs and isinstance(args[0], (bytes, bytearray)):
+            body = args[0]
+        else:
+            body = self.dumps_bytes(self._prepare_response_obj(args, kwargs))
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,199 @@
+"""
+İstek Metrikleri
+Endpoint gecikme histogramları, aşama süreleri ve status kodu sayaçları (Prometheus formatı)
+
+  • install() uygulamanın en dışına bir WSGI katmanı yerleştirir; middleware'de reddedilen
+    istekler dahil her isteğin toplam süresi ve status kodu kaydedilir
+  • Endpoint etiketi ham path değil route kuralıdır (örn. /api/admin/users/<username>/role),
+    böylece etiket sayısı route sayısıyla sınırlı kalır
+  • timed(aşama) ile sarılan fonksiyonların (JWT çözümleme, blocklist, rol kontrolü,
+    JSON serileştirme) süreleri ayrı histogramlarda toplanır
+  • Kayıt başına yalnızca perf_counter farkı, bisect ve kısa bir kilit maliyeti vardır;
+    metrikler yalnızca /metrics isteğinde metne çevrilir
+
+Sayaçlar process başınadır; çok process'li modda her worker kendi değerlerini raporlar.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from functools import wraps
+import threading
+import time
+
+from flask import Response, request
+
+# Route'a ulaşan isteğin endpoint etiketinin WSGI environ'da taşındığı anahtar
+ENDPOINT_KEY = "metrics.endpoint"
+
+# Route'a ulaşmayan istekler (middleware'de reddedilen, 404) için endpoint etiketi
+UNMATCHED = "unmatched"
+
+# İstek süresi histogram sınırları (saniye)
+REQUEST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Aşama süresi histogram sınırları (saniye); aşamalar mikro saniyeler mertebesindedir
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+                 0.005, 0.01, 0.025, 0.1)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # son kova +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+def _labels(**labels):
+    parts = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    return ",".join(parts)
+
+
+def _format_bound(bound):
+    return repr(float(bound))
+
+
+def _render_histogram(lines, name, label_text, bounds, counts, total):
+    cumulative = 0
+    for bound, count in zip(bounds, counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{label_text},le="{_format_bound(bound)}"}} {cumulative}')
+    cumulative += counts[-1]
+    lines.append(f'{name}_bucket{{{label_text},le="+Inf"}} {cumulative}')
+    lines.append(f"{name}_sum{{{label_text}}} {total!r}")
+    lines.append(f"{name}_count{{{label_text}}} {cumulative}")
+
+
+class Metrics:
+    """Process içi metrik kaydı ve /metrics endpoint'i
+
+    enabled=False ise install() ve timed() hiçbir şey sarmaz; ölçüm maliyeti sıfırdır.
+    """
+
+    def __init__(self, enabled=True, path="/metrics"):
+        self.enabled = enabled
+        self.path = path
+        self._requests = {}  # (endpoint, method) -> _Histogram
+        self._responses = Counter()  # (endpoint, method, status) -> sayı
+        self._stages = {}  # aşama -> _Histogram
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    def install(self, flask_app):
+        """Ölçüm katmanını uygulamanın en dışına yerleştirir ve /metrics route'unu ekler
+
+        Diğer WSGI middleware'lerinden sonra çağrılmalıdır.
+        """
+        if not self.enabled:
+            return self
+
+        inner = flask_app.wsgi_app
+
+        def wsgi_app(environ, start_response):
+            started = time.perf_counter()
+            status = []
+
+            def capture(status_line, headers, exc_info=None):
+                status.append(status_line)
+                return start_response(status_line, headers, exc_info)
+
+            try:
+                return inner(environ, capture)
+            finally:
+                self.observe_request(
+                    environ.get(ENDPOINT_KEY, UNMATCHED),
+                    environ.get("REQUEST_METHOD", ""),
+                    status[-1][:3] if status else "500",
+                    time.perf_counter() - started
+                )
+
+        flask_app.wsgi_app = wsgi_app
+
+        @flask_app.before_request
+        def record_endpoint():
+            rule = request.url_rule
+            if rule is not None:
+                request.environ[ENDPOINT_KEY] = rule.rule
+
+        # jsonify yanıtı app.json.response ile üretir; JSON provider'ı bundan önce kurulmalıdır
+        flask_app.json.response = self.timed("serialization")(flask_app.json.response)
+        flask_app.add_url_rule(self.path, "metrics", self.response, methods=["GET"])
+        return self
+
+    def observe_request(self, endpoint, method, status, seconds):
+        key = (endpoint, method)
+        with self._lock:
+            histogram = self._requests.get(key)
+            if histogram is None:
+                histogram = self._requests[key] = _Histogram(REQUEST_BUCKETS)
+            histogram.observe(seconds)
+            self._responses[(endpoint, method, status)] += 1
+
+    def observe_stage(self, stage, seconds):
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = _Histogram(STAGE_BUCKETS)
+            histogram.observe(seconds)
+
+    def timed(self, stage):
+        """Sardığı fonksiyonun süresini stage aşaması olarak kaydeden decorator"""
+        def decorator(f):
+            if not self.enabled:
+                return f
+
+            @wraps(f)
+            def timed_function(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    self.observe_stage(stage, time.perf_counter() - started)
+            return timed_function
+        return decorator
+
+    def render(self):
+        """Prometheus metin formatı (0.0.4)"""
+        with self._lock:
+            requests = {key: (list(h.counts), h.sum) for key, h in self._requests.items()}
+            responses = dict(self._responses)
+            stages = {key: (list(h.counts), h.sum) for key, h in self._stages.items()}
+
+        lines = [
+            "# HELP http_request_duration_seconds İstek süresi (endpoint ve method bazında)",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (endpoint, method), (counts, total) in sorted(requests.items()):
+            _render_histogram(lines, "http_request_duration_seconds",
+                              _labels(endpoint=endpoint, method=method),
+                              REQUEST_BUCKETS, counts, total)
+
+        lines.append("# HELP http_responses_total Status koduna göre yanıt sayısı")
+        lines.append("# TYPE http_responses_total counter")
+        for (endpoint, method, status), count in sorted(responses.items()):
+            label_text = _labels(endpoint=endpoint, method=method, status=status)
+            lines.append(f"http_responses_total{{{label_text}}} {count}")
+
+        lines.append("# HELP app_stage_duration_seconds İstek içindeki aşamaların süresi")
+        lines.append("# TYPE app_stage_duration_seconds histogram")
+        for stage, (counts, total) in sorted(stages.items()):
+            _render_histogram(lines, "app_stage_duration_seconds", _labels(stage=stage),
+                              STAGE_BUCKETS, counts, total)
+
+        lines.append("# HELP process_start_time_seconds Process başlangıç zamanı (unix)")
+        lines.append("# TYPE process_start_time_seconds gauge")
+        lines.append(f"process_start_time_seconds {self._started!r}")
+        return "\n".join(lines) + "\n"
+
+    def response(self):
+        return Response(self.render(), content_type=CONTENT_TYPE)
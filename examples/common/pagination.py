@@ -0,0 +1,82 @@
+"""
+Sayfalama ve NDJSON Akışı
+Listeleme endpoint'leri için cursor tabanlı sayfalama yardımcıları
+
+  • Cursor, son satırın sıralama anahtarını taşıyan opak bir base64 string'idir
+  • Sorgular keyset (WHERE key > cursor) ile yapılır; OFFSET kullanılmaz
+  • ?format=ndjson ile satırlar generator'dan tek tek akıtılır, bellek kullanımı sabit kalır
+"""
+
+import base64
+import json
+
+from flask import Response, current_app, request, stream_with_context
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+class PaginationError(ValueError):
+    """Geçersiz limit veya cursor"""
+
+
+def encode_cursor(key):
+    """Sıralama anahtarını (JSON'a çevrilebilir değer) opak cursor'a çevirir"""
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, key_type=None):
+    """Cursor'ı sıralama anahtarına çevirir; key_type verilirse anahtarın türü kontrol edilir"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except ValueError:
+        raise PaginationError("Geçersiz cursor")
+    if key_type is not None and not _is_key(key, key_type):
+        raise PaginationError("Geçersiz cursor")
+    return key
+
+
+def _is_key(key, key_type):
+    if key_type is int:
+        # bool int'in alt sınıfıdır; SQLite tam sayıları 64 bittir
+        return type(key) is int and -2 ** 63 <= key < 2 ** 63
+    return isinstance(key, key_type)
+
+
+def page_args(key_type=None):
+    """İstekten (limit, after) değerlerini okur; key_type cursor anahtarının türüdür"""
+    try:
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise PaginationError("limit bir tam sayı olmalı")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise PaginationError(f"limit 1 ile {MAX_PAGE_SIZE} arasında olmalı")
+
+    cursor = request.args.get("cursor")
+    return limit, decode_cursor(cursor, key_type) if cursor else None
+
+
+def wants_ndjson():
+    return (
+        request.args.get("format") == "ndjson"
+        or request.accept_mimetypes.best == NDJSON_MIMETYPE
+    )
+
+
+def ndjson_response(rows):
+    """Satırları her biri bir JSON satırı olacak şekilde akıtır (uygulamanın JSON provider'ı ile)"""
+    provider = current_app.json
+    dumps = getattr(provider, "dumps_bytes", None)
+    if dumps is None:
+        def dumps(row):
+            return provider.dumps(row, separators=(",", ":")).encode()
+
+    def generate():
+        for row in rows:
+            yield dumps(row) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
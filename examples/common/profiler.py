@@ -0,0 +1,171 @@
+"""
+Örnekleyen Profiler (Sampling Profiler)
+Çalışma anında açılıp kapatılabilen, flamegraph uyumlu yığın (stack) örnekleyici
+
+  • İsteklerin yalnızca sample_rate oranındaki kısmı örneklenir; örneklenmeyen isteklerin
+    maliyeti tek bir rastgele sayı karşılaştırmasıdır, profiler kapalıyken hiç maliyet yoktur
+  • Ayrı bir thread her interval saniyede örneklenen isteklerin thread'lerindeki yığını okur
+    (sys._current_frames); istek kodu izlenmez (setprofile/settrace kullanılmaz)
+  • Yığınlar WSGI girişinden itibaren "modül:fonksiyon" adlarıyla katlanır ve sayılır;
+    folded() çıktısı flamegraph.pl, speedscope ve inferno ile doğrudan açılır
+
+Örnekler process başınadır. gevent (async mod) worker'larında greenlet'ler aynı thread'i
+paylaştığı için yığınlar karışabilir; profil prefork veya dev modunda alınmalıdır.
+"""
+
+from collections import Counter
+import random
+import sys
+import threading
+import time
+
+# Varsayılan örnekleme aralığı (saniye)
+DEFAULT_INTERVAL = 0.005
+
+# Tutulacak en fazla farklı yığın sayısı; aşılırsa yeni yığınlar tek satırda toplanır
+DEFAULT_MAX_STACKS = 10_000
+
+OVERFLOW_STACK = "[diğer yığınlar]"
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class SamplingProfiler:
+    """İsteklerin bir kısmını örnekleyip katlanmış yığınları sayan profiler"""
+
+    def __init__(self, interval=DEFAULT_INTERVAL, max_stacks=DEFAULT_MAX_STACKS):
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.sample_rate = 0.0
+        self.samples = 0
+        self.sampled_requests = 0
+        self._active = set()  # örneklenen istekleri işleyen thread'lerin kimlikleri
+        self._stacks = Counter()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._root_code = None
+        self._started_at = None
+
+    def install(self, flask_app):
+        """İstekleri örneklemek için uygulamanın önüne WSGI katmanı yerleştirir"""
+        inner = flask_app.wsgi_app
+
+        def wsgi_app(environ, start_response):
+            if not self.sample_rate or random.random() >= self.sample_rate:
+                return inner(environ, start_response)
+            ident = threading.get_ident()
+            self._active.add(ident)
+            try:
+                return inner(environ, start_response)
+            finally:
+                self._active.discard(ident)
+                with self._lock:
+                    self.sampled_requests += 1
+
+        self._root_code = wsgi_app.__code__
+        flask_app.wsgi_app = wsgi_app
+        return self
+
+    def start(self, sample_rate, interval=None):
+        """Örneklemeyi başlatır veya oranını/aralığını değiştirir"""
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("sample_rate 0 ile 1 arasında olmalı")
+        if interval is not None:
+            if interval <= 0:
+                raise ValueError("interval pozitif olmalı")
+            self.interval = interval
+        self.sample_rate = sample_rate
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Örneklemeyi durdurur; toplanan yığınlar folded() ile okunmaya devam eder"""
+        self.sample_rate = 0.0
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._active.clear()
+
+    def reset(self):
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+            self.sampled_requests = 0
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            if not self._active:
+                continue
+            frames = sys._current_frames()
+            stacks = []
+            for ident in list(self._active):
+                frame = frames.get(ident)
+                if frame is not None:
+                    stacks.append(self._fold(frame))
+            del frames
+            with self._lock:
+                for stack in stacks:
+                    if stack not in self._stacks and len(self._stacks) >= self.max_stacks:
+                        stack = OVERFLOW_STACK
+                    self._stacks[stack] += 1
+                self.samples += len(stacks)
+
+    def _fold(self, frame):
+        names = []
+        while frame is not None:
+            names.append(_frame_name(frame))
+            if frame.f_code is self._root_code:
+                break
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def folded(self):
+        """Katlanmış yığınlar: her satırda "f1;f2;f3 örnek sayısı" (flamegraph girdisi)"""
+        with self._lock:
+            stacks = sorted(self._stacks.items(), key=lambda item: -item[1])
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def status(self):
+        with self._lock:
+            distinct = len(self._stacks)
+        return {
+            "running": self.running,
+            "sample_rate": self.sample_rate,
+            "interval_ms": self.interval * 1000,
+            "started_at": self._started_at,
+            "sampled_requests": self.sampled_requests,
+            "samples": self.samples,
+            "distinct_stacks": distinct,
+            "max_stacks": self.max_stacks
+        }
+
+
+def control_args(data):
+    """{"enabled": bool, "sample_rate": 0..1, "interval_ms": ms, "reset": bool} gövdesini doğrular"""
+    if not isinstance(data, dict) or not isinstance(data.get("enabled"), bool):
+        raise ValueError("enabled (true/false) gerekli")
+    sample_rate = data.get("sample_rate", 0.1)
+    interval_ms = data.get("interval_ms")
+    for name, value in (("sample_rate", sample_rate), ("interval_ms", interval_ms)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"{name} sayı olmalı")
+    return {
+        "enabled": data["enabled"],
+        "sample_rate": float(sample_rate),
+        "interval": interval_ms / 1000 if interval_ms is not None else None,
+        "reset": bool(data.get("reset", False))
+    }
@@ -0,0 +1,288 @@
+"""
+Rate Limiting
+Endpoint başına, IP ve kullanıcı bazında kayan pencere (sliding window) sınırlayıcı
+
+  • Sayaç, iki sabit pencerenin ağırlıklı toplamıyla yaklaşık kayan pencere hesaplar:
+    anahtar başına yalnızca (pencere no, önceki sayı, şimdiki sayı) saklanır
+  • Bellek deposu en fazla max_keys anahtar tutar; iki penceredir kullanılmayan
+    anahtarlar ve kapasite aşıldığında en eski anahtarlar atılır
+  • sqlite:/// deposu birden fazla worker process'in sayaçları paylaşmasını sağlar
+  • Sınır aşıldığında 429 ve Retry-After header'ı döner
+
+Limitler "kapsam:sayı/periyot" listesi olarak verilir, örn. "ip:20/minute,user:5/minute".
+"""
+
+from collections import Counter, OrderedDict
+from functools import wraps
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from flask import jsonify, request
+
+DEFAULT_MAX_KEYS = 100_000
+
+# Kaç istekte bir süresi dolan satırların silineceği (SQLite)
+DEFAULT_PURGE_INTERVAL = 1000
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_limits(spec):
+    """"ip:20/minute,user:5/minute" -> [("ip", 20, 60), ("user", 5, 60)]"""
+    limits = []
+    for part in filter(None, (item.strip() for item in spec.split(","))):
+        try:
+            scope, _, rate = part.partition(":")
+            count, _, period = rate.partition("/")
+            limits.append((scope.strip(), int(count), PERIODS[period.strip()]))
+        except (KeyError, ValueError):
+            raise ValueError(f"Geçersiz rate limit tanımı: {part!r}")
+    return limits
+
+
+def _weighted_count(window_id, prev, curr, current_window, elapsed_fraction):
+    if window_id == current_window:
+        return prev * (1 - elapsed_fraction) + curr
+    if window_id == current_window - 1:
+        return curr * (1 - elapsed_fraction)
+    return 0.0
+
+
+def _retry_after(window, elapsed_fraction, limit, prev, curr):
+    # Önceki pencerenin ağırlığı yeni bir isteğe yer açacak kadar azalana,
+    # şimdiki pencere doluysa pencere bitene kadar beklenir
+    if prev and curr < limit:
+        needed = 1 - (limit - 1 - curr) / prev
+    else:
+        needed = 1
+    return max(1, math.ceil(window * (needed - elapsed_fraction)))
+
+
+class MemoryRateLimitStore:
+    """Tek process için, boyutu sınırlı bellek deposu"""
+
+    def __init__(self, max_keys=DEFAULT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._entries = OrderedDict()  # anahtar -> [pencere no, önceki, şimdiki, pencere]
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window, now=None):
+        """İsteği sayar; (izin verildi mi, kaç saniye sonra tekrar denenebilir) döner"""
+        now = time.time() if now is None else now
+        current_window = int(now // window)
+        elapsed = (now % window) / window
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [current_window, 0, 0, window]
+            elif entry[0] != current_window:
+                prev = entry[2] if entry[0] == current_window - 1 else 0
+                entry = [current_window, prev, 0, window]
+
+            count = _weighted_count(entry[0], entry[1], entry[2], current_window, elapsed)
+            if count + 1 > limit:
+                self._store(key, entry)
+                return False, _retry_after(window, elapsed, limit, entry[1], entry[2])
+            entry[2] += 1
+            self._store(key, entry)
+            return True, 0
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    def _evict_idle(self, now):
+        # En uzun süredir kullanılmayan anahtarlar baştadır
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if int(now // entry[3]) - entry[0] < 2:
+                break
+            del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteRateLimitStore:
+    """Birden fazla worker process'in paylaştığı SQLite sayaç deposu"""
+
+    def __init__(self, path, purge_interval=DEFAULT_PURGE_INTERVAL):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._local = threading.local()
+        self._hits = 0
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            " key TEXT PRIMARY KEY,"
+            " window_id INTEGER NOT NULL,"
+            " prev INTEGER NOT NULL,"
+            " curr INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limits_expires_at ON rate_limits (expires_at)"
+        )
+
+    def _connection(self):
+        # sqlite3 bağlantıları thread'ler arasında paylaşılmaz
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key, limit, window, now=None):
+        now = time.time() if now is None else now
+        current_window = int(now // window)
+        elapsed = (now % window) / window
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT window_id, prev, curr FROM rate_limits WHERE key = ?", (key,)
+            ).fetchone()
+            window_id, prev, curr = row if row is not None else (current_window, 0, 0)
+            if window_id != current_window:
+                prev = curr if window_id == current_window - 1 else 0
+                window_id, curr = current_window, 0
+
+            count = _weighted_count(window_id, prev, curr, current_window, elapsed)
+            allowed = count + 1 <= limit
+            if allowed:
+                curr += 1
+            conn.execute(
+                "INSERT INTO rate_limits (key, window_id, prev, curr, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET window_id = excluded.window_id,"
+                " prev = excluded.prev, curr = excluded.curr, expires_at = excluded.expires_at",
+                (key, window_id, prev, curr, (window_id + 2) * window)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._hits += 1
+        if self._hits % self.purge_interval == 0:
+            self.purge(now)
+        if allowed:
+            return True, 0
+        return False, _retry_after(window, elapsed, limit, prev, curr)
+
+    def purge(self, now=None):
+        """Süresi dolmuş sayaçları siler"""
+        now = time.time() if now is None else now
+        cursor = self._connection().execute(
+            "DELETE FROM rate_limits WHERE expires_at <= ?", (now,)
+        )
+        return cursor.rowcount
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM rate_limits").fetchone()[0]
+
+
+def create_rate_limit_store(url):
+    """URL'e göre sayaç deposunu oluşturur
+
+    Örnekler: "memory://", "memory://?max_keys=50000", "sqlite:///ratelimit.db"
+    """
+    if url.startswith("memory://"):
+        max_keys = DEFAULT_MAX_KEYS
+        _, _, query = url.partition("?")
+        for pair in filter(None, query.split("&")):
+            key, _, value = pair.partition("=")
+            if key == "max_keys":
+                max_keys = int(value)
+        return MemoryRateLimitStore(max_keys=max_keys)
+
+    if url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return SQLiteRateLimitStore(path)
+
+    raise ValueError(f"Desteklenmeyen rate limit deposu: {url}")
+
+
+def json_field(name):
+    """İstek gövdesindeki JSON nesnesinin name alanını kapsam anahtarı olarak döner
+
+    Gövde JSON nesnesi değilse (dizi, sayı, bozuk JSON) veya alan metin değilse None
+    döner; istek yalnızca diğer kapsamlarla (örn. ip) sayılır.
+    """
+    def key_function():
+        body = request.get_json(silent=True)
+        if not isinstance(body, dict):
+            return None
+        value = body.get(name)
+        return value if isinstance(value, str) else None
+    return key_function
+
+
+class RateLimiter:
+    """Endpoint'lere rate limit uygulayan decorator üreticisi
+
+    limits: endpoint adı -> "kapsam:sayı/periyot,..." tanımı. "ip" kapsamı istemci
+    adresidir; diğer kapsamların değeri limit() çağrısında verilen fonksiyonlardan gelir.
+    """
+
+    def __init__(self, store, limits):
+        self.store = store
+        self.limits = {name: parse_limits(spec) for name, spec in limits.items()}
+        self.limited = Counter()
+        self._lock = threading.Lock()
+
+    def limit(self, endpoint, **scopes):
+        """View'ı endpoint'e ait limitlerle sınırlar
+
+        scopes: kapsam adı -> istekten anahtar değeri dönen fonksiyon (fonksiyon None
+        dönerse istek o kapsamda sayılmaz). Varsayılan ip kapsamı ip=None ile kapatılır;
+        böylece aynı endpoint'in kapsamları doğrulamadan önce ve sonra ayrı sayılabilir.
+        """
+        scopes.setdefault("ip", lambda: request.remote_addr)
+
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                retry_after = self.check(endpoint, scopes)
+                if retry_after:
+                    response = jsonify({
+                        "error": "Çok fazla istek, lütfen daha sonra tekrar deneyin",
+                        "retry_after": retry_after
+                    })
+                    response.status_code = 429
+                    response.headers["Retry-After"] = str(retry_after)
+                    return response
+                return f(*args, **kwargs)
+            return decorated_function
+        return decorator
+
+    def check(self, endpoint, scopes):
+        """Sınır aşıldıysa beklenecek saniyeyi, aşılmadıysa 0 döner"""
+        retry_after = 0
+        for scope, limit, window in self.limits.get(endpoint, ()):
+            key_function = scopes.get(scope)
+            value = key_function() if key_function is not None else None
+            if value is None:
+                continue
+            allowed, wait = self.store.hit(f"{endpoint}:{scope}:{value}", limit, window)
+            if not allowed:
+                with self._lock:
+                    self.limited[f"{endpoint}:{scope}"] += 1
+                retry_after = max(retry_after, wait)
+        return retry_after
+
+    def stats(self):
+        with self._lock:
+            return dict(self.limited)
@@ -0,0 +1,124 @@
+"""
+Yanıt Önbelleği (Response Cache)
+Sabit veya seyrek değişen endpoint'lerin JSON yanıtlarını byte olarak saklar
+
+  • Her kayıt, gövdenin özetinden türetilen bir ETag ile saklanır
+  • If-None-Match ETag ile eşleşirse gövdesiz 304 Not Modified döner
+  • Alttaki veri değiştiğinde invalidate(namespace) ile ilgili kayıtlar silinir
+  • version verilirse (örn. paylaşımlı veritabanındaki değişiklik sayacı) başka bir
+    worker process'in yaptığı değişiklikler de kaydı geçersiz kılar
+"""
+
+from collections import OrderedDict
+from functools import wraps
+import hashlib
+import threading
+
+from flask import Response, make_response, request
+
+DEFAULT_MAX_ENTRIES = 256
+
+# İstemciler (ve varsa ara proxy'ler) yanıtı saklayabilir, ancak her kullanımda
+# ETag ile yeniden doğrulamalıdır
+CACHE_CONTROL = "public, no-cache"
+
+
+class _Entry:
+    __slots__ = ("body", "etag", "mimetype", "version")
+
+    def __init__(self, body, mimetype, version):
+        self.body = body
+        self.mimetype = mimetype
+        self.version = version
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Namespace'lere ayrılmış, ETag destekli yanıt önbelleği"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._namespaces = {}  # namespace -> OrderedDict((query_string, variant) -> _Entry)
+        self._generations = {}  # namespace -> invalidate sayacı
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def cached(self, namespace, version=None, cache_control=CACHE_CONTROL, variant=None):
+        """View'ın 200 yanıtını namespace + query string anahtarıyla önbelleğe alır
+
+        version: her istekte çağrılan ve veri değiştiğinde farklı bir değer dönen
+        fonksiyon; kayıt yalnızca saklandığı andaki version ile eşleşirse kullanılır.
+        cache_control: istemcilere gönderilecek Cache-Control değeri.
+        variant: view gösterimi Accept header'ına göre seçiyorsa (örn. JSON / NDJSON)
+        seçilen gösterimi dönen fonksiyon; anahtara eklenir ve yanıtlara Vary: Accept konur.
+        """
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                key = (request.query_string, variant() if variant is not None else None)
+                current = version() if version is not None else None
+                entry, generation = self._get(namespace, key, current)
+                if entry is None:
+                    response = make_response(f(*args, **kwargs))
+                    if response.status_code != 200 or response.is_streamed:
+                        if variant is not None:
+                            response.vary.add("Accept")
+                        return response
+                    entry = _Entry(response.get_data(), response.mimetype, current)
+                    self._put(namespace, key, entry, generation)
+                response = self._respond(entry, cache_control)
+                if variant is not None:
+                    response.vary.add("Accept")
+                return response
+            return decorated_function
+        return decorator
+
+    def _respond(self, entry, cache_control):
+        # Sıkıştırılan yanıtlar zayıf ETag ile gider; If-None-Match zayıf karşılaştırılır
+        if request.if_none_match.contains_weak(entry.etag):
+            self.not_modified += 1
+            response = Response(status=304)
+        else:
+            response = Response(entry.body, mimetype=entry.mimetype)
+        response.set_etag(entry.etag)
+        response.headers["Cache-Control"] = cache_control
+        return response
+
+    def _get(self, namespace, key, version):
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None or entry.version != version:
+                self.misses += 1
+                return None, self._generations.get(namespace, 0)
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry, None
+
+    def _put(self, namespace, key, entry, generation):
+        with self._lock:
+            # Yanıt hesaplanırken namespace invalidate edildiyse eski veriyi saklama
+            if self._generations.get(namespace, 0) != generation:
+                return
+            entries = self._namespaces.setdefault(namespace, OrderedDict())
+            entries[key] = entry
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, namespace):
+        """Namespace'e ait tüm önbellek kayıtlarını siler"""
+        with self._lock:
+            self._namespaces.pop(namespace, None)
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            sizes = {namespace: len(entries) for namespace, entries in self._namespaces.items()}
+        return {
+            "entries": sizes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified
+        }
@@ -0,0 +1,102 @@
+"""
+Server Başlatma
+Örnek server'lar için geliştirme ve üretim çalışma modları
+
+  • dev     - Flask geliştirme server'ı (debugger + reloader, tek process)
+  • prefork - gunicorn ile çok process'li (pre-fork) çalışma, her worker'da thread havuzu
+  • async   - gunicorn + gevent worker'ları; çok sayıda eşzamanlı bağlantı için
+
+Mod ve worker sayısı komut satırından (--mode, --workers, --threads) veya
+SERVER_MODE / SERVER_WORKERS / SERVER_THREADS environment variable'larından okunur.
+Çok process'li modlarda SERVER_MULTIPROCESS=1 ayarlanır; uygulamalar paylaşılması
+gereken durumu (token iptal listesi vb.) buna göre process'ler arası bir depoya taşır.
+"""
+
+import argparse
+import os
+import sys
+
+MODES = ("dev", "prefork", "async")
+
+# Çok process'li modlarda uygulama modüllerinin okuduğu işaret
+MULTIPROCESS_ENV = "SERVER_MULTIPROCESS"
+
+
+def is_multiprocess():
+    """Uygulama birden fazla worker process ile çalışıyorsa True"""
+    return os.environ.get(MULTIPROCESS_ENV) == "1"
+
+
+def default_workers():
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+def parse_args(port):
+    parser = argparse.ArgumentParser(description="Örnek authentication server'ı")
+    parser.add_argument("--mode", choices=MODES, default=os.environ.get("SERVER_MODE", "dev"))
+    parser.add_argument("--host", default=os.environ.get("SERVER_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("SERVER_PORT", port)))
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("SERVER_WORKERS", default_workers())))
+    parser.add_argument("--threads", type=int, default=int(os.environ.get("SERVER_THREADS", 4)))
+    parser.add_argument("--connections", type=int,
+                        default=int(os.environ.get("SERVER_CONNECTIONS", 1000)),
+                        help="async modda worker başına en fazla eşzamanlı bağlantı")
+    return parser.parse_args()
+
+
+def start_workers(app_uri, port):
+    """Komut satırını okur; prefork/async modda gunicorn'u başlatır ve process'i bitirir
+
+    Server modülünün en başında, uygulama kurulmadan çağrılır. Böylece gunicorn master'ı
+    veritabanı, olay günlüğü gibi kaynakları açmaz; her worker app_uri'yi ("server:app")
+    fork'tan sonra kendisi import eder. dev modunda ayrıştırılan argümanları döner.
+    """
+    args = parse_args(port)
+    if args.mode == "dev":
+        return args
+
+    options = {
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "preload_app": False,
+    }
+    if args.mode == "prefork":
+        options.update(worker_class="gthread", threads=args.threads)
+    else:
+        try:
+            import gevent  # noqa: F401
+        except ImportError:
+            raise SystemExit("async mod için gevent gerekli: pip install gevent")
+        options.update(worker_class="gevent", worker_connections=args.connections)
+
+    if args.workers > 1:
+        os.environ[MULTIPROCESS_ENV] = "1"
+
+    _run_gunicorn(app_uri, options)
+    sys.exit(0)
+
+
+def serve(app, args):
+    """Uygulamayı Flask geliştirme server'ı ile başlatır (start_workers()'ın döndüğü dev modu)"""
+    app.run(host=args.host, port=args.port, debug=True)
+
+
+def _run_gunicorn(app_uri, options):
+    try:
+        from gunicorn.app.base import BaseApplication
+        from gunicorn.util import import_app
+    except ImportError:
+        raise SystemExit("prefork/async modlar için gunicorn gerekli: pip install gunicorn")
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return import_app(app_uri)
+
+    print(f"🚀 gunicorn: {options['workers']} worker ({options['worker_class']}), "
+          f"http://{options['bind']}")
+    Application().run()
@@ -0,0 +1,98 @@
+"""
+Rol Tabanlı Erişim Kontrolü (RBAC)
+Yetkilendirmeyi kullanıcı kaydı yerine doğrulanmış token claim'lerinden yapar
+
+Rol hiyerarşisi uygulama açılışında derlenir: her rol için "bu rolün kapsadığı
+roller" kümesi hesaplanır ve her require_role(...) kullanımı için kabul edilen
+roller tek bir frozenset'e indirgenir. İstek sırasında yalnızca bir küme
+üyeliği kontrolü yapılır.
+"""
+
+from functools import wraps
+
+from flask import jsonify
+from flask_jwt_extended import get_jwt, get_jwt_identity
+
+# Token içindeki rol versiyonu claim'i
+ROLE_VERSION_CLAIM = "role_ver"
+
+
+class RoleHierarchy:
+    """Rol -> kapsadığı roller tablosunu derleyen hiyerarşi"""
+
+    def __init__(self, hierarchy):
+        self._grants = {}
+        for role in hierarchy:
+            self._grants[role] = frozenset(self._expand(role, hierarchy, set()))
+
+    def _expand(self, role, hierarchy, seen):
+        if role in seen:
+            return seen
+        seen.add(role)
+        for child in hierarchy.get(role, ()):
+            self._expand(child, hierarchy, seen)
+        return seen
+
+    def grants(self, role):
+        """Rolün kapsadığı tüm roller (kendisi dahil)"""
+        return self._grants.get(role, frozenset())
+
+    def accepted_roles(self, required_roles):
+        """required_roles'dan en az birini kapsayan rollerin kümesi"""
+        required = frozenset(required_roles)
+        unknown = required - self._grants.keys()
+        if unknown:
+            raise ValueError(f"Tanımsız rol: {', '.join(sorted(unknown))}")
+        return frozenset(
+            role for role, grants in self._grants.items() if grants & required
+        )
+
+
+class RBAC:
+    """Token claim'lerinden yetkilendirme yapan require_role decorator'ı sağlar
+
+    check_role_version=True ise token'daki role_ver claim'i kullanıcı deposundaki
+    versiyon ile karşılaştırılır; yalnızca versiyon eskiyse depodaki güncel rol
+    kullanılır. Böylece rolü değişen kullanıcının eski token'ı hemen etkisini kaybeder.
+    timer verilirse rol çözümlemeyi saran decorator olarak kullanılır (örn. metrics.timed("role")).
+    """
+
+    def __init__(self, hierarchy, user_store=None, check_role_version=False, timer=None):
+        if check_role_version and user_store is None:
+            raise ValueError("Rol versiyonu kontrolü için user_store gerekli")
+        self.hierarchy = RoleHierarchy(hierarchy)
+        self.user_store = user_store
+        self.check_role_version = check_role_version
+        if timer is not None:
+            self.current_role = timer(self.current_role)
+
+    def current_role(self):
+        claims = get_jwt()
+        role = claims.get("role")
+        if not self.check_role_version:
+            return role
+
+        profile = self.user_store.get_profile(get_jwt_identity())
+        if profile is None:
+            return None
+        if claims.get(ROLE_VERSION_CLAIM) != profile["role_version"]:
+            return profile["role"]
+        return role
+
+    def require_role(self, *required_roles):
+        accepted = self.hierarchy.accepted_roles(required_roles)
+        required_text = " veya ".join(required_roles)
+
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                role = self.current_role()
+                if role not in accepted:
+                    return jsonify({
+                        "error": f"Bu endpoint için {required_text} rolü gerekli",
+                        "your_role": role
+                    }), 403
+
+                return f(*args, **kwargs)
+            return decorated_function
+        return decorator
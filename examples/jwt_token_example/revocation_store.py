@@ -0,0 +1,255 @@
+"""
+JWT Token İptal Deposu (Revocation Store)
+İptal edilen token'ların jti değerlerini exp süresine kadar saklayan depolar
+
+İptal edilmiş bir access token'ın yalnızca exp anına kadar tutulması yeterlidir;
+bu andan sonra token zaten imza doğrulamasında reddedilir. Bu yüzden her kayıt
+exp ile birlikte saklanır ve süresi dolan kayıtlar otomatik temizlenir.
+
+Backend'ler:
+  • memory://            - Tek process, exp'e göre indekslenmiş bellek deposu
+  • memory://?persist=yol - Bellek deposu + snapshot / WAL ile restart sonrası geri yükleme
+  • sqlite:///yol/db     - Birden fazla worker process'in paylaştığı SQLite dosyası
+                           (yol çalışma klasörüne göredir; mutlak yol: sqlite:////var/lib/revoked.db)
+
+Bellek deposu doluysa yeni iptal reddedilir (RevocationStoreFull); süresi dolmamış
+bir iptal kaydı hiçbir zaman düşürülmez.
+"""
+
+import heapq
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from common.state_persistence import SnapshotLog
+
+logger = logging.getLogger(__name__)
+
+# Bellek deposunda aynı anda tutulacak en fazla iptal kaydı
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Kaç yazma işleminde bir süresi dolan kayıtların temizleneceği (SQLite)
+DEFAULT_PURGE_INTERVAL = 256
+
+# Kalıcı bellek deposunda kaç WAL kaydında bir snapshot alınacağı
+DEFAULT_SNAPSHOT_INTERVAL = 10_000
+
+
+class RevocationStoreFull(Exception):
+    """Bellek deposu kapasitesi dolu; iptal kaydedilemedi"""
+
+
+class RevocationStore:
+    """İptal deposu arayüzü"""
+
+    def revoke(self, jti, exp):
+        """jti değerini exp (unix zaman damgası) anına kadar iptal eder"""
+        raise NotImplementedError
+
+    def is_revoked(self, jti):
+        """jti iptal edilmiş ve süresi henüz dolmamışsa True döner"""
+        raise NotImplementedError
+
+    def purge(self, now=None):
+        """Süresi dolmuş kayıtları siler ve silinen kayıt sayısını döner"""
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+class MemoryRevocationStore(RevocationStore):
+    """exp'e göre min-heap ile indekslenmiş, boyutu sınırlı bellek deposu"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = {}   # jti -> exp
+        self._heap = []      # (exp, jti)
+        self._lock = threading.Lock()
+
+    def revoke(self, jti, exp):
+        with self._lock:
+            self._revoke_locked(jti, exp, time.time())
+
+    def _revoke_locked(self, jti, exp, now, limit=True):
+        """Kaydı ekler; yeni bir kayıt eklendiyse True döner
+
+        Depo doluysa RevocationStoreFull fırlatır: süresi dolmamış bir kaydı düşürmek
+        iptal edilmiş token'ı yeniden geçerli yapardı. limit=False yalnızca diskten
+        geri yüklemede kullanılır; daha önce kabul edilmiş iptaller kaybolmaz.
+        """
+        if exp <= now:
+            return False
+        self._purge_locked(now)
+        if jti in self._entries:
+            return False
+        if limit and len(self._entries) >= self.max_entries:
+            logger.error("İptal deposu dolu (%d kayıt), jti iptal edilemedi", self.max_entries)
+            raise RevocationStoreFull(f"İptal deposu dolu ({self.max_entries} kayıt)")
+        self._entries[jti] = exp
+        heapq.heappush(self._heap, (exp, jti))
+        return True
+
+    def is_revoked(self, jti):
+        exp = self._entries.get(jti)
+        if exp is None:
+            return False
+        return exp > time.time()
+
+    def purge(self, now=None):
+        with self._lock:
+            return self._purge_locked(time.time() if now is None else now)
+
+    def _purge_locked(self, now):
+        removed = 0
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, jti = heapq.heappop(heap)
+            del self._entries[jti]
+            removed += 1
+        return removed
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class PersistentRevocationStore(MemoryRevocationStore):
+    """Değişiklikleri WAL'a yazan ve periyodik snapshot alan bellek deposu
+
+    Açılışta son snapshot ve sonrasındaki WAL kayıtları yüklenir; süresi dolmuş
+    kayıtlar yüklenirken atlanır. Yalnızca tek process ile kullanılabilir.
+    """
+
+    def __init__(self, directory, max_entries=DEFAULT_MAX_ENTRIES,
+                 snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL, sync=True):
+        super().__init__(max_entries=max_entries)
+        self.snapshot_interval = snapshot_interval
+        self._log = SnapshotLog(directory, sync=sync)
+        state, records = self._log.load()
+        now = time.time()
+        with self._lock:
+            for jti, exp in (state or []):
+                self._revoke_locked(jti, exp, now, limit=False)
+            for _, jti, exp in records:
+                self._revoke_locked(jti, exp, now, limit=False)
+            if records:
+                self._snapshot_locked()
+
+    def revoke(self, jti, exp):
+        with self._lock:
+            if not self._revoke_locked(jti, exp, time.time()):
+                return
+            self._log.append(["revoke", jti, exp])
+            if self._log.records_since_snapshot >= self.snapshot_interval:
+                self._snapshot_locked()
+
+    def _snapshot_locked(self):
+        self._log.snapshot(list(self._entries.items()))
+
+    def close(self):
+        self._log.close()
+
+
+class SQLiteRevocationStore(RevocationStore):
+    """Birden fazla worker process'in paylaştığı SQLite tabanlı depo"""
+
+    def __init__(self, path, purge_interval=DEFAULT_PURGE_INTERVAL):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._local = threading.local()
+        self._writes = 0
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS revoked_tokens ("
+                " jti TEXT PRIMARY KEY,"
+                " exp INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_revoked_tokens_exp "
+                "ON revoked_tokens (exp)"
+            )
+
+    def _connection(self):
+        # sqlite3 bağlantıları thread'ler arasında paylaşılmaz
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def revoke(self, jti, exp):
+        now = time.time()
+        if exp <= now:
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO revoked_tokens (jti, exp) VALUES (?, ?)",
+                (jti, math.ceil(exp))
+            )
+        self._writes += 1
+        if self._writes % self.purge_interval == 0:
+            self.purge(now)
+
+    def is_revoked(self, jti):
+        row = self._connection().execute(
+            "SELECT exp FROM revoked_tokens WHERE jti = ?", (jti,)
+        ).fetchone()
+        return row is not None and row[0] > time.time()
+
+    def purge(self, now=None):
+        now = time.time() if now is None else now
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM revoked_tokens WHERE exp <= ?", (int(now),)
+            )
+        return cursor.rowcount
+
+    def __len__(self):
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM revoked_tokens"
+        ).fetchone()[0]
+
+
+def create_revocation_store(url):
+    """URL'e göre uygun iptal deposunu oluşturur
+
+    Örnekler: "memory://", "memory://?max_entries=50000",
+    "memory://?persist=state/revoked", "sqlite:///revoked.db" (çalışma klasörüne göre),
+    "sqlite:////var/lib/auth/revoked.db" (mutlak yol)
+    """
+    if url.startswith("memory://"):
+        max_entries = DEFAULT_MAX_ENTRIES
+        persist = None
+        snapshot_interval = DEFAULT_SNAPSHOT_INTERVAL
+        _, _, query = url.partition("?")
+        for pair in filter(None, query.split("&")):
+            key, _, value = pair.partition("=")
+            if key == "max_entries":
+                max_entries = int(value)
+            elif key == "persist":
+                persist = value
+            elif key == "snapshot_interval":
+                snapshot_interval = int(value)
+        if persist:
+            return PersistentRevocationStore(
+                persist, max_entries=max_entries, snapshot_interval=snapshot_interval
+            )
+        return MemoryRevocationStore(max_entries=max_entries)
+
+    if url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return SQLiteRevocationStore(path)
+
+    raise ValueError(f"Desteklenmeyen iptal deposu: {url}")
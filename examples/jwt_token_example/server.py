@@ -3,13 +3,41 @@ JWT Token Authentication Server
 Login tabanlı JWT token authentication örneği
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_jwt_extended import (
-    JWTManager, create_access_token, create_refresh_token,
+    create_access_token, create_refresh_token,
     jwt_required, get_jwt_identity, get_jwt
 )
 from datetime import timedelta
-from functools import wraps
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from revocation_store import RevocationStoreFull, create_revocation_store
+from token_cache import CachingJWTManager, VerifiedTokenCache
+from user_store import UserStore, DEFAULT_HASH_ITERATIONS
+from rbac import RBAC, ROLE_VERSION_CLAIM
+from signing_keys import KeySet
+
+from common.auth_middleware import AuthMiddleware
+from common.batch_ingest import BatchError, iter_batch
+from common.compression import Compressor
+from common.event_journal import EventJournal, query_args
+from common.json_provider import FastJSONProvider
+from common.metrics import Metrics
+from common.profiler import SamplingProfiler, control_args
+from common.response_cache import ResponseCache
+from common.rate_limit import RateLimiter, create_rate_limit_store, json_field
+from common.pagination import (
+    PaginationError, encode_cursor, ndjson_response, page_args, wants_ndjson
+)
+from common.serve import is_multiprocess, serve, start_workers
+
+# prefork/async modda gunicorn burada başlar: master process uygulamayı kurmaz,
+# her worker server:app'i fork'tan sonra kendisi import eder
+if __name__ == '__main__':
+    server_args = start_workers('server:app', port=5002)
 
 app = Flask(__name__)
 
@@ -18,10 +46,155 @@ app.config['JWT_SECRET_KEY'] = 'super-secret-jwt-key-change-in-production'
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(minutes=15)  # 15 dakika
 app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=30)    # 30 gün
 
-jwt = JWTManager(app)
+# Asimetrik imzalama: JWT_KEYS_DIR verilirse token'lar bu klasördeki anahtarlarla
+# (RS256 / EdDSA, kid header'ı ile) imzalanır; verilmezse JWT_SECRET_KEY ile HS256 kullanılır
+app.config['JWT_KEYS_DIR'] = os.environ.get('JWT_KEYS_DIR')
+app.config['JWT_ACTIVE_KID'] = os.environ.get('JWT_ACTIVE_KID')
+
+# JWKS yanıtının diğer servislerde önbellekte tutulabileceği süre (saniye)
+app.config['JWKS_MAX_AGE'] = int(os.environ.get('JWKS_MAX_AGE', 300))
+
+# Token iptal deposu: memory://?persist=state/revoked (tek process, restart sonrası
+# snapshot + WAL'dan geri yüklenir), memory:// (yalnızca bellek) veya sqlite:///revoked.db
+# (paylaşımlı). Logout'ların restart'ta kaybolmaması için varsayılan depolar kalıcıdır;
+# birden fazla worker ile çalışırken varsayılan paylaşımlı SQLite deposudur.
+app.config['JWT_REVOCATION_STORE'] = os.environ.get(
+    'JWT_REVOCATION_STORE',
+    'sqlite:///revoked.db' if is_multiprocess() else 'memory://?persist=state/revoked'
+)
+if is_multiprocess() and app.config['JWT_REVOCATION_STORE'].startswith('memory://'):
+    raise RuntimeError(
+        "memory:// iptal deposu birden fazla worker ile kullanılamaz; "
+        "logout diğer worker'larda geçersiz kalır. JWT_REVOCATION_STORE=sqlite:///... kullanın"
+    )
+
+# Doğrulanmış token önbelleğinin en fazla kayıt sayısı (0 = kapalı)
+app.config['JWT_VERIFY_CACHE_SIZE'] = int(os.environ.get('JWT_VERIFY_CACHE_SIZE', 10000))
+
+# Kullanıcı veritabanı (SQLite) ve şifre hash maliyeti (PBKDF2 iterasyon sayısı)
+app.config['USER_DB_PATH'] = os.environ.get('USER_DB_PATH', 'users.db')
+app.config['USER_HASH_ITERATIONS'] = int(
+    os.environ.get('USER_HASH_ITERATIONS', DEFAULT_HASH_ITERATIONS)
+)
+
+# Açık ise rol değişikliği eski token'larda da hemen geçerli olur (role_ver kontrolü)
+app.config['RBAC_CHECK_ROLE_VERSION'] = os.environ.get('RBAC_CHECK_ROLE_VERSION', '0') == '1'
+
+# Rate limit sayaç deposu (birden fazla worker ile paylaşımlı SQLite) ve endpoint limitleri.
+# Limitler "kapsam:sayı/periyot" biçimindedir; kapsamlar ip ve user'dır.
+app.config['RATE_LIMIT_STORE'] = os.environ.get(
+    'RATE_LIMIT_STORE',
+    'sqlite:///ratelimit.db' if is_multiprocess() else 'memory://'
+)
+app.config['RATE_LIMITS'] = {
+    'login': os.environ.get('RATE_LIMIT_LOGIN', 'ip:30/minute,user:5/minute'),
+    'refresh': os.environ.get('RATE_LIMIT_REFRESH', 'ip:60/minute,user:20/minute'),
+}
+
+# Login, logout ve yönetim olaylarının yazıldığı olay günlüğü klasörü
+app.config['EVENT_LOG_DIR'] = os.environ.get('EVENT_LOG_DIR', 'events')
+
+# Olay günlüğü saklama sınırı: en fazla segment sayısı (16 MB'lık) ve gün (0 = süre sınırı yok)
+app.config['EVENT_LOG_MAX_SEGMENTS'] = int(os.environ.get('EVENT_LOG_MAX_SEGMENTS', 64))
+app.config['EVENT_LOG_RETENTION_DAYS'] = float(os.environ.get('EVENT_LOG_RETENTION_DAYS', 30))
+
+# İstek ve aşama süresi metrikleri (/metrics, Prometheus formatı)
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', '1') == '1'
+
+# JSON yanıtlarını üreten backend: auto (orjson kuruluysa orjson), orjson veya stdlib
+app.config['JSON_BACKEND'] = os.environ.get('JSON_BACKEND', 'auto')
+
+# Accept-Encoding'e göre gzip/brotli sıkıştırma; bu boyuttan (byte) küçük yanıtlar sıkıştırılmaz
+app.config['COMPRESSION_ENABLED'] = os.environ.get('COMPRESSION_ENABLED', '1') == '1'
+app.config['COMPRESSION_MIN_SIZE'] = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+
+# Örnekleyen profiler: açılışta örneklenecek istek oranı (0 = kapalı) ve örnekleme aralığı.
+# Çalışma anında POST /api/admin/profiler ile açılıp kapatılabilir.
+app.config['PROFILER_SAMPLE_RATE'] = float(os.environ.get('PROFILER_SAMPLE_RATE', 0))
+app.config['PROFILER_INTERVAL_MS'] = float(os.environ.get('PROFILER_INTERVAL_MS', 5))
+
+# Tüm jsonify yanıtları kompakt ve doğrudan byte olarak üretilir
+FastJSONProvider.install(app, app.config['JSON_BACKEND'])
+
+# Metrik kaydı: JWT çözümleme, blocklist, rol kontrolü ve serileştirme ayrı aşamalar olarak ölçülür
+metrics = Metrics(enabled=app.config['METRICS_ENABLED'])
+
+# Token iptal deposu (kayıtlar token'ın exp süresi dolunca temizlenir)
+revocation_store = create_revocation_store(app.config['JWT_REVOCATION_STORE'])
 
-# Kullanıcı veritabanı (gerçek uygulamada database kullanılır)
-USERS = {
+# Aynı token ile gelen isteklerde imza doğrulamasını atlayan önbellek. İptal kontrolü
+# önbellekten gelen token'lar için de check_if_token_revoked'da bir kez yapılır.
+token_cache = VerifiedTokenCache(max_size=app.config['JWT_VERIFY_CACHE_SIZE'])
+
+jwt = CachingJWTManager(app, token_cache=token_cache, timer=metrics.timed('auth'))
+
+# İmzalama anahtarları açılışta bir kez yüklenir
+signing_keys = None
+if app.config['JWT_KEYS_DIR']:
+    signing_keys = KeySet.load(app.config['JWT_KEYS_DIR'], app.config['JWT_ACTIVE_KID'])
+    signing_keys.install(app, jwt)
+
+# Token gerektirmeyen path'ler
+PUBLIC_PATHS = ('/api/public', '/api/login', '/api/users')
+
+# flask_jwt_extended'in reddettiği token'lar için yanıtlar (varsayılan İngilizce {"msg": ...} yerine)
+JWT_REJECTIONS = {
+    "invalid_token": (401, {"error": "Geçersiz JWT token"}),
+    "expired_token": (401, {"error": "Token süresi dolmuş"}),
+    "revoked_token": (401, {"error": "Token iptal edilmiş"}),
+}
+
+# Authentication middleware: eksik/bozuk Authorization header'ları Flask routing'den
+# önce reddeder; JWT doğrulaması flask_jwt_extended'de kalır
+auth = AuthMiddleware.install(app, public_paths=PUBLIC_PATHS, rejections=JWT_REJECTIONS)
+
+# JWT doğrulama hataları da middleware'in yanıtlarıyla döner ve auth-stats'ta sayılır
+@jwt.invalid_token_loader
+def invalid_token_callback(error):
+    return auth.response('invalid_token')
+
+@jwt.expired_token_loader
+def expired_token_callback(jwt_header, jwt_payload):
+    return auth.response('expired_token')
+
+@jwt.revoked_token_loader
+def revoked_token_callback(jwt_header, jwt_payload):
+    return auth.response('revoked_token')
+
+# Örneklenen isteklerin yığınları middleware dahil toplanır
+profiler = SamplingProfiler(interval=app.config['PROFILER_INTERVAL_MS'] / 1000).install(app)
+if app.config['PROFILER_SAMPLE_RATE'] > 0:
+    profiler.start(app.config['PROFILER_SAMPLE_RATE'])
+
+# Ölçüm katmanı en dışta olmalıdır (middleware'de reddedilen istekler de sayılır)
+metrics.install(app)
+
+# Sabit/seyrek değişen yanıtlar için ETag destekli önbellek
+response_cache = ResponseCache()
+
+# Büyük listeler yavaş bağlantılarda sıkıştırılmış gider; önbellekteki yanıtlar bir kez sıkıştırılır
+compressor = Compressor(
+    min_size=app.config['COMPRESSION_MIN_SIZE'],
+    timer=metrics.timed('compression')
+)
+if app.config['COMPRESSION_ENABLED']:
+    compressor.install(app)
+
+# Login ve token yenileme denemelerini IP ve kullanıcı başına sınırlar
+rate_limiter = RateLimiter(
+    create_rate_limit_store(app.config['RATE_LIMIT_STORE']),
+    app.config['RATE_LIMITS']
+)
+
+# Authentication olaylarının kalıcı günlüğü
+event_journal = EventJournal(
+    app.config['EVENT_LOG_DIR'],
+    max_segments=app.config['EVENT_LOG_MAX_SEGMENTS'],
+    retention=app.config['EVENT_LOG_RETENTION_DAYS'] * 86400 or None
+)
+
+# Demo kullanıcılar (veritabanı boşsa ilk açılışta yüklenir)
+DEMO_USERS = {
     "admin": {
         "password": "admin123",
         "role": "admin",
@@ -39,38 +212,49 @@ USERS = {
     }
 }
 
-# Token iptal listesi (gerçek uygulamada Redis kullanılır)
-REVOKED_TOKENS = set()
+# Kullanıcı deposu
+user_store = UserStore(
+    app.config['USER_DB_PATH'],
+    iterations=app.config['USER_HASH_ITERATIONS']
+)
+if len(user_store) == 0:
+    user_store.import_users(
+        dict(data, username=username) for username, data in DEMO_USERS.items()
+    )
 
 # JWT token iptal kontrolü
 @jwt.token_in_blocklist_loader
+@metrics.timed('blocklist')
 def check_if_token_revoked(jwt_header, jwt_payload):
     jti = jwt_payload["jti"]
-    return jti in REVOKED_TOKENS
-
-# Role-based access control decorator
-def require_role(required_role):
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            current_user = get_jwt_identity()
-            user_data = USERS.get(current_user)
-            
-            if not user_data:
-                return jsonify({"error": "Kullanıcı bulunamadı"}), 404
-            
-            if user_data['role'] != required_role and user_data['role'] != 'admin':
-                return jsonify({
-                    "error": f"Bu endpoint için {required_role} rolü gerekli",
-                    "your_role": user_data['role']
-                }), 403
-            
-            return f(*args, **kwargs)
-        return decorated_function
-    return decorator
+    return revocation_store.is_revoked(jti)
+
+# Rol hiyerarşisi: her rol listelenen rollerin yetkilerini de kapsar
+ROLE_HIERARCHY = {
+    "admin": ["operator", "user"],
+    "operator": [],
+    "user": []
+}
+
+# Role-based access control: yetki token'daki role claim'inden okunur
+rbac = RBAC(
+    ROLE_HIERARCHY,
+    user_store=user_store,
+    check_role_version=app.config['RBAC_CHECK_ROLE_VERSION'],
+    timer=metrics.timed('role')
+)
+require_role = rbac.require_role
+
+def role_claims(user_data):
+    """Access token'a eklenecek rol claim'leri"""
+    return {
+        "role": user_data['role'],
+        ROLE_VERSION_CLAIM: user_data['role_version']
+    }
 
 # Public endpoint
 @app.route('/api/public', methods=['GET'])
+@response_cache.cached('public')
 def public_endpoint():
     """Herkese açık endpoint"""
     return jsonify({
@@ -80,26 +264,33 @@ def public_endpoint():
 
 # Login endpoint
 @app.route('/api/login', methods=['POST'])
+@rate_limiter.limit('login', user=json_field('username'))
 def login():
     """Kullanıcı girişi yapar ve JWT token döner"""
-    data = request.get_json()
+    data = request.get_json(silent=True)
     
-    if not data or 'username' not in data or 'password' not in data:
+    if not isinstance(data, dict) or 'username' not in data or 'password' not in data:
         return jsonify({"error": "Kullanıcı adı ve şifre gerekli"}), 400
     
     username = data['username']
     password = data['password']
+    if not isinstance(username, str) or not isinstance(password, str):
+        return jsonify({"error": "Kullanıcı adı ve şifre metin olmalı"}), 400
     
     # Kullanıcı doğrulama
-    if username not in USERS or USERS[username]['password'] != password:
+    if not user_store.verify_password(username, password):
+        event_journal.append('auth.login_failed', username, {"ip": request.remote_addr})
         return jsonify({"error": "Geçersiz kullanıcı adı veya şifre"}), 401
     
+    user_data = user_store.get_profile(username)
+    
     # JWT token oluştur
     access_token = create_access_token(
         identity=username,
-        additional_claims={"role": USERS[username]['role']}
+        additional_claims=role_claims(user_data)
     )
     refresh_token = create_refresh_token(identity=username)
+    event_journal.append('auth.login', username, {"ip": request.remote_addr})
     
     return jsonify({
         "message": "Giriş başarılı",
@@ -107,8 +298,8 @@ def login():
         "refresh_token": refresh_token,
         "user": {
             "username": username,
-            "role": USERS[username]['role'],
-            "email": USERS[username]['email']
+            "role": user_data['role'],
+            "email": user_data['email']
         },
         "token_info": {
             "access_token_expires_in": "15 minutes",
@@ -116,15 +307,34 @@ def login():
         }
     }), 200
 
+# Açık anahtarlar (JWKS)
+@app.route('/.well-known/jwks.json', methods=['GET'])
+@response_cache.cached('jwks', cache_control=f"public, max-age={app.config['JWKS_MAX_AGE']}")
+def jwks():
+    """Token'ları doğrulamak için açık anahtarları JWKS formatında döner"""
+    if signing_keys is None:
+        return jsonify({"error": "Server HS256 ile imzalıyor; açık anahtar yok"}), 404
+    
+    return jsonify(signing_keys.jwks()), 200
+
 # Token yenileme endpoint'i
+# IP sınırı token doğrulamasından önce uygulanır (geçersiz token'lar da sayılır);
+# kullanıcı sınırı ise doğrulanmış kimlikle, doğrulamadan sonra
 @app.route('/api/refresh', methods=['POST'])
+@rate_limiter.limit('refresh')
 @jwt_required(refresh=True)
+@rate_limiter.limit('refresh', ip=None, user=get_jwt_identity)
 def refresh():
     """Refresh token kullanarak yeni access token alır"""
     current_user = get_jwt_identity()
+    user_data = user_store.get_profile(current_user)
+    
+    if not user_data:
+        return jsonify({"error": "Kullanıcı bulunamadı"}), 404
+    
     new_access_token = create_access_token(
         identity=current_user,
-        additional_claims={"role": USERS[current_user]['role']}
+        additional_claims=role_claims(user_data)
     )
     
     return jsonify({
@@ -138,7 +348,7 @@ def refresh():
 def protected_endpoint():
     """JWT token ile korunan endpoint"""
     current_user = get_jwt_identity()
-    user_data = USERS.get(current_user)
+    user_data = user_store.get_profile(current_user)
     
     return jsonify({
         "message": "JWT token ile korunan endpoint'e erişildi",
@@ -159,7 +369,123 @@ def admin_endpoint():
         "message": "Admin endpoint'ine erişildi",
         "user": current_user,
         "sensitive_data": "Bu veri sadece admin'ler görebilir",
-        "all_users": list(USERS.keys())
+        "all_users": user_store.usernames()
+    }), 200
+
+# Token önbelleği istatistikleri
+@app.route('/api/admin/token-cache', methods=['GET'])
+@jwt_required()
+@require_role('admin')
+def token_cache_stats():
+    """Doğrulanmış token önbelleğinin hit/miss sayaçlarını döner"""
+    return jsonify(token_cache.stats()), 200
+
+# Profiler kontrolü
+@app.route('/api/admin/profiler', methods=['GET', 'POST'])
+@jwt_required()
+@require_role('admin')
+def profiler_control():
+    """Profiler'ı açar/kapatır (POST) veya durumunu döner (GET)"""
+    if request.method == 'POST':
+        try:
+            args = control_args(request.get_json(silent=True))
+            if args['enabled']:
+                profiler.start(args['sample_rate'], args['interval'])
+            else:
+                profiler.stop()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if args['reset']:
+            profiler.reset()
+    
+    return jsonify(profiler.status()), 200
+
+# Profiler çıktısı
+@app.route('/api/admin/profiler/folded', methods=['GET'])
+@jwt_required()
+@require_role('admin')
+def profiler_folded():
+    """Toplanan yığınları flamegraph için katlanmış (folded) metin olarak döner"""
+    return Response(profiler.folded(), mimetype='text/plain')
+
+# Yanıt sıkıştırma istatistikleri
+@app.route('/api/admin/compression', methods=['GET'])
+@jwt_required()
+@require_role('admin')
+def compression_stats():
+    """Sıkıştırılan yanıt sayılarını, byte kazancını ve önbellek durumunu döner"""
+    return jsonify(compressor.stats()), 200
+
+# Authentication istatistikleri
+@app.route('/api/admin/auth-stats', methods=['GET'])
+@jwt_required()
+@require_role('admin')
+def auth_stats():
+    """Middleware'in reddettiği ve rate limit'e takılan istek sayılarını döner"""
+    return jsonify(dict(auth.stats(), rate_limited=rate_limiter.stats())), 200
+
+# Olay günlüğü sorgusu
+@app.route('/api/admin/events', methods=['GET'])
+@jwt_required()
+@require_role('admin')
+def list_events():
+    """Olay günlüğünü zaman aralığı, kaynak ve türe göre sorgular"""
+    try:
+        args = query_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    events = event_journal.query(**args)
+    return jsonify({"events": events, "count": len(events)}), 200
+
+# Toplu kullanıcı yükleme
+@app.route('/api/admin/users/import', methods=['POST'])
+@jwt_required()
+@require_role('admin')
+def import_users():
+    """JSON dizisi veya NDJSON gövdesindeki kullanıcıları tek transaction'da yükler
+
+    Geçersiz bir kayıtta hiçbir kullanıcı yazılmaz ve 400 döner.
+    """
+    try:
+        imported = user_store.import_users(iter_batch(max_items=None), roles=ROLE_HIERARCHY)
+    except BatchError as e:
+        return jsonify({"error": str(e)}), 400
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        return jsonify({"error": f"Geçersiz kullanıcı kaydı: {e}"}), 400
+    
+    response_cache.invalidate('users')
+    
+    return jsonify({
+        "message": "Kullanıcılar yüklendi",
+        "imported": imported,
+        "total_users": len(user_store)
+    }), 200
+
+# Kullanıcı rolü değiştirme
+@app.route('/api/admin/users/<username>/role', methods=['PUT'])
+@jwt_required()
+@require_role('admin')
+def set_user_role(username):
+    """Kullanıcının rolünü değiştirir (rol versiyonu artırılır)"""
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict) or not isinstance(data.get('role'), str) \
+            or data['role'] not in ROLE_HIERARCHY:
+        return jsonify({
+            "error": "Geçerli bir rol gerekli",
+            "roles": list(ROLE_HIERARCHY)
+        }), 400
+
+    if not user_store.set_role(username, data['role']):
+        return jsonify({"error": "Kullanıcı bulunamadı"}), 404
+    
+    response_cache.invalidate('users')
+
+    return jsonify({
+        "message": "Kullanıcı rolü güncellendi",
+        "username": username,
+        "role": data['role']
     }), 200
 
 # User profil endpoint'i
@@ -168,7 +494,7 @@ def admin_endpoint():
 def get_profile():
     """Kullanıcı profil bilgilerini döner"""
     current_user = get_jwt_identity()
-    user_data = USERS.get(current_user)
+    user_data = user_store.get_profile(current_user)
     
     return jsonify({
         "username": current_user,
@@ -181,8 +507,12 @@ def get_profile():
 @jwt_required()
 def logout():
     """JWT token'ı iptal eder"""
-    jti = get_jwt()["jti"]
-    REVOKED_TOKENS.add(jti)
+    jwt_data = get_jwt()
+    try:
+        revocation_store.revoke(jwt_data["jti"], jwt_data["exp"])
+    except RevocationStoreFull:
+        return jsonify({"error": "Token iptal edilemedi, iptal deposu dolu"}), 503
+    event_journal.append('auth.logout', get_jwt_identity(), {"jti": jwt_data["jti"]})
     
     return jsonify({
         "message": "Başarıyla çıkış yapıldı",
@@ -207,51 +537,82 @@ def token_info():
 
 # Kullanıcı listesi (demo amaçlı)
 @app.route('/api/users', methods=['GET'])
+@response_cache.cached('users', version=user_store.generation, variant=wants_ndjson)
 def list_users():
-    """Kullanıcı listesini döner (demo amaçlı)"""
+    """Kullanıcı listesini döner (demo amaçlı)
+
+    ?limit=&cursor= ile sayfalanır, ?role= ile filtrelenir,
+    ?format=ndjson ile tüm sonuçlar satır satır akıtılır.
+    """
+    role = request.args.get('role')
+    
+    try:
+        limit, after = page_args(str)
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    if wants_ndjson():
+        return ndjson_response(user_store.iter_users(role=role, after=after))
+    
+    users, next_key = user_store.page_users(role=role, after=after, limit=limit)
+    
     return jsonify({
-        "users": [
-            {
-                "username": username,
-                "role": data['role'],
-                "email": data['email']
-            }
-            for username, data in USERS.items()
-        ]
+        "users": users,
+        "next_cursor": encode_cursor(next_key) if next_key is not None else None
     }), 200
 
 if __name__ == '__main__':
     print("=" * 70)
     print("🔐 JWT Token Authentication Server")
     print("=" * 70)
-    print("\n👥 Kullanıcılar:")
-    for username, data in USERS.items():
+    print("\n👥 Demo Kullanıcılar:")
+    for username, data in DEMO_USERS.items():
         print(f"  • {username} / {data['password']} ({data['role']})")
+    print(f"  Toplam kullanıcı: {len(user_store)} ({app.config['USER_DB_PATH']})")
+    
+    print("\n🔒 Şifre Hash Maliyeti:")
+    print(f"  • PBKDF2-SHA256, {user_store.iterations} iterasyon: "
+          f"{user_store.measure_hash_cost() * 1000:.1f} ms / hash")
     
     print("\n🌐 Endpoints:")
     print("  • GET  /api/public      - Public (token gerektirmez)")
+    print("  • GET  /.well-known/jwks.json - Açık anahtarlar (JWT_KEYS_DIR ile)")
     print("  • POST /api/login       - Login (JWT token al)")
     print("  • POST /api/refresh     - Token yenile")
     print("  • GET  /api/protected   - Protected (JWT gerekli)")
     print("  • GET  /api/admin       - Admin (admin JWT gerekli)")
+    print("  • GET  /api/admin/token-cache - Token önbelleği istatistikleri (admin)")
+    print("  • GET  /api/admin/auth-stats - Reddedilen istek sayıları (admin)")
+    print("  • POST /api/admin/profiler - Profiler aç/kapat (admin)")
+    print("  • GET  /api/admin/profiler/folded - Flamegraph yığınları (admin)")
+    print("  • GET  /api/admin/compression - Yanıt sıkıştırma istatistikleri (admin)")
+    print("  • GET  /api/admin/events - Olay günlüğü sorgusu (admin)")
+    print("  • POST /api/admin/users/import - Toplu kullanıcı yükleme (admin)")
+    print("  • PUT  /api/admin/users/<username>/role - Rol değiştir (admin)")
     print("  • GET  /api/profile     - Profil bilgisi")
     print("  • POST /api/logout      - Logout (token iptal)")
     print("  • GET  /api/token-info  - Token bilgisi")
     print("  • GET  /api/users       - Kullanıcı listesi")
+    print("  • GET  /metrics         - Prometheus metrikleri")
     
     print("\n⏱️  Token Süreleri:")
     print("  • Access Token: 15 dakika")
     print("  • Refresh Token: 30 gün")
+    if signing_keys is not None:
+        print(f"  • İmzalama: {signing_keys.active.algorithm} (kid={signing_keys.active_kid})")
+    else:
+        print("  • İmzalama: HS256 (JWT_SECRET_KEY)")
+    print(f"  • JSON: {app.json.backend}")
     
     print("\n💡 Kullanım:")
-    print('  1. Login: curl -X POST http://localhost:5002/api/login \\')
+    print(f'  1. Login: curl -X POST http://localhost:{server_args.port}/api/login \\')
     print('       -H "Content-Type: application/json" \\')
     print('       -d \'{"username":"admin","password":"admin123"}\'')
     print('  2. Protected: curl -H "Authorization: Bearer <token>" \\')
-    print('       http://localhost:5002/api/protected')
+    print(f'       http://localhost:{server_args.port}/api/protected')
     
     print("\n" + "=" * 70)
-    print("🚀 Server başlatılıyor: http://localhost:5002")
+    print(f"🚀 Server başlatılıyor: http://{server_args.host}:{server_args.port}")
     print("=" * 70 + "\n")
     
-    app.run(host='0.0.0.0', port=5002, debug=True)
+    serve(app, server_args)
@@ -0,0 +1,196 @@
+"""
+JWT İmzalama Anahtarları
+RS256 / EdDSA ile asimetrik imzalama, kid tabanlı anahtar rotasyonu ve JWKS
+
+  • Anahtarlar açılışta bir kez PEM dosyalarından okunur; imzalama ve doğrulamada
+    ayrıştırılmış anahtar nesneleri kullanılır (istek başına PEM ayrıştırması yapılmaz)
+  • Her token header'ına imzalayan anahtarın kid değeri yazılır; doğrulamada anahtar
+    kid ile seçilir, böylece rotasyondan önce imzalanmış token'lar geçerli kalır
+  • Diğer servisler /.well-known/jwks.json üzerinden açık anahtarları alıp token'ları
+    kendileri doğrulayabilir
+
+Anahtar klasörü:
+  <kid>.pem       - Özel anahtar (imzalama + doğrulama)
+  <kid>.pub.pem   - Yalnızca açık anahtar (emekliye ayrılmış anahtar, sadece doğrulama)
+  Aynı kid için ikisi birden varsa (örn. yarım kalmış retire) özel anahtar kullanılır;
+  açık anahtar özel anahtarla eşleşmiyorsa açılış hata verir.
+
+Yeni anahtar oluşturma:
+  python signing_keys.py generate --dir keys --type ed25519
+"""
+
+import argparse
+import os
+import time
+
+from jwt.algorithms import has_crypto
+from jwt.exceptions import InvalidSignatureError
+
+if has_crypto:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+    from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+PRIVATE_SUFFIX = ".pem"
+PUBLIC_SUFFIX = ".pub.pem"
+
+RSA_KEY_SIZE = 3072
+
+
+def _require_crypto():
+    if not has_crypto:
+        raise RuntimeError("Asimetrik JWT imzalama için cryptography gerekli: pip install cryptography")
+
+
+def _algorithm(key):
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return "RS256"
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    raise ValueError(f"Desteklenmeyen anahtar türü: {type(key).__name__}")
+
+
+def _public_bytes(public_key):
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+
+class SigningKey:
+    """Ayrıştırılmış bir imzalama / doğrulama anahtarı"""
+
+    __slots__ = ("kid", "algorithm", "private_key", "public_key")
+
+    def __init__(self, kid, private_key=None, public_key=None):
+        self.kid = kid
+        self.private_key = private_key
+        self.public_key = public_key if public_key is not None else private_key.public_key()
+        self.algorithm = _algorithm(self.public_key)
+
+    def to_jwk(self):
+        if self.algorithm == "RS256":
+            jwk = RSAAlgorithm.to_jwk(self.public_key, as_dict=True)
+        else:
+            jwk = OKPAlgorithm.to_jwk(self.public_key, as_dict=True)
+        jwk.update(kid=self.kid, alg=self.algorithm, use="sig")
+        return jwk
+
+
+class KeySet:
+    """kid -> anahtar eşlemesi ve imzalamada kullanılan aktif anahtar"""
+
+    def __init__(self, keys, active_kid=None):
+        self.keys = {key.kid: key for key in keys}
+        signing = sorted(key.kid for key in keys if key.private_key is not None)
+        if not signing:
+            raise ValueError("İmzalama için en az bir özel anahtar gerekli")
+        # Aktif anahtar verilmezse adı en büyük olan (en yeni) özel anahtar kullanılır
+        self.active_kid = active_kid or signing[-1]
+        if self.active_kid not in signing:
+            raise ValueError(f"Aktif anahtar bulunamadı veya özel anahtarı yok: {self.active_kid}")
+        self._jwks = {"keys": [self.keys[kid].to_jwk() for kid in sorted(self.keys)]}
+
+    @classmethod
+    def load(cls, directory, active_kid=None):
+        """Klasördeki PEM dosyalarını bir kez okuyup KeySet oluşturur"""
+        _require_crypto()
+        private, public = {}, {}
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if name.endswith(PUBLIC_SUFFIX):
+                kid = name[:-len(PUBLIC_SUFFIX)]
+                with open(path, "rb") as f:
+                    public[kid] = SigningKey(kid, public_key=serialization.load_pem_public_key(f.read()))
+            elif name.endswith(PRIVATE_SUFFIX):
+                kid = name[:-len(PRIVATE_SUFFIX)]
+                with open(path, "rb") as f:
+                    private[kid] = SigningKey(kid, private_key=serialization.load_pem_private_key(f.read(), None))
+        for kid in private.keys() & public.keys():
+            if _public_bytes(private[kid].public_key) != _public_bytes(public[kid].public_key):
+                raise ValueError(f"{kid}{PUBLIC_SUFFIX} aynı kid'in özel anahtarıyla eşleşmiyor")
+        return cls(list({**public, **private}.values()), active_kid)
+
+    @property
+    def active(self):
+        return self.keys[self.active_kid]
+
+    @property
+    def algorithms(self):
+        return sorted({key.algorithm for key in self.keys.values()})
+
+    def jwks(self):
+        """JWKS (RFC 7517) gösterimi; açılışta bir kez oluşturulur"""
+        return self._jwks
+
+    def decode_key(self, jwt_header, jwt_payload):
+        key = self.keys.get(jwt_header.get("kid"))
+        if key is None or jwt_header.get("alg") != key.algorithm:
+            raise InvalidSignatureError("Bilinmeyen imzalama anahtarı")
+        return key.public_key
+
+    def install(self, app, jwt_manager):
+        """Flask-JWT-Extended'ı bu anahtarlarla imzalayıp doğrulayacak şekilde ayarlar"""
+        app.config["JWT_ALGORITHM"] = self.active.algorithm
+        app.config["JWT_DECODE_ALGORITHMS"] = self.algorithms
+        jwt_manager.encode_key_loader(lambda identity: self.active.private_key)
+        jwt_manager.decode_key_loader(self.decode_key)
+        jwt_manager.additional_headers_loader(lambda identity: {"kid": self.active_kid})
+
+
+def generate_key(directory, key_type="ed25519", kid=None):
+    """Yeni bir özel anahtar oluşturup <kid>.pem olarak kaydeder ve kid'i döner"""
+    _require_crypto()
+    if key_type == "rsa":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=RSA_KEY_SIZE)
+    elif key_type == "ed25519":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        raise ValueError(f"Desteklenmeyen anahtar türü: {key_type}")
+
+    kid = kid or time.strftime("%Y%m%d%H%M%S", time.gmtime())
+    os.makedirs(directory, exist_ok=True)
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    fd = os.open(os.path.join(directory, kid + PRIVATE_SUFFIX), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(pem)
+    return kid
+
+
+def retire_key(directory, kid):
+    """Özel anahtarı siler, yalnızca açık anahtarını (doğrulama için) bırakır"""
+    _require_crypto()
+    path = os.path.join(directory, kid + PRIVATE_SUFFIX)
+    with open(path, "rb") as f:
+        private_key = serialization.load_pem_private_key(f.read(), None)
+    with open(os.path.join(directory, kid + PUBLIC_SUFFIX), "wb") as f:
+        f.write(_public_bytes(private_key.public_key()))
+    os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JWT imzalama anahtarı yönetimi")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    generate = subcommands.add_parser("generate", help="Yeni imzalama anahtarı oluştur")
+    generate.add_argument("--dir", default="keys")
+    generate.add_argument("--type", choices=("ed25519", "rsa"), default="ed25519")
+    generate.add_argument("--kid")
+    retire = subcommands.add_parser("retire", help="Anahtarı yalnızca doğrulama için bırak")
+    retire.add_argument("--dir", default="keys")
+    retire.add_argument("kid")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        kid = generate_key(args.dir, args.type, args.kid)
+        print(f"🔑 Yeni anahtar: {kid} ({args.type}) → {args.dir}")
+    else:
+        retire_key(args.dir, args.kid)
+        print(f"📦 {args.kid} yalnızca doğrulama için bırakıldı")
+
+
+if __name__ == "__main__":
+    main()
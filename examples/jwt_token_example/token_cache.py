@@ -0,0 +1,117 @@
+"""
+Doğrulanmış JWT Önbelleği
+Aynı token ile gelen isteklerde imza doğrulama ve claim çözümlemeyi atlar
+
+Önbellek anahtarı ham token'ın SHA-256 özetidir; ham token bellekte tutulmaz.
+Kayıtlar token'ın exp anına kadar geçerlidir ve boyut sınırı aşıldığında en
+uzun süredir kullanılmayan (LRU) kayıt atılır.
+
+İptal kontrolü önbellek kilidi dışında yapılır (iptal deposu SQLite olabilir).
+Flask-JWT-Extended'ın token_in_blocklist_loader'ı her istekte (önbellekten gelen
+claim'ler dahil) çalıştığı için server is_revoked vermez; iptal bir kez sorgulanır.
+"""
+
+from collections import OrderedDict
+import hashlib
+import threading
+import time
+
+from flask_jwt_extended import JWTManager
+
+DEFAULT_MAX_SIZE = 10_000
+
+
+class VerifiedTokenCache:
+    """Token özeti -> çözümlenmiş claim'ler için LRU önbellek"""
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, is_revoked=None):
+        self.max_size = max_size
+        self.is_revoked = is_revoked
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # digest -> claims
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(encoded_token):
+        return hashlib.sha256(encoded_token.encode()).digest()
+
+    def get(self, encoded_token):
+        """Geçerli bir kayıt varsa claim'leri, yoksa None döner"""
+        digest = self._digest(encoded_token)
+        with self._lock:
+            claims = self._entries.get(digest)
+            if claims is not None and claims["exp"] <= time.time():
+                del self._entries[digest]
+                claims = None
+            if claims is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+
+        # İptal deposu kilit tutulmadan sorgulanır
+        if self._revoked(claims):
+            with self._lock:
+                if self._entries.get(digest) is claims:
+                    del self._entries[digest]
+                self.hits -= 1
+                self.misses += 1
+            return None
+        return claims
+
+    def put(self, encoded_token, claims):
+        """Doğrulanmış claim'leri exp anına kadar önbelleğe alır"""
+        if "exp" not in claims or self.max_size <= 0 or self._revoked(claims):
+            return
+        digest = self._digest(encoded_token)
+        with self._lock:
+            self._entries[digest] = claims
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _revoked(self, claims):
+        jti = claims.get("jti")
+        return self.is_revoked is not None and jti is not None and self.is_revoked(jti)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class CachingJWTManager(JWTManager):
+    """Token çözümlemeyi VerifiedTokenCache üzerinden yapan JWTManager
+
+    timer: verilirse token çözümlemeyi saran decorator (örn. metrics.timed("auth"))
+    """
+
+    def __init__(self, app=None, token_cache=None, timer=None, **kwargs):
+        self.token_cache = token_cache or VerifiedTokenCache()
+        if timer is not None:
+            self._decode_jwt_from_config = timer(self._decode_jwt_from_config)
+        super().__init__(app, **kwargs)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # CSRF doğrulaması veya süresi dolmuş token'lar önbelleğe uğramaz
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        claims = self.token_cache.get(encoded_token)
+        if claims is None:
+            claims = super()._decode_jwt_from_config(encoded_token)
+            self.token_cache.put(encoded_token, claims)
+        return claims
@@ -0,0 +1,379 @@
+"""
+Kullanıcı Deposu (User Store)
+SQLite tabanlı, şifreleri tuzlu PBKDF2 ile saklayan kullanıcı deposu
+
+  • username PRIMARY KEY olduğu için kullanıcı araması indeks üzerinden yapılır
+  • Şifreler "pbkdf2_sha256$<iterasyon>$<salt>$<hash>" formatında saklanır
+  • Her korumalı istekte okunan rol/e-posta bilgisi küçük bir LRU önbellekte tutulur
+  • Rol her değiştiğinde role_version artırılır (token'daki role_ver claim'i ile karşılaştırılır)
+  • import_users() ile binlerce kullanıcı tek transaction'da yüklenir; geçersiz bir kayıtta
+    hiçbir kullanıcı yazılmaz
+  • Listeleme username sırasıyla keyset sayfalama ile yapılır; rol filtresi indekslidir
+  • Kullanıcı listesi her değiştiğinde ortak bir sayaç artırılır (generation())
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+# PBKDF2-SHA256 iterasyon sayısı (USER_HASH_ITERATIONS ile değiştirilebilir)
+DEFAULT_HASH_ITERATIONS = 600_000
+
+# Kabul edilen iterasyon aralığı; içe aktarılan bir hash login başına
+# sınırsız CPU harcatamaz
+MIN_HASH_ITERATIONS = 1_000
+MAX_HASH_ITERATIONS = 2_000_000
+
+HASH_ALGORITHM = "pbkdf2_sha256"
+SALT_BYTES = 16
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 30  # saniye
+
+IMPORT_BATCH_SIZE = 1000
+
+# iter_users() her sorguda okuduğu satır sayısı
+ITER_CHUNK_SIZE = 500
+
+
+def _b64encode(data):
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data):
+    return base64.b64decode(data + "=" * (-len(data) % 4), validate=True)
+
+
+def hash_password(password, iterations=DEFAULT_HASH_ITERATIONS):
+    """Şifreyi rastgele salt ile PBKDF2-SHA256 kullanarak hash'ler"""
+    salt = secrets.token_bytes(SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{HASH_ALGORITHM}${iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def parse_password_hash(encoded):
+    """"pbkdf2_sha256$<iterasyon>$<salt>$<hash>" formatını çözer
+
+    (iterasyon, salt, hash) döner; format geçersizse ValueError fırlatır.
+    """
+    if not isinstance(encoded, str):
+        raise ValueError("password_hash metin olmalı")
+    parts = encoded.split("$")
+    if len(parts) != 4 or parts[0] != HASH_ALGORITHM:
+        raise ValueError(f"password_hash {HASH_ALGORITHM}$<iterasyon>$<salt>$<hash> formatında olmalı")
+    try:
+        iterations = int(parts[1])
+        salt = _b64decode(parts[2])
+        digest = _b64decode(parts[3])
+    except ValueError:
+        raise ValueError("password_hash iterasyon, salt veya hash alanı geçersiz") from None
+    if not salt or not digest:
+        raise ValueError("password_hash iterasyon, salt veya hash alanı geçersiz")
+    if not MIN_HASH_ITERATIONS <= iterations <= MAX_HASH_ITERATIONS:
+        raise ValueError(
+            f"password_hash iterasyon sayısı {MIN_HASH_ITERATIONS}-{MAX_HASH_ITERATIONS} "
+            "aralığında olmalı"
+        )
+    return iterations, salt, digest
+
+
+def check_password(password, encoded):
+    """Şifreyi saklanan hash ile sabit zamanlı karşılaştırır
+
+    Hash çözülemezse (bozuk içe aktarılmış kayıt) doğrulama başarısız sayılır.
+    """
+    try:
+        iterations, salt, expected = parse_password_hash(encoded)
+    except ValueError:
+        return False
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return hmac.compare_digest(digest, expected)
+
+
+def hash_iterations(encoded):
+    """Saklanan hash'in iterasyon sayısını döner"""
+    return int(encoded.split("$")[1])
+
+
+class UserStore:
+    """SQLite tabanlı kullanıcı deposu"""
+
+    def __init__(self, path, iterations=DEFAULT_HASH_ITERATIONS,
+                 cache_size=DEFAULT_CACHE_SIZE, cache_ttl=DEFAULT_CACHE_TTL):
+        if not MIN_HASH_ITERATIONS <= iterations <= MAX_HASH_ITERATIONS:
+            raise ValueError(
+                f"iterations {MIN_HASH_ITERATIONS}-{MAX_HASH_ITERATIONS} aralığında olmalı"
+            )
+        self.path = path
+        self.iterations = iterations
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._local = threading.local()
+        self._cache = OrderedDict()  # username -> (expires_at, profile)
+        self._cache_lock = threading.Lock()
+        # Bilinmeyen kullanıcılar için de aynı maliyette doğrulama yapılır;
+        # böylece yanıt süresinden kullanıcının var olup olmadığı anlaşılmaz
+        self._dummy_hash = hash_password(secrets.token_urlsafe(16), iterations)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                " username TEXT PRIMARY KEY,"
+                " password_hash TEXT NOT NULL,"
+                " role TEXT NOT NULL,"
+                " email TEXT NOT NULL,"
+                " role_version INTEGER NOT NULL DEFAULT 1"
+                ") WITHOUT ROWID"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(users)")}
+            if "role_version" not in columns:
+                conn.execute(
+                    "ALTER TABLE users ADD COLUMN role_version INTEGER NOT NULL DEFAULT 1"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_users_role ON users (role, username)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS store_meta ("
+                " key TEXT PRIMARY KEY,"
+                " value INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('generation', 0)"
+            )
+
+    def _connection(self):
+        # sqlite3 bağlantıları thread'ler arasında paylaşılmaz
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _bump_generation(conn):
+        conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'generation'")
+
+    # --- Okuma ---
+
+    def generation(self):
+        """Kullanıcı listesi her değiştiğinde artan sayaç (tüm process'lerde ortak)"""
+        return self._connection().execute(
+            "SELECT value FROM store_meta WHERE key = 'generation'"
+        ).fetchone()[0]
+
+    def get_profile(self, username):
+        """Kullanıcının rol, rol versiyonu ve e-posta bilgisini döner (önbellekli)"""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(username)
+            if cached is not None and cached[0] > now:
+                self._cache.move_to_end(username)
+                return cached[1]
+
+        row = self._connection().execute(
+            "SELECT role, email, role_version FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        profile = {"role": row[0], "email": row[1], "role_version": row[2]}
+        with self._cache_lock:
+            self._cache[username] = (now + self.cache_ttl, profile)
+            self._cache.move_to_end(username)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return profile
+
+    def verify_password(self, username, password):
+        """Kullanıcı adı ve şifre doğruysa True döner"""
+        row = self._connection().execute(
+            "SELECT password_hash FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            check_password(password, self._dummy_hash)
+            return False
+
+        encoded = row[0]
+        if not check_password(password, encoded):
+            return False
+
+        # Maliyet ayarı değiştiyse şifreyi yeni iterasyon sayısı ile yeniden hash'le
+        if hash_iterations(encoded) != self.iterations:
+            self.set_password(username, password)
+        return True
+
+    def usernames(self):
+        return [row[0] for row in self._connection().execute(
+            "SELECT username FROM users ORDER BY username"
+        )]
+
+    def page_users(self, role=None, after=None, limit=100):
+        """username sırasıyla bir sayfa kullanıcı döner: (kullanıcılar, sonraki_anahtar)
+
+        after, bir önceki sayfanın son username'idir; sonraki_anahtar son sayfada None olur.
+        """
+        conditions, params = [], []
+        if role is not None:
+            conditions.append("role = ?")
+            params.append(role)
+        if after is not None:
+            conditions.append("username > ?")
+            params.append(after)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        rows = self._connection().execute(
+            f"SELECT username, role, email FROM users{where} ORDER BY username LIMIT ?",
+            (*params, limit + 1)
+        ).fetchall()
+        users = [
+            {"username": username, "role": role, "email": email}
+            for username, role, email in rows[:limit]
+        ]
+        next_key = users[-1]["username"] if len(rows) > limit else None
+        return users, next_key
+
+    def iter_users(self, role=None, after=None):
+        """Tüm kullanıcıları parça parça okuyan generator"""
+        while True:
+            users, after = self.page_users(role=role, after=after, limit=ITER_CHUNK_SIZE)
+            yield from users
+            if after is None:
+                return
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    # --- Yazma ---
+
+    def add_user(self, username, password, role, email):
+        self.import_users([{
+            "username": username,
+            "password": password,
+            "role": role,
+            "email": email
+        }])
+
+    def set_password(self, username, password):
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE users SET password_hash = ? WHERE username = ?",
+                (hash_password(password, self.iterations), username)
+            )
+
+    def set_role(self, username, role):
+        """Kullanıcının rolünü değiştirir ve rol versiyonunu artırır
+
+        Kullanıcı yoksa False döner.
+        """
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE users SET role = ?, role_version = role_version + (role != ?) "
+                "WHERE username = ?",
+                (role, role, username)
+            )
+            if cursor.rowcount:
+                self._bump_generation(conn)
+        self.invalidate([username])
+        return cursor.rowcount > 0
+
+    def import_users(self, users, workers=None, roles=None):
+        """Kullanıcıları tek transaction'da ekler veya günceller (rolü değişenlerin
+        role_version değeri artırılır)
+
+        Her kayıt username, role, email ile birlikte "password" (düz metin) ya da
+        "password_hash" (hash_password() çıktısı) içermelidir; roles verilirse rol bu
+        kümede olmalıdır. Kayıtlar IMPORT_BATCH_SIZE'lık gruplar halinde okunup yazılır,
+        ancak commit yalnızca sonda yapılır: geçersiz bir kayıt (veya okuma hatası)
+        tüm yüklemeyi geri alır. Düz metin şifreler thread havuzunda hash'lenir;
+        pbkdf2_hmac hesaplama sırasında GIL'i bırakır.
+        Eklenen/güncellenen kullanıcı sayısını döner.
+        """
+        total = 0
+        conn = self._connection()
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool, conn:
+            batch = []
+            for user in users:
+                batch.append(user)
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    total += self._import_batch(conn, batch, pool, total, roles)
+                    batch = []
+            if batch:
+                total += self._import_batch(conn, batch, pool, total, roles)
+            if total:
+                self._bump_generation(conn)
+        self.invalidate()
+        return total
+
+    def _password_hash(self, user):
+        if "password_hash" in user:
+            return user["password_hash"]
+        return hash_password(user["password"], self.iterations)
+
+    def _import_batch(self, conn, batch, pool, offset, roles):
+        for index, user in enumerate(batch, offset):
+            if not isinstance(user, dict):
+                raise ValueError(f"{index}. kayıt bir JSON nesnesi olmalı")
+            if not user.get("username") or not user.get("role") or "email" not in user:
+                raise ValueError("Her kullanıcı için username, role ve email gerekli")
+            if "password_hash" not in user and "password" not in user:
+                raise ValueError(f"{user['username']} için password veya password_hash gerekli")
+            if "password_hash" in user:
+                try:
+                    parse_password_hash(user["password_hash"])
+                except ValueError as e:
+                    raise ValueError(f"{user['username']}: {e}") from None
+            elif not isinstance(user["password"], str):
+                raise ValueError(f"{user['username']} için password metin olmalı")
+            if not all(isinstance(user[field], str) for field in ("username", "role", "email")):
+                raise ValueError(f"{user['username']}: username, role ve email metin olmalı")
+            if roles is not None and user["role"] not in roles:
+                raise ValueError(f"{user['username']}: bilinmeyen rol {user['role']}")
+
+        hashes = list(pool.map(self._password_hash, batch))
+        rows = [
+            (user["username"], password_hash, user["role"], user["email"])
+            for user, password_hash in zip(batch, hashes)
+        ]
+        conn.executemany(
+            "INSERT INTO users (username, password_hash, role, email) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (username) DO UPDATE SET"
+            " password_hash = excluded.password_hash,"
+            " email = excluded.email,"
+            " role_version = role_version + (role != excluded.role),"
+            " role = excluded.role",
+            rows
+        )
+        return len(rows)
+
+    def invalidate(self, usernames=None):
+        """Önbellekteki kayıtları siler (usernames=None ise hepsini)"""
+        with self._cache_lock:
+            if usernames is None:
+                self._cache.clear()
+                return
+            for username in usernames:
+                self._cache.pop(username, None)
+
+    # --- Ölçüm ---
+
+    def measure_hash_cost(self, samples=3):
+        """Mevcut iterasyon ayarı ile tek bir şifre hash'inin ortalama süresini döner (saniye)"""
+        start = time.perf_counter()
+        for _ in range(samples):
+            hash_password("benchmark-password", self.iterations)
+        return (time.perf_counter() - start) / samples
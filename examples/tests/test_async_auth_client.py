@@ -0,0 +1,72 @@
+"""Async auth client: 401 sonrası yenileme, eşzamanlı task'larda tek yenileme ve kapatma"""
+
+import asyncio
+import time
+
+import pytest
+import requests
+
+pytest.importorskip("aiohttp")
+
+from auth_client import AsyncBearerClient, AsyncJWTClient
+
+from conftest import ADMIN_TOKEN, live_url
+
+
+def test_revoked_token_is_renewed_after_401(jwt_url):
+    async def scenario():
+        async with AsyncJWTClient(jwt_url, "admin", "admin123") as client:
+            await client.login()
+            token = await client.access_token()
+            requests.post(f"{jwt_url}/logout", headers={"Authorization": f"Bearer {token}"})
+            response = await client.get("/protected")
+            assert response.status == 200
+            assert (await response.json())["user"] == "admin"
+            assert await client.access_token() != token
+            assert client.stats() == {"logins": 1, "refreshes": 1}
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_tasks_share_one_refresh(jwt_url):
+    async def scenario():
+        async with AsyncJWTClient(jwt_url, "admin", "admin123") as client:
+            await client.login()
+            client.tokens.access_expires_at = time.time()  # süresi dolmak üzere
+            responses = await asyncio.gather(*(client.get("/protected") for _ in range(8)))
+            assert [response.status for response in responses] == [200] * 8
+            assert client.stats() == {"logins": 1, "refreshes": 1}
+
+    asyncio.run(scenario())
+
+
+def test_close_releases_session(jwt_url):
+    async def scenario():
+        # Hiç istek göndermemiş client'ı kapatmak hata vermez
+        await AsyncJWTClient(jwt_url).close()
+
+        async with AsyncJWTClient(jwt_url, "admin", "admin123") as client:
+            assert (await client.get("/protected")).status == 200
+            session = client.session
+        assert session.closed
+        # Kapatıldıktan sonraki istek yeni bir oturum açar
+        assert (await client.get("/protected")).status == 200
+        assert client.session is not session
+        await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_async_bearer_client(bearer_server):
+    server, url = live_url(bearer_server.app)
+
+    async def scenario():
+        async with AsyncBearerClient(url, ADMIN_TOKEN) as client:
+            assert (await client.get("/protected")).status == 200
+        async with AsyncBearerClient(url, "gecersiz") as client:
+            assert (await client.get("/protected")).status == 401
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        server.shutdown()
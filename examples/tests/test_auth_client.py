@@ -0,0 +1,97 @@
+"""Auth client: token süreleri, tek seferlik yenileme, 401 sonrası tekrar deneme ve hata durumları"""
+
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from auth_client import AuthError, BearerClient, JWTClient, TokenPair, token_expiry
+
+from conftest import ADMIN_TOKEN, live_url
+
+
+def fake_jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"baslik.{payload}.imza"
+
+
+def test_token_expiry():
+    assert token_expiry(fake_jwt(1234)) == 1234.0
+    assert token_expiry("jwt-degil") is None
+
+
+def test_token_pair_validity():
+    now = 1000
+    pair = TokenPair(fake_jwt(now + 30), fake_jwt(now + 3600))
+    assert not pair.access_valid(margin=60, now=now)
+    assert pair.access_valid(margin=10, now=now)
+    assert pair.refresh_valid(now=now)
+    assert not pair.refresh_valid(now=now + 7200)
+    assert not TokenPair(fake_jwt(now)).refresh_valid(now=now)
+    # exp okunamazsa süre kontrolü server'a bırakılır
+    assert TokenPair("opak").access_valid(now=now)
+
+
+def test_login_and_request(jwt_url):
+    with JWTClient(jwt_url, "admin", "admin123") as client:
+        assert client.get("/protected").status_code == 200
+        assert client.stats() == {"logins": 1, "refreshes": 0}
+
+
+def test_wrong_password_raises(jwt_url):
+    with JWTClient(jwt_url, "admin", "yanlis") as client:
+        with pytest.raises(AuthError) as error:
+            client.get("/protected")
+        assert error.value.status_code == 401
+
+
+def test_missing_credentials_raise(jwt_url):
+    with JWTClient(jwt_url) as client:
+        with pytest.raises(AuthError):
+            client.access_token()
+
+
+def test_expiring_token_is_refreshed_once(jwt_url):
+    with JWTClient(jwt_url, "admin", "admin123") as client:
+        client.login()
+        client.tokens.access_expires_at = time.time()  # süresi dolmak üzere
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.get("/protected").status_code))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [200] * 8
+        assert client.stats() == {"logins": 1, "refreshes": 1}
+
+
+def test_revoked_token_triggers_single_renewal(jwt_url):
+    with JWTClient(jwt_url, "admin", "admin123") as client:
+        client.login()
+        token = client.access_token()
+        client.session.post(f"{jwt_url}/logout", headers={"Authorization": f"Bearer {token}"})
+        assert client.get("/protected").status_code == 200
+        assert client.access_token() != token
+        assert client.stats()["refreshes"] == 1
+
+
+def test_logout_forgets_tokens(jwt_url):
+    with JWTClient(jwt_url, "admin", "admin123") as client:
+        client.login()
+        assert client.logout().status_code == 200
+        assert client.tokens is None
+        assert client.logout() is None
+
+
+def test_bearer_client(bearer_server):
+    server, url = live_url(bearer_server.app)
+    try:
+        with BearerClient(url, ADMIN_TOKEN) as client:
+            assert client.get("/protected").status_code == 200
+        with BearerClient(url, "gecersiz") as client:
+            assert client.get("/protected").status_code == 401
+    finally:
+        server.shutdown()
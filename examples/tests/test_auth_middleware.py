@@ -0,0 +1,76 @@
+"""Authentication middleware: header ayrıştırma, önceden serileştirilmiş red yanıtları ve sayaçlar"""
+
+from datetime import timedelta
+
+from flask_jwt_extended import create_access_token
+import pytest
+
+from common.auth_middleware import parse_bearer
+
+from conftest import BEARER_ADMIN, BEARER_USER, login
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, (None, "missing_header")),
+    ("", (None, "missing_header")),
+    ("Bearer", (None, "malformed_header")),
+    ("Bearer ", (None, "malformed_header")),
+    ("Bearer a b", (None, "malformed_header")),
+    ("Basic abc", (None, "invalid_scheme")),
+    ("bearer abc", ("abc", None)),
+    ("Bearer abc", ("abc", None)),
+])
+def test_parse_bearer(header, expected):
+    assert parse_bearer(header) == expected
+
+
+def test_bearer_rejections_are_counted(bearer_client):
+    assert bearer_client.get("/api/protected").status_code == 401
+    response = bearer_client.get("/api/protected", headers={"Authorization": "Bearer yanlis"})
+    assert response.status_code == 401
+    assert response.get_json() == {"error": "Geçersiz API token"}
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert bearer_client.get("/api/admin", headers=BEARER_USER).status_code == 403
+    assert bearer_client.get("/api/public").status_code == 200
+
+    stats = bearer_client.get("/api/admin/auth-stats", headers=BEARER_ADMIN).get_json()
+    assert stats["rejections"] == {"missing_header": 1, "invalid_token": 1, "admin_required": 1}
+    assert stats["total"] == 3
+
+
+def test_jwt_invalid_token(jwt_client):
+    response = jwt_client.get("/api/protected", headers={"Authorization": "Bearer bozuk.token"})
+    assert response.status_code == 401
+    assert response.get_json() == {"error": "Geçersiz JWT token"}
+
+
+def test_jwt_expired_token(jwt_server, jwt_client):
+    with jwt_server.app.app_context():
+        token = create_access_token(
+            identity="admin",
+            additional_claims=jwt_server.role_claims(jwt_server.user_store.get_profile("admin")),
+            expires_delta=timedelta(seconds=-1)
+        )
+    response = jwt_client.get("/api/protected", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert response.get_json() == {"error": "Token süresi dolmuş"}
+
+
+def test_jwt_revoked_token(jwt_client):
+    headers = login(jwt_client)
+    assert jwt_client.post("/api/logout", headers=headers).status_code == 200
+    response = jwt_client.get("/api/protected", headers=headers)
+    assert response.status_code == 401
+    assert response.get_json() == {"error": "Token iptal edilmiş"}
+
+
+def test_jwt_rejections_appear_in_auth_stats(jwt_client):
+    revoked = login(jwt_client, "user1", "user123")
+    jwt_client.post("/api/logout", headers=revoked)
+    jwt_client.get("/api/protected", headers=revoked)
+    jwt_client.get("/api/protected", headers={"Authorization": "Bearer bozuk.token"})
+    jwt_client.get("/api/protected")
+
+    stats = jwt_client.get("/api/admin/auth-stats", headers=login(jwt_client)).get_json()
+    assert stats["rejections"] == {"revoked_token": 1, "invalid_token": 1, "missing_header": 1}
+    assert stats["total"] == 3
@@ -0,0 +1,67 @@
+"""Toplu kayıt alımı: JSON dizisi / NDJSON okuma, kayıt sınırı ve kullanıcı içe aktarma"""
+
+from flask import Flask, jsonify
+import pytest
+
+from common.batch_ingest import BatchError, iter_batch
+
+from conftest import login
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+
+    @app.route("/toplu", methods=["POST"])
+    def toplu():
+        try:
+            return jsonify(list(iter_batch(max_items=3)))
+        except BatchError as e:
+            return jsonify({"error": str(e)}), 400
+
+    return app.test_client()
+
+
+def test_json_array(client):
+    response = client.post("/toplu", json=[{"a": 1}, {"a": 2}])
+    assert response.get_json() == [{"a": 1}, {"a": 2}]
+
+
+def test_ndjson(client):
+    body = b'{"a": 1}\n\n{"a": 2}\n'
+    response = client.post("/toplu", data=body, content_type="application/x-ndjson")
+    assert response.get_json() == [{"a": 1}, {"a": 2}]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"json": {"a": 1}},
+    {"data": b"{bozuk", "content_type": "application/json"},
+    {"data": b'{"a": 1}\n{bozuk\n', "content_type": "application/x-ndjson"},
+    {"json": [1, 2, 3, 4]},
+])
+def test_invalid_batches_return_400(client, kwargs):
+    assert client.post("/toplu", **kwargs).status_code == 400
+
+
+def test_user_import_accepts_ndjson(jwt_client):
+    headers = login(jwt_client)
+    before = jwt_client.get("/api/users").get_json()
+    body = b"".join(
+        b'{"username": "%s", "password": "sifre123", "role": "user", "email": "%s@example.com"}\n'
+        % (name, name) for name in (b"kat1", b"kat2")
+    )
+    response = jwt_client.post("/api/admin/users/import", data=body,
+                               content_type="application/x-ndjson", headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()["imported"] == 2
+    assert jwt_client.get("/api/users").get_json() != before
+    assert login(jwt_client, "kat2", "sifre123")
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"json": {"username": "tek"}},
+    {"data": b'{"username": "a"}\n{bozuk\n', "content_type": "application/x-ndjson"},
+])
+def test_user_import_rejects_malformed_batches(jwt_client, kwargs):
+    response = jwt_client.post("/api/admin/users/import", headers=login(jwt_client), **kwargs)
+    assert response.status_code == 400
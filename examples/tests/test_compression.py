@@ -0,0 +1,146 @@
+"""Yanıt sıkıştırma: kodlama seçimi, boyut sınırı, zayıf ETag ile 304 ve sıkıştırılmış gövde önbelleği"""
+
+import gzip
+
+from flask import Flask, Response, jsonify, stream_with_context
+import pytest
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+from common import compression
+from common.compression import Compressor
+from common.response_cache import ResponseCache
+
+from conftest import load_server, login
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+ROWS = [{"id": index, "ad": f"sensör-{index}"} for index in range(200)]
+
+
+@pytest.fixture
+def setup():
+    app = Flask(__name__)
+    cache = ResponseCache()
+    compressor = Compressor(min_size=512)
+
+    @app.route("/buyuk")
+    @cache.cached("buyuk")
+    def buyuk():
+        return jsonify(ROWS)
+
+    @app.route("/kucuk")
+    def kucuk():
+        return jsonify({"ok": True})
+
+    @app.route("/dinamik")
+    def dinamik():
+        return jsonify(ROWS)
+
+    @app.route("/akis")
+    def akis():
+        return Response(stream_with_context(iter([b"x" * 4096])), mimetype="application/json")
+
+    @app.route("/resim")
+    def resim():
+        return Response(b"x" * 4096, mimetype="image/png")
+
+    compressor.install(app)
+    return app.test_client(), compressor
+
+
+def accept(value):
+    return parse_accept_header(value, Accept)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", "gzip"),
+    ("gzip;q=0.5, identity", "gzip"),
+    ("*", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate_gzip(monkeypatch, header, expected):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert Compressor().negotiate(accept(header)) == expected
+
+
+def test_large_json_is_gzipped(setup):
+    client, compressor = setup
+    response = client.get("/dinamik", headers=GZIP)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert gzip.decompress(response.data) == client.get("/dinamik").data
+    stats = compressor.stats()
+    assert stats["compressed"]["gzip"] == 1
+    assert stats["bytes_out"] < stats["bytes_in"]
+
+
+@pytest.mark.parametrize("path", ["/kucuk", "/akis", "/resim"])
+def test_small_streamed_and_binary_responses_are_untouched(setup, path):
+    client, _ = setup
+    response = client.get(path, headers=GZIP)
+    assert "Content-Encoding" not in response.headers
+
+
+def test_uncompressed_without_accept_encoding(setup):
+    client, _ = setup
+    response = client.get("/dinamik")
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json() == ROWS
+
+
+def test_cached_response_gets_weak_etag_and_revalidates(setup):
+    client, compressor = setup
+    plain = client.get("/buyuk")
+    first = client.get("/buyuk", headers=GZIP)
+    assert first.headers["ETag"] == f"W/{plain.headers['ETag']}"
+
+    revalidated = client.get("/buyuk", headers={**GZIP, "If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 304
+
+    second = client.get("/buyuk", headers=GZIP)
+    assert second.data == first.data
+    stats = compressor.stats()
+    assert (stats["cache_hits"], stats["cache_misses"], stats["cache_entries"]) == (1, 1, 1)
+
+
+def test_dynamic_responses_are_not_cached(setup):
+    client, compressor = setup
+    client.get("/dinamik", headers=GZIP)
+    client.get("/dinamik", headers=GZIP)
+    assert compressor.stats()["cache_entries"] == 0
+
+
+def test_compressed_cache_is_bounded():
+    compressor = Compressor(cache_bytes=1000)
+    for index in range(5):
+        body = bytes(range(256)) * 2 + str(index).encode()
+        compressor._cached_body(f"etag-{index}", False, body, "gzip")
+    stats = compressor.stats()
+    # En eski gövdeler atılır
+    assert 0 < stats["cache_entries"] < 5
+    assert stats["cache_bytes"] <= 1000
+    assert ("etag-4", "gzip") in compressor._cache
+
+
+def test_server_compresses_user_listing(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch, COMPRESSION_MIN_SIZE="64")
+    client = server.app.test_client()
+    response = client.get("/api/users", headers=GZIP)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].startswith("W/")
+
+    headers = login(client)
+    assert client.get("/api/admin/compression", headers=login(client, "user1", "user123")).status_code == 403
+    stats = client.get("/api/admin/compression", headers=headers).get_json()
+    assert stats["compressed"]["gzip"] >= 1
+    assert stats["min_size"] == 64
+
+
+def test_compression_can_be_disabled(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch,
+                         COMPRESSION_ENABLED="0", COMPRESSION_MIN_SIZE="64")
+    response = server.app.test_client().get("/api/users", headers=GZIP)
+    assert "Content-Encoding" not in response.headers
@@ -0,0 +1,117 @@
+"""Olay günlüğü: group commit, sorgu sırası ve süzme, segment indeksleri ve saklama sınırı"""
+
+import os
+
+import pytest
+
+from common.event_journal import EventJournal
+
+from conftest import login
+
+
+def segment_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.startswith("events-"))
+
+
+def fill(journal, count, batch=10):
+    # Segment yalnızca group commit'ler arasında değişir; olaylar küçük gruplar halinde yazılır
+    start = journal.stats()["last_seq"]
+    for index in range(start, start + count):
+        journal.append("test", f"s{index % 3}", {"i": index})
+        if index % batch == batch - 1:
+            assert journal.flush(5)
+    assert journal.flush(5)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return EventJournal(str(tmp_path / "events"), segment_bytes=4096, sync=False)
+
+
+def test_append_wait_returns_event(journal):
+    event = journal.append("auth.login", "admin", {"ip": "127.0.0.1"}, wait=True)
+    assert event["seq"] == 1
+    assert event["type"] == "auth.login"
+    assert journal.query() == [event]
+
+
+def test_query_newest_first_by_default(journal):
+    fill(journal, 300)
+    events = journal.query(limit=5)
+    assert [event["data"]["i"] for event in events] == [299, 298, 297, 296, 295]
+    assert [event["seq"] for event in journal.query()] == list(range(300, 0, -1))
+    assert [event["seq"] for event in journal.query(order="asc")] == list(range(1, 301))
+    with pytest.raises(ValueError):
+        journal.query(order="yanlis")
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_query_time_range_and_source(journal, order):
+    fill(journal, 600)
+    events = journal.query(order="asc")
+    start, end = events[150]["ts"], events[450]["ts"]
+    expected = [event for event in events if start <= event["ts"] <= end]
+    if order == "desc":
+        expected.reverse()
+    assert journal.query(start=start, end=end, order=order, limit=10_000) == expected
+
+    by_source = journal.query(start=start, end=end, source="s1", type="test", order=order)
+    assert by_source == [event for event in expected if event["source"] == "s1"]
+    assert journal.query(type="yok", order=order) == []
+
+
+def test_segments_rotate_and_reload(journal, tmp_path):
+    fill(journal, 200)
+    assert journal.stats()["segments"] > 1
+    reopened = EventJournal(str(tmp_path / "events"), segment_bytes=4096, sync=False)
+    assert reopened.query(order="asc") == journal.query(order="asc")
+    assert reopened.stats()["last_seq"] == 200
+
+
+def test_max_segments_caps_disk_and_index(tmp_path):
+    directory = str(tmp_path / "events")
+    journal = EventJournal(directory, segment_bytes=2048, sync=False, max_segments=3)
+    fill(journal, 500)
+    stats = journal.stats()
+    assert stats["segments"] == 3
+    assert stats["removed_segments"] > 0
+    assert len(segment_files(directory)) <= 6  # .log + .idx
+    # En yeni olaylar kalır, silinen segmentlerdeki eski olaylar döner
+    events = journal.query(limit=10_000)
+    assert events[0]["seq"] == 500
+    assert events[-1]["seq"] > 1
+
+    other = EventJournal(directory, segment_bytes=2048, sync=False, max_segments=3)
+    fill(journal, 200)
+    # Diğer process'in sildiği segmentler indeksten de çıkar
+    assert other.stats()["segments"] == 3
+    assert other.query(limit=1)[0]["seq"] == 700
+
+
+def test_retention_removes_old_segments(tmp_path):
+    directory = str(tmp_path / "events")
+    journal = EventJournal(directory, segment_bytes=2048, sync=False, max_segments=None)
+    fill(journal, 100)
+    segments = journal.stats()["segments"]
+    assert segments > 2
+
+    journal.retention = 0
+    fill(journal, 50)
+    # Yazılan son segment dışında hepsi süresi dolmuş sayılır
+    assert journal.stats()["segments"] <= 2
+    assert journal.query(limit=1)[0]["seq"] == 150
+
+
+def test_events_endpoint(jwt_server, jwt_client):
+    headers = login(jwt_client)
+    login(jwt_client, "user1", "user123")
+    jwt_client.post("/api/login", json={"username": "user1", "password": "yanlis"})
+    jwt_server.event_journal.flush(5)
+
+    events = jwt_client.get("/api/admin/events", headers=headers).get_json()["events"]
+    assert [event["type"] for event in events] == ["auth.login_failed", "auth.login", "auth.login"]
+    oldest = jwt_client.get("/api/admin/events?order=asc&source=user1", headers=headers).get_json()
+    assert [event["type"] for event in oldest["events"]] == ["auth.login", "auth.login_failed"]
+
+    for query in ("order=rastgele", "limit=0", "start=dun"):
+        assert jwt_client.get(f"/api/admin/events?{query}", headers=headers).status_code == 400
@@ -0,0 +1,89 @@
+"""JSON provider: backend seçimi, kompakt byte çıktı, önceden serileştirilmiş gövde ve stdlib'e düşme"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+import uuid
+
+from flask import Flask, jsonify
+import pytest
+
+from common import json_provider
+from common.json_provider import FastJSONProvider
+
+BACKENDS = ["stdlib"] + (["orjson"] if json_provider.orjson is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def app(request):
+    app = Flask(__name__)
+    app.debug = True  # debug modunda da girintilenmemeli
+    FastJSONProvider.install(app, request.param)
+    return app
+
+
+def test_backend_selection():
+    app = Flask(__name__)
+    assert FastJSONProvider(app, "stdlib").backend == "stdlib"
+    expected = "orjson" if json_provider.orjson is not None else "stdlib"
+    assert FastJSONProvider(app, "auto").backend == expected
+    with pytest.raises(ValueError):
+        FastJSONProvider(app, "ujson")
+
+
+def test_orjson_required_when_requested(monkeypatch):
+    monkeypatch.setattr(json_provider, "orjson", None)
+    with pytest.raises(RuntimeError):
+        FastJSONProvider(Flask(__name__), "orjson")
+    assert FastJSONProvider(Flask(__name__), "auto").backend == "stdlib"
+
+
+def test_compact_unicode_output(app):
+    with app.app_context():
+        response = jsonify({"mesaj": "Yangın", "liste": [1, 2]})
+    # Flask'taki gibi anahtarlar varsayılan olarak sıralanır
+    assert response.data == '{"liste":[1,2],"mesaj":"Yangın"}'.encode()
+    assert response.mimetype == "application/json"
+
+
+def test_prebuilt_body_is_passed_through(app):
+    with app.app_context():
+        assert jsonify(b'{"hazir":true}').data == b'{"hazir":true}'
+        # Tek argüman dışındaki kullanımlar normal serileştirilir
+        assert jsonify(a=1).data == b'{"a":1}'
+        assert jsonify("metin").data == b'"metin"'
+
+
+def test_special_values_match_flask(app):
+    value = {
+        "tarih": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "ondalik": Decimal("1.50"),
+        "kimlik": uuid.UUID(int=1),
+        "buyuk": 2 ** 70,
+    }
+    with app.app_context():
+        data = jsonify(value).get_json()
+    assert data == {
+        "tarih": "Tue, 02 Jan 2024 03:04:05 GMT",
+        "ondalik": "1.50",
+        "kimlik": "00000000-0000-0000-0000-000000000001",
+        "buyuk": 2 ** 70,
+    }
+
+
+def test_unserializable_value_raises(app):
+    with pytest.raises(TypeError):
+        app.json.dumps({"x": object()})
+
+
+def test_loads_and_sort_keys(app):
+    assert app.json.loads('{"b":1,"a":[true,null]}') == {"b": 1, "a": [True, None]}
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+    app.json.sort_keys = False
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"b":1,"a":2}'
+
+
+def test_server_responses_are_compact(jwt_client):
+    response = jwt_client.get("/api/public")
+    assert response.status_code == 200
+    assert b"\n" not in response.data
+    assert b'": ' not in response.data
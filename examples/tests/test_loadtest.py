@@ -0,0 +1,87 @@
+"""Yük testi: yüzdelik hesabı, senaryoların gerçek server'a karşı ölçümü ve gerileme karşılaştırması"""
+
+import argparse
+import json
+
+import pytest
+
+from loadtest import SCENARIOS, compare, percentile, run_scenario
+
+
+def test_percentile_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile(values, 1.0) == 100.0
+    assert percentile([7.0], 0.99) == 7.0
+    assert percentile([], 0.5) == 0.0
+
+
+def make_args(url, **overrides):
+    values = dict(jwt_url=url, bearer_url=url, username="admin", password="admin123",
+                  concurrency=2, duration=0.3, warmup=0.0)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_protected_scenario_reports_latencies(jwt_url):
+    result = run_scenario(SCENARIOS["protected"], make_args(jwt_url))
+    assert result["requests"] > 0
+    assert result["status_counts"] == {"200": result["requests"]}
+    assert result["failed_responses"] == result["connection_errors"] == 0
+    latency = result["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+
+def test_failed_responses_are_counted(jwt_url):
+    args = make_args(jwt_url, password="yanlis", concurrency=1, duration=0.2)
+    result = run_scenario(SCENARIOS["login"], args)
+    assert result["requests"] > 0
+    assert result["failed_responses"] == result["requests"]
+    # Hatalı girişler 401, login rate limit aşılınca 429 döner
+    assert set(result["status_counts"]) <= {"401", "429"}
+
+
+def test_connection_errors_are_counted():
+    args = make_args("http://127.0.0.1:1/api", concurrency=1, duration=0.1)
+    result = run_scenario(SCENARIOS["login"], args)
+    assert result["requests"] == 0
+    assert result["connection_errors"] > 0
+    assert result["latency_ms"]["p99"] == 0.0
+
+
+def test_failed_setup_counts_as_connection_error(jwt_url):
+    # Login reddedildiğinde (401 / 429) senaryo durmaz, her worker bir hata sayar
+    args = make_args(jwt_url, password="yanlis", concurrency=3, duration=0.1)
+    result = run_scenario(SCENARIOS["protected"], args)
+    assert result["requests"] == 0
+    assert result["connection_errors"] == 3
+
+
+def test_unreachable_server_during_setup():
+    args = make_args("http://127.0.0.1:1/api", concurrency=2, duration=0.1)
+    result = run_scenario(SCENARIOS["refresh"], args)
+    assert result["connection_errors"] == 2
+    assert result["throughput_rps"] == 0.0
+
+
+def write_results(path, throughput, p99):
+    path.write_text(json.dumps({"results": [{
+        "scenario": "protected",
+        "throughput_rps": throughput,
+        "latency_ms": {"p50": 1.0, "p95": 2.0, "p99": p99},
+    }]}))
+    return str(path)
+
+
+@pytest.mark.parametrize("throughput, p99, code", [
+    (1000, 3.0, 0),   # değişiklik yok
+    (1050, 3.2, 0),   # eşik içinde
+    (850, 3.0, 1),    # throughput düştü
+    (1000, 3.5, 1),   # p99 arttı
+])
+def test_compare_flags_regressions(tmp_path, throughput, p99, code):
+    old = write_results(tmp_path / "eski.json", 1000, 3.0)
+    new = write_results(tmp_path / "yeni.json", throughput, p99)
+    assert compare(old, new, threshold=10) == code
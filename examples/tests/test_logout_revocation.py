@@ -0,0 +1,46 @@
+"""Logout: yalnızca çıkış yapılan token'ın iptali, exp ile temizlenme ve worker'lar arası paylaşım"""
+
+import jwt
+
+from conftest import load_server, login
+
+
+def claims_of(headers):
+    return jwt.decode(headers["Authorization"].split()[1], options={"verify_signature": False})
+
+
+def test_logout_revokes_only_that_token(jwt_server, jwt_client):
+    first = login(jwt_client)
+    second = login(jwt_client)
+    assert jwt_client.post("/api/logout", headers=first).status_code == 200
+
+    assert jwt_client.get("/api/protected", headers=first).status_code == 401
+    assert jwt_client.get("/api/protected", headers=second).status_code == 200
+    assert len(jwt_server.revocation_store) == 1
+    # Tekrar logout yeni kayıt eklemez; iptal edilmiş token ile istek reddedilir
+    assert jwt_client.post("/api/logout", headers=first).status_code == 401
+    assert len(jwt_server.revocation_store) == 1
+
+
+def test_revocation_entry_expires_with_token(jwt_server, jwt_client):
+    headers = login(jwt_client)
+    jwt_client.post("/api/logout", headers=headers)
+    exp = claims_of(headers)["exp"]
+    assert jwt_server.revocation_store.purge(exp - 1) == 0
+    assert jwt_server.revocation_store.purge(exp) == 1
+    assert len(jwt_server.revocation_store) == 0
+
+
+def test_sqlite_store_is_shared_between_workers(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'revoked.db'}"
+    for worker in ("w1", "w2"):
+        (tmp_path / worker).mkdir()
+    first = load_server("jwt_token_example", tmp_path / "w1", monkeypatch, JWT_REVOCATION_STORE=url)
+    first_client = first.app.test_client()
+    headers = login(first_client)
+
+    second = load_server("jwt_token_example", tmp_path / "w2", monkeypatch, JWT_REVOCATION_STORE=url)
+    second_client = second.app.test_client()
+    assert second_client.get("/api/protected", headers=headers).status_code == 200
+    first_client.post("/api/logout", headers=headers)
+    assert second_client.get("/api/protected", headers=headers).status_code == 401
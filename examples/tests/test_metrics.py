@@ -0,0 +1,120 @@
+"""Metrikler: histogram kovaları, route kuralı etiketleri, aşama süreleri ve /metrics çıktısı"""
+
+import re
+
+from flask import Flask, jsonify
+import pytest
+
+from common.metrics import REQUEST_BUCKETS, UNMATCHED, Metrics
+
+from conftest import BEARER_ADMIN, load_server, login
+
+
+def sample(text, name, **labels):
+    """Metin çıktısından etiketleri tam eşleşen örneğin değerini döner"""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{re.escape(name)}{{{re.escape(label_text)}}} (\S+)$", text, re.M)
+    return float(match.group(1)) if match else None
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    metrics = Metrics()
+
+    @app.route("/items/<int:item_id>")
+    def item(item_id):
+        if item_id == 0:
+            return jsonify({"error": "Bulunamadı"}), 404
+        return jsonify({"id": item_id})
+
+    @app.route("/hata")
+    def hata():
+        raise RuntimeError("beklenmeyen")
+
+    metrics.install(app)
+    return app
+
+
+def test_request_histogram_uses_route_rule(app):
+    client = app.test_client()
+    for item_id in (1, 2, 0):
+        client.get(f"/items/{item_id}")
+    text = client.get("/metrics").get_data(as_text=True)
+
+    labels = {"endpoint": "/items/<int:item_id>", "method": "GET"}
+    assert sample(text, "http_request_duration_seconds_count", **labels) == 3
+    assert sample(text, "http_request_duration_seconds_bucket", **labels, le="+Inf") == 3
+    assert sample(text, "http_responses_total", **labels, status="200") == 2
+    assert sample(text, "http_responses_total", **labels, status="404") == 1
+    assert "/items/1" not in text
+    # jsonify çağrıları serileştirme aşaması olarak ölçülür
+    assert sample(text, "app_stage_duration_seconds_count", stage="serialization") == 3
+
+
+def test_unmatched_and_failing_requests(app):
+    client = app.test_client()
+    client.get("/yok")
+    client.get("/hata")
+    text = client.get("/metrics").get_data(as_text=True)
+    assert sample(text, "http_responses_total", endpoint=UNMATCHED, method="GET", status="404") == 1
+    assert sample(text, "http_responses_total", endpoint="/hata", method="GET", status="500") == 1
+
+
+def test_buckets_are_cumulative():
+    metrics = Metrics()
+    for seconds in (0.0001, 0.003, 0.003, 10.0):
+        metrics.observe_request("/x", "GET", "200", seconds)
+    text = metrics.render()
+    labels = {"endpoint": "/x", "method": "GET"}
+    assert sample(text, "http_request_duration_seconds_bucket", **labels, le="0.0005") == 1
+    assert sample(text, "http_request_duration_seconds_bucket", **labels, le="0.005") == 3
+    assert sample(text, "http_request_duration_seconds_bucket", **labels,
+                  le=repr(float(REQUEST_BUCKETS[-1]))) == 3
+    assert sample(text, "http_request_duration_seconds_bucket", **labels, le="+Inf") == 4
+    assert sample(text, "http_request_duration_seconds_sum", **labels) == pytest.approx(10.0061)
+
+
+def test_label_values_are_escaped():
+    metrics = Metrics()
+    metrics.observe_stage('a"b\\c', 0.001)
+    assert 'stage="a\\"b\\\\c"' in metrics.render()
+
+
+def test_disabled_metrics_wrap_nothing():
+    app = Flask(__name__)
+    metrics = Metrics(enabled=False)
+
+    def f():
+        return 1
+
+    assert metrics.timed("x")(f) is f
+    metrics.install(app)
+    assert app.test_client().get("/metrics").status_code == 404
+
+
+def test_jwt_server_metrics(jwt_client):
+    headers = login(jwt_client)
+    jwt_client.get("/api/admin", headers=headers)
+    jwt_client.get("/api/protected")
+    response = jwt_client.get("/metrics")
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    text = response.get_data(as_text=True)
+    assert sample(text, "http_responses_total", endpoint="/api/admin", method="GET", status="200") == 1
+    # Middleware'de reddedilen istek route'a ulaşmaz
+    assert sample(text, "http_responses_total", endpoint=UNMATCHED, method="GET", status="401") == 1
+    for stage in ("auth", "blocklist", "role"):
+        assert sample(text, "app_stage_duration_seconds_count", stage=stage) >= 1
+
+
+def test_bearer_server_counts_middleware_rejections(bearer_client):
+    bearer_client.get("/api/protected", headers=BEARER_ADMIN)
+    bearer_client.get("/api/protected")
+    text = bearer_client.get("/metrics").get_data(as_text=True)
+    assert sample(text, "http_responses_total", endpoint="/api/protected", method="GET", status="200") == 1
+    assert sample(text, "http_responses_total", endpoint=UNMATCHED, method="GET", status="401") == 1
+
+
+def test_metrics_can_be_disabled(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch, METRICS_ENABLED="0")
+    assert server.app.test_client().get("/metrics").status_code == 404
@@ -0,0 +1,94 @@
+"""Cursor sayfalama, NDJSON akışı ve gösterime göre ayrılan önbellek kayıtları"""
+
+import json
+
+import pytest
+
+from common.pagination import NDJSON_MIMETYPE, encode_cursor
+
+from conftest import BEARER_ADMIN
+
+
+def _all_pages(client, url, key, headers=None):
+    items, cursor = [], None
+    while True:
+        page_url = f"{url}&cursor={cursor}" if cursor else url
+        response = client.get(page_url, headers=headers)
+        assert response.status_code == 200, response.data
+        body = response.get_json()
+        items.extend(body[key])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_users_pages_cover_all_users(jwt_client):
+    users = _all_pages(jwt_client, "/api/users?limit=2", "users")
+    assert [user["username"] for user in users] == ["admin", "operator", "user1"]
+
+
+def test_tokens_pages_cover_all_tokens(bearer_client):
+    for i in range(5):
+        bearer_client.post("/api/generate-token", json={"user": f"sensor{i}"})
+    tokens = _all_pages(bearer_client, "/api/list-tokens?limit=3", "tokens")
+    assert len(tokens) == 8
+    assert [token["user"] for token in tokens[3:]] == [f"sensor{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("key", [[1, 2], {}, 5, None, True])
+def test_users_cursor_must_be_a_username(jwt_client, key):
+    response = jwt_client.get(f"/api/users?cursor={encode_cursor(key)}")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Geçersiz cursor"}
+
+
+@pytest.mark.parametrize("key", ["admin", [1], {}, True, 1.5, 2 ** 70])
+def test_tokens_cursor_must_be_an_id(bearer_client, key):
+    response = bearer_client.get(f"/api/list-tokens?cursor={encode_cursor(key)}")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Geçersiz cursor"}
+
+
+@pytest.mark.parametrize("query", ["cursor=%%%", "cursor=_w", "limit=0", "limit=1001", "limit=abc"])
+def test_invalid_page_args(jwt_client, query):
+    assert jwt_client.get(f"/api/users?{query}").status_code == 400
+
+
+def test_ndjson_streams_all_rows(jwt_client):
+    response = jwt_client.get("/api/users?format=ndjson")
+    assert response.mimetype == NDJSON_MIMETYPE
+    lines = response.data.decode().splitlines()
+    assert [json.loads(line)["username"] for line in lines] == ["admin", "operator", "user1"]
+
+
+def test_accept_ndjson_is_not_served_from_json_cache(jwt_client):
+    first = jwt_client.get("/api/users")
+    assert first.mimetype == "application/json"
+    assert "Accept" in first.headers["Vary"]
+
+    response = jwt_client.get("/api/users", headers={"Accept": NDJSON_MIMETYPE})
+    assert response.status_code == 200
+    assert response.mimetype == NDJSON_MIMETYPE
+    assert response.headers.get("ETag") != first.headers["ETag"]
+    assert "Accept" in response.headers["Vary"]
+    assert len(response.data.decode().splitlines()) == 3
+
+    # JSON kaydı bozulmadan kalır
+    again = jwt_client.get("/api/users")
+    assert again.data == first.data
+    assert again.headers["ETag"] == first.headers["ETag"]
+
+
+def test_tokens_accept_ndjson_after_cached_json(bearer_client):
+    assert bearer_client.get("/api/list-tokens").mimetype == "application/json"
+    response = bearer_client.get("/api/list-tokens", headers={"Accept": NDJSON_MIMETYPE})
+    assert response.mimetype == NDJSON_MIMETYPE
+    assert len(response.data.decode().splitlines()) == 3
+
+
+def test_revoked_tokens_disappear_from_listing(bearer_client):
+    token = bearer_client.post("/api/generate-token", json={"user": "gecici"}).get_json()["token"]
+    assert len(bearer_client.get("/api/list-tokens").get_json()["tokens"]) == 4
+    response = bearer_client.post("/api/revoke-tokens", json={"tokens": [token]}, headers=BEARER_ADMIN)
+    assert response.get_json()["revoked"] == 1
+    assert len(bearer_client.get("/api/list-tokens").get_json()["tokens"]) == 3
@@ -0,0 +1,133 @@
+"""Profiler: yalnızca örneklenen isteklerin yığınları, katlanmış çıktı, yığın sınırı ve admin endpoint'i"""
+
+import time
+
+from flask import Flask
+import pytest
+
+from common.profiler import OVERFLOW_STACK, SamplingProfiler, control_args
+
+from conftest import BEARER_ADMIN, BEARER_USER, login
+
+
+def busy_wait(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def yavas_islem():
+    busy_wait(0.05)
+    return "tamam"
+
+
+def diger_islem():
+    busy_wait(0.05)
+    return "tamam"
+
+
+@pytest.fixture
+def profiled():
+    app = Flask(__name__)
+    app.add_url_rule("/yavas", "yavas", yavas_islem)
+    app.add_url_rule("/diger", "diger", diger_islem)
+    profiler = SamplingProfiler(interval=0.002).install(app)
+    yield app.test_client(), profiler
+    profiler.stop()
+
+
+def test_disabled_profiler_takes_no_samples(profiled):
+    client, profiler = profiled
+    client.get("/yavas")
+    assert not profiler.running
+    assert profiler.status()["sampled_requests"] == 0
+    assert profiler.folded() == ""
+
+
+def test_sampled_requests_are_folded(profiled):
+    client, profiler = profiled
+    profiler.start(1.0)
+    for _ in range(3):
+        client.get("/yavas")
+    profiler.stop()
+
+    status = profiler.status()
+    assert status["sampled_requests"] == 3
+    assert status["samples"] > 0
+    lines = profiler.folded().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    # Yığın WSGI katmanından başlar ve endpoint fonksiyonunu içerir
+    assert stack.split(";")[0].endswith("install.<locals>.wsgi_app")
+    assert f"{__name__}:yavas_islem" in stack
+    assert stack.endswith(f"{__name__}:busy_wait")
+
+    profiler.reset()
+    assert profiler.folded() == ""
+    assert profiler.status()["samples"] == 0
+
+
+def test_stack_limit_collapses_new_stacks():
+    app = Flask(__name__)
+    app.add_url_rule("/yavas", "yavas", yavas_islem)
+    app.add_url_rule("/diger", "diger", diger_islem)
+    profiler = SamplingProfiler(interval=0.002, max_stacks=1).install(app)
+    client = app.test_client()
+    profiler.start(1.0)
+    try:
+        client.get("/yavas")
+        client.get("/diger")
+    finally:
+        profiler.stop()
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.folded().splitlines()]
+    assert len(stacks) == 2
+    assert OVERFLOW_STACK in stacks
+
+
+@pytest.mark.parametrize("rate", [0, -0.1, 1.5])
+def test_invalid_sample_rate(rate):
+    with pytest.raises(ValueError):
+        SamplingProfiler().start(rate)
+
+
+def test_control_args():
+    assert control_args({"enabled": True}) == {
+        "enabled": True, "sample_rate": 0.1, "interval": None, "reset": False
+    }
+    assert control_args({"enabled": True, "interval_ms": 2, "reset": True})["interval"] == 0.002
+    for body in (None, [], {}, {"enabled": "true"}, {"enabled": True, "sample_rate": "0.5"},
+                 {"enabled": True, "interval_ms": True}):
+        with pytest.raises(ValueError):
+            control_args(body)
+
+
+def test_jwt_profiler_endpoints(jwt_client):
+    headers = login(jwt_client)
+    user_headers = login(jwt_client, "user1", "user123")
+    assert jwt_client.get("/api/admin/profiler", headers=user_headers).status_code == 403
+    assert jwt_client.get("/api/admin/profiler/folded", headers=user_headers).status_code == 403
+
+    for body in ({}, {"enabled": True, "sample_rate": 2}, {"enabled": True, "interval_ms": 0}):
+        response = jwt_client.post("/api/admin/profiler", json=body, headers=headers)
+        assert response.status_code == 400
+
+    status = jwt_client.post("/api/admin/profiler", json={"enabled": True, "sample_rate": 1.0},
+                             headers=headers).get_json()
+    assert status["running"] and status["sample_rate"] == 1.0
+    status = jwt_client.post("/api/admin/profiler", json={"enabled": False, "reset": True},
+                             headers=headers).get_json()
+    assert not status["running"]
+    assert status["samples"] == 0
+    response = jwt_client.get("/api/admin/profiler/folded", headers=headers)
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+
+
+def test_bearer_profiler_endpoints(bearer_client):
+    assert bearer_client.get("/api/admin/profiler", headers=BEARER_USER).status_code == 403
+    response = bearer_client.post("/api/admin/profiler", json={"enabled": "evet"}, headers=BEARER_ADMIN)
+    assert response.status_code == 400
+    response = bearer_client.post("/api/admin/profiler", json={"enabled": True}, headers=BEARER_ADMIN)
+    assert response.get_json()["running"]
+    response = bearer_client.post("/api/admin/profiler", json={"enabled": False}, headers=BEARER_ADMIN)
+    assert not response.get_json()["running"]
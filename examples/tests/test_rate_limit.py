@@ -0,0 +1,169 @@
+"""Rate limiting: kayan pencere sayaçları ve login / generate-token limitleri"""
+
+import pytest
+
+from common.rate_limit import (
+    MemoryRateLimitStore, SQLiteRateLimitStore, create_rate_limit_store, parse_limits
+)
+
+from conftest import load_server
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRateLimitStore()
+    return SQLiteRateLimitStore(str(tmp_path / "ratelimit.db"))
+
+
+def test_parse_limits():
+    assert parse_limits("ip:20/minute, user:5/second") == [("ip", 20, 60), ("user", 5, 1)]
+    with pytest.raises(ValueError):
+        parse_limits("ip:20/fortnight")
+    with pytest.raises(ValueError):
+        parse_limits("ip:many/minute")
+
+
+def test_limit_within_window(store):
+    for _ in range(3):
+        assert store.hit("k", 3, 60, now=120.0) == (True, 0)
+    allowed, retry_after = store.hit("k", 3, 60, now=130.0)
+    assert not allowed
+    assert 1 <= retry_after <= 60
+
+
+def test_previous_window_is_weighted(store):
+    for _ in range(4):
+        store.hit("k", 4, 60, now=60.0)
+    # Yeni pencerenin yarısında önceki pencerenin yarısı (2 istek) sayılır
+    assert store.hit("k", 4, 60, now=150.0)[0]
+    assert store.hit("k", 4, 60, now=150.0)[0]
+    assert not store.hit("k", 4, 60, now=150.0)[0]
+    # İki pencere sonra sayaç tamamen sıfırlanır
+    assert store.hit("k", 4, 60, now=300.0) == (True, 0)
+
+
+def test_keys_are_independent(store):
+    assert store.hit("a", 1, 60, now=0.0)[0]
+    assert not store.hit("a", 1, 60, now=1.0)[0]
+    assert store.hit("b", 1, 60, now=1.0)[0]
+
+
+def test_memory_store_is_bounded():
+    store = MemoryRateLimitStore(max_keys=2)
+    for key in ("a", "b", "c"):
+        store.hit(key, 1, 60, now=0.0)
+    assert len(store) == 2
+    # En eski anahtar atıldığı için "a" yeniden izin alır
+    assert store.hit("a", 1, 60, now=1.0)[0]
+
+
+def test_memory_store_evicts_idle_keys():
+    store = MemoryRateLimitStore()
+    store.hit("a", 1, 60, now=0.0)
+    store.hit("b", 1, 60, now=200.0)
+    assert len(store) == 1
+
+
+def test_create_rate_limit_store(tmp_path):
+    assert isinstance(create_rate_limit_store("memory://?max_keys=10"), MemoryRateLimitStore)
+    store = create_rate_limit_store(f"sqlite:///{tmp_path}/limits/ratelimit.db")
+    assert isinstance(store, SQLiteRateLimitStore)
+    with pytest.raises(ValueError):
+        create_rate_limit_store("redis://localhost")
+
+
+@pytest.mark.parametrize("body", [[], [1], ["username", "password"], 42, "admin"])
+def test_login_rejects_non_object_body(jwt_client, body):
+    response = jwt_client.post("/api/login", json=body)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Kullanıcı adı ve şifre gerekli"}
+
+
+@pytest.mark.parametrize("body", [[], [1], ["user"], None])
+def test_generate_token_rejects_non_object_body(bearer_client, body):
+    response = bearer_client.post("/api/generate-token", json=body)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Kullanıcı adı gerekli"}
+
+
+def test_login_limited_per_user(jwt_server):
+    client = jwt_server.app.test_client()
+    for _ in range(5):
+        response = client.post("/api/login", json={"username": "admin", "password": "yanlis"})
+        assert response.status_code == 401
+
+    response = client.post("/api/login", json={"username": "admin", "password": "admin123"})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.get_json()["retry_after"] >= 1
+
+    # Başka kullanıcı aynı IP'den hâlâ login olabilir
+    response = client.post("/api/login", json={"username": "user1", "password": "user123"})
+    assert response.status_code == 200
+    assert jwt_server.rate_limiter.stats() == {"login:user": 1}
+
+
+def test_non_object_body_counts_only_per_ip(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch,
+                         RATE_LIMIT_LOGIN="ip:3/minute,user:1/minute")
+    client = server.app.test_client()
+    for _ in range(3):
+        assert client.post("/api/login", json=[1]).status_code == 400
+    response = client.post("/api/login", json=[1])
+    assert response.status_code == 429
+    assert server.rate_limiter.stats() == {"login:ip": 1}
+
+
+def test_generate_token_limited_per_user(bearer_client):
+    for _ in range(10):
+        response = bearer_client.post("/api/generate-token", json={"user": "sensor"})
+        assert response.status_code == 201
+    assert bearer_client.post("/api/generate-token", json={"user": "sensor"}).status_code == 429
+    assert bearer_client.post("/api/generate-token", json={"user": "other"}).status_code == 201
+
+
+def test_invalid_refresh_tokens_count_per_ip(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch,
+                         RATE_LIMIT_REFRESH="ip:3/minute,user:2/minute")
+    client = server.app.test_client()
+    access_token = client.post(
+        "/api/login", json={"username": "user1", "password": "user123"}
+    ).get_json()["access_token"]
+    # Geçersiz imza / bozuk token / refresh yerine access token: hepsi doğrulamada reddedilir
+    for token in (access_token[:-4] + "AAAA", "a.b.c", access_token):
+        response = client.post("/api/refresh", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code in (401, 422)
+    refresh_token = client.post(
+        "/api/login", json={"username": "admin", "password": "admin123"}
+    ).get_json()["refresh_token"]
+    response = client.post("/api/refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 429
+    assert server.rate_limiter.stats() == {"refresh:ip": 1}
+
+
+def test_refresh_limited_per_user(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch,
+                         RATE_LIMIT_REFRESH="ip:10/minute,user:2/minute")
+    client = server.app.test_client()
+    refresh_token = client.post(
+        "/api/login", json={"username": "admin", "password": "admin123"}
+    ).get_json()["refresh_token"]
+    headers = {"Authorization": f"Bearer {refresh_token}"}
+    for _ in range(2):
+        assert client.post("/api/refresh", headers=headers).status_code == 200
+    assert client.post("/api/refresh", headers=headers).status_code == 429
+    assert server.rate_limiter.stats() == {"refresh:user": 1}
+
+
+def test_refresh_counts_each_request_once(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch,
+                         RATE_LIMIT_REFRESH="ip:3/minute,user:3/minute")
+    client = server.app.test_client()
+    refresh_token = client.post(
+        "/api/login", json={"username": "admin", "password": "admin123"}
+    ).get_json()["refresh_token"]
+    headers = {"Authorization": f"Bearer {refresh_token}"}
+    for _ in range(3):
+        assert client.post("/api/refresh", headers=headers).status_code == 200
+    assert client.post("/api/refresh", headers=headers).status_code == 429
@@ -0,0 +1,74 @@
+"""RBAC: derlenmiş rol hiyerarşisi, token claim'inden yetkilendirme ve rol versiyonu kontrolü"""
+
+import pytest
+
+from rbac import RBAC, RoleHierarchy
+
+from conftest import load_server, login
+
+HIERARCHY = {"admin": ["operator", "user"], "operator": ["user"], "user": []}
+
+
+def test_hierarchy_grants():
+    hierarchy = RoleHierarchy(HIERARCHY)
+    assert hierarchy.grants("admin") == {"admin", "operator", "user"}
+    assert hierarchy.grants("user") == {"user"}
+    assert hierarchy.grants("misafir") == frozenset()
+    assert hierarchy.accepted_roles(["operator"]) == {"admin", "operator"}
+    assert hierarchy.accepted_roles(["user"]) == {"admin", "operator", "user"}
+
+
+def test_hierarchy_handles_cycles():
+    hierarchy = RoleHierarchy({"a": ["b"], "b": ["a"]})
+    assert hierarchy.grants("a") == {"a", "b"}
+
+
+def test_unknown_required_role():
+    with pytest.raises(ValueError):
+        RoleHierarchy(HIERARCHY).accepted_roles(["root"])
+
+
+def test_role_version_requires_user_store():
+    with pytest.raises(ValueError):
+        RBAC(HIERARCHY, check_role_version=True)
+
+
+def test_admin_endpoint_by_role(jwt_client):
+    assert jwt_client.get("/api/admin", headers=login(jwt_client)).status_code == 200
+    response = jwt_client.get("/api/admin", headers=login(jwt_client, "user1", "user123"))
+    assert response.status_code == 403
+    assert response.get_json()["your_role"] == "user"
+
+
+@pytest.mark.parametrize("body", [None, ["admin"], {"role": ["admin"]}, {"role": "root"}, {}])
+def test_set_role_rejects_invalid_body(jwt_client, body):
+    headers = login(jwt_client)
+    response = jwt_client.put("/api/admin/users/user1/role", json=body, headers=headers)
+    assert response.status_code == 400
+
+
+def test_set_role_unknown_user(jwt_client):
+    response = jwt_client.put("/api/admin/users/yok/role", json={"role": "user"},
+                              headers=login(jwt_client))
+    assert response.status_code == 404
+
+
+def test_old_token_keeps_role_without_version_check(jwt_client):
+    user_headers = login(jwt_client, "user1", "user123")
+    jwt_client.put("/api/admin/users/user1/role", json={"role": "admin"},
+                   headers=login(jwt_client))
+    # Rol token'dan okunur; yeni rol bir sonraki login'de geçerli olur
+    assert jwt_client.get("/api/admin", headers=user_headers).status_code == 403
+    assert jwt_client.get("/api/admin", headers=login(jwt_client, "user1", "user123")).status_code == 200
+
+
+def test_role_change_applies_to_old_tokens_with_version_check(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch, RBAC_CHECK_ROLE_VERSION="1")
+    client = server.app.test_client()
+    admin_headers = login(client)
+    operator_headers = login(client, "operator", "operator123")
+    assert client.get("/api/admin", headers=admin_headers).status_code == 200
+
+    client.put("/api/admin/users/admin/role", json={"role": "user"}, headers=admin_headers)
+    assert client.get("/api/admin", headers=admin_headers).status_code == 403
+    assert client.get("/api/admin", headers=operator_headers).status_code == 403
@@ -0,0 +1,103 @@
+"""Yanıt önbelleği: ETag / 304, version ile geçersiz kılma, invalidate yarışları ve boyut sınırı"""
+
+from flask import Flask, jsonify
+import pytest
+
+from common.response_cache import ResponseCache, _Entry
+
+from conftest import login
+
+
+@pytest.fixture
+def setup():
+    app = Flask(__name__)
+    cache = ResponseCache(max_entries=2)
+    state = {"calls": 0, "version": 1, "status": 200}
+
+    @app.route("/veri")
+    @cache.cached("veri", version=lambda: state["version"])
+    def veri():
+        state["calls"] += 1
+        return jsonify({"calls": state["calls"]}), state["status"]
+
+    return app.test_client(), cache, state
+
+
+def test_second_request_is_served_from_cache(setup):
+    client, cache, state = setup
+    first = client.get("/veri")
+    second = client.get("/veri")
+    assert first.data == second.data
+    assert state["calls"] == 1
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert first.headers["Cache-Control"] == "public, no-cache"
+    assert cache.stats()["hits"] == 1
+
+
+def test_if_none_match_returns_304(setup):
+    client, cache, _ = setup
+    etag = client.get("/veri").headers["ETag"]
+    response = client.get("/veri", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    # Sıkıştırma sonrası zayıf hale gelen ETag de eşleşir
+    weak = client.get("/veri", headers={"If-None-Match": f"W/{etag}"})
+    assert weak.status_code == 304
+    assert cache.stats()["not_modified"] == 2
+
+
+def test_version_change_recomputes(setup):
+    client, _, state = setup
+    client.get("/veri")
+    state["version"] = 2
+    assert client.get("/veri").get_json() == {"calls": 2}
+
+
+def test_invalidate(setup):
+    client, cache, state = setup
+    client.get("/veri")
+    cache.invalidate("veri")
+    assert client.get("/veri").get_json() == {"calls": 2}
+    assert cache.stats()["entries"] == {"veri": 1}
+
+
+def test_error_responses_are_not_cached(setup):
+    client, _, state = setup
+    state["status"] = 500
+    client.get("/veri")
+    client.get("/veri")
+    assert state["calls"] == 2
+
+
+def test_query_strings_are_separate_and_bounded(setup):
+    client, cache, state = setup
+    for query in ("a=1", "a=2", "a=3"):
+        client.get(f"/veri?{query}")
+    assert cache.stats()["entries"] == {"veri": 2}
+    client.get("/veri?a=1")  # en eski kayıt atılmıştı
+    assert state["calls"] == 4
+
+
+def test_invalidate_during_computation_is_not_stored():
+    cache = ResponseCache()
+    _, generation = cache._get("veri", "k", None)
+    cache.invalidate("veri")
+    cache._put("veri", "k", _Entry(b"eski", "application/json", None), generation)
+    assert cache.stats()["entries"] == {}
+
+
+def test_public_endpoints(jwt_client, bearer_client):
+    for client in (jwt_client, bearer_client):
+        first = client.get("/api/public")
+        assert first.status_code == 200
+        cached = client.get("/api/public", headers={"If-None-Match": first.headers["ETag"]})
+        assert cached.status_code == 304
+
+
+def test_users_listing_sees_role_change(jwt_client):
+    headers = login(jwt_client)
+    before = jwt_client.get("/api/users").get_json()
+    jwt_client.put("/api/admin/users/user1/role", json={"role": "operator"}, headers=headers)
+    after = jwt_client.get("/api/users").get_json()
+    assert before != after
+    assert "operator" in str(after)
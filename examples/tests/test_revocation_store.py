@@ -0,0 +1,178 @@
+"""Token iptal depoları: süre dolumu, kapasite, kalıcılık (snapshot + WAL) ve paylaşımlı SQLite"""
+
+import os
+import time
+
+import pytest
+
+from common.state_persistence import SnapshotLog
+from revocation_store import (
+    MemoryRevocationStore,
+    PersistentRevocationStore,
+    RevocationStoreFull,
+    SQLiteRevocationStore,
+    create_revocation_store,
+)
+
+from conftest import load_server, login
+
+
+def files(directory, prefix):
+    return sorted(name for name in os.listdir(directory) if name.startswith(prefix))
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRevocationStore()
+    return SQLiteRevocationStore(str(tmp_path / "revoked.db"))
+
+
+def test_revoke_until_exp(store):
+    now = time.time()
+    store.revoke("a", now + 60)
+    store.revoke("b", now - 1)
+    assert store.is_revoked("a")
+    assert not store.is_revoked("b")
+    assert store.purge(now + 120) == 1
+    assert not store.is_revoked("a")
+    assert len(store) == 0
+
+
+def test_full_memory_store_fails_closed():
+    store = MemoryRevocationStore(max_entries=2)
+    now = time.time()
+    store.revoke("ilk", now + 10)
+    store.revoke("ikinci", now + 20)
+    with pytest.raises(RevocationStoreFull):
+        store.revoke("ucuncu", now + 30)
+    # Süresi dolmamış iptaller düşürülmez
+    assert store.is_revoked("ilk") and store.is_revoked("ikinci")
+    assert not store.is_revoked("ucuncu")
+    store.revoke("ilk", now + 10)  # mevcut kayıt yer gerektirmez
+
+
+def test_expired_entries_make_room():
+    store = MemoryRevocationStore(max_entries=1)
+    store.revoke("eski", time.time() + 0.05)
+    time.sleep(0.1)
+    store.revoke("yeni", time.time() + 60)
+    assert store.is_revoked("yeni")
+
+
+def test_create_revocation_store(tmp_path):
+    assert type(create_revocation_store("memory://")) is MemoryRevocationStore
+    assert create_revocation_store("memory://?max_entries=5").max_entries == 5
+    persistent = create_revocation_store(f"memory://?persist={tmp_path / 'state'}")
+    assert isinstance(persistent, PersistentRevocationStore)
+    persistent.close()
+    assert isinstance(create_revocation_store(f"sqlite:///{tmp_path / 'r.db'}"),
+                      SQLiteRevocationStore)
+    with pytest.raises(ValueError):
+        create_revocation_store("redis://localhost")
+
+
+def test_persistent_store_survives_restart(tmp_path):
+    directory = str(tmp_path / "state")
+    now = time.time()
+    store = PersistentRevocationStore(directory, snapshot_interval=3)
+    for index in range(5):
+        store.revoke(f"jti-{index}", now + 60)
+    store.revoke("eski", now - 1)
+    store.close()
+
+    reopened = PersistentRevocationStore(directory)
+    assert all(reopened.is_revoked(f"jti-{index}") for index in range(5))
+    assert not reopened.is_revoked("eski")
+    assert len(reopened) == 5
+    reopened.close()
+
+
+def test_restarts_do_not_accumulate_wals(tmp_path):
+    directory = str(tmp_path / "state")
+    store = PersistentRevocationStore(directory)
+    store.revoke("a", time.time() + 60)
+    store.close()
+    for _ in range(5):
+        PersistentRevocationStore(directory).close()
+    assert len(files(directory, "wal-")) == 1
+    assert len(files(directory, "snapshot-")) == 1
+
+    reopened = PersistentRevocationStore(directory)
+    assert reopened.is_revoked("a")
+    reopened.close()
+
+
+def test_snapshot_log_skips_torn_write(tmp_path):
+    log = SnapshotLog(str(tmp_path), sync=False)
+    assert log.load() == (None, [])
+    log.append(["revoke", "a", 1])
+    log._wal.write(b'["revoke", "b"')  # çökme anında yarım kalan satır
+    log.close()
+
+    log = SnapshotLog(str(tmp_path), sync=False)
+    assert log.load() == (None, [["revoke", "a", 1]])
+    log.snapshot(["durum"])
+    log.close()
+    assert SnapshotLog(str(tmp_path)).load() == (["durum"], [])
+
+
+def test_snapshot_log_removes_wals_older_than_snapshot(tmp_path):
+    log = SnapshotLog(str(tmp_path), sync=False)
+    log.load()
+    log.append(["revoke", "a", 1])
+    log.snapshot(["durum"])
+    log.close()
+    # Snapshot'tan sonra silinemeden kalmış eski bir WAL
+    with open(tmp_path / "wal-0000000000.log", "w") as f:
+        f.write('["revoke","eski",1]\n')
+
+    log = SnapshotLog(str(tmp_path), sync=False)
+    assert log.load() == (["durum"], [])
+    log.close()
+    assert "wal-0000000000.log" not in files(str(tmp_path), "wal-")
+
+
+def test_jwt_logout_survives_restart_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv("JWT_REVOCATION_STORE", raising=False)
+    server = load_server("jwt_token_example", tmp_path, monkeypatch)
+    client = server.app.test_client()
+    headers = login(client)
+    assert client.post("/api/logout", headers=headers).status_code == 200
+    server.revocation_store.close()
+
+    restarted = load_server("jwt_token_example", tmp_path, monkeypatch)
+    assert isinstance(restarted.revocation_store, PersistentRevocationStore)
+    assert restarted.app.test_client().get("/api/protected", headers=headers).status_code == 401
+
+
+def test_sqlite_url_paths(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert create_revocation_store("sqlite:///state/r.db").path == "state/r.db"
+    assert os.path.exists(tmp_path / "state" / "r.db")
+    absolute = tmp_path / "mutlak.db"
+    assert create_revocation_store(f"sqlite:///{absolute}").path == str(absolute)
+
+
+def test_restore_keeps_entries_beyond_capacity(tmp_path):
+    directory = str(tmp_path / "state")
+    store = PersistentRevocationStore(directory, max_entries=3, sync=False)
+    now = time.time()
+    for index in range(3):
+        store.revoke(f"j{index}", now + 60)
+    store.close()
+    reopened = PersistentRevocationStore(directory, max_entries=1, sync=False)
+    assert len(reopened) == 3
+    with pytest.raises(RevocationStoreFull):
+        reopened.revoke("yeni", now + 60)
+
+
+def test_logout_returns_503_when_store_is_full(tmp_path, monkeypatch):
+    server = load_server("jwt_token_example", tmp_path, monkeypatch,
+                         JWT_REVOCATION_STORE="memory://?max_entries=1")
+    client = server.app.test_client()
+    first, second = login(client), login(client)
+    assert client.post("/api/logout", headers=first).status_code == 200
+    response = client.post("/api/logout", headers=second)
+    assert response.status_code == 503
+    assert client.get("/api/protected", headers=first).status_code == 401
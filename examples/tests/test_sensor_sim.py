@@ -0,0 +1,109 @@
+"""Sensör simülatörü: process başına tek login, 401'de tek yenileme ve sayaçlar"""
+
+import argparse
+import itertools
+import threading
+
+from flask import Flask, jsonify, request
+import pytest
+from werkzeug.serving import make_server
+
+from sensor_sim import SensorWorker, drift_report, parse_duration
+
+
+@pytest.fixture
+def backend():
+    """Login ve yangın uyarısı endpoint'lerini taklit eden küçük bir server"""
+    app = Flask(__name__)
+    state = {"logins": 0, "alerts": 0, "expired": set()}
+    tokens = itertools.count(1)
+
+    @app.route("/api/login", methods=["POST"])
+    def login():
+        state["logins"] += 1
+        return jsonify({"access_token": f"token-{next(tokens)}"})
+
+    @app.route("/api/yangin_uyarisi", methods=["POST"])
+    def yangin_uyarisi():
+        token = request.headers["Authorization"].split()[1]
+        if token in state["expired"]:
+            return jsonify({"error": "Token süresi doldu"}), 401
+        state["alerts"] += 1
+        return jsonify({"message": "Yangın protokolü başlatıldı"})
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}/api"
+    yield state
+    server.shutdown()
+
+
+def make_worker(url, sensors=20):
+    args = argparse.Namespace(url=url, username="admin", password="admin123",
+                              timeout=5.0, retries=2, threads=8)
+    return SensorWorker(list(range(sensors)), args, "test")
+
+
+def trip_all(worker):
+    threads = []
+    for sensor_id in worker.sensor_ids:
+        with worker._lock:
+            worker.backlog += 1
+        threads.append(threading.Thread(target=worker.trip, args=(sensor_id, 0)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return worker.window.drain()["counts"]
+
+
+def test_process_logs_in_once(backend):
+    worker = make_worker(backend["url"])
+    counts = trip_all(worker)
+    assert backend["logins"] == 1
+    assert backend["alerts"] == 20
+    assert counts["accepted"] == counts["completed"] == 20
+    assert counts["dropped"] == 0
+    assert worker.backlog == 0
+
+
+def test_expired_token_is_renewed_once(backend):
+    worker = make_worker(backend["url"])
+    trip_all(worker)
+    backend["expired"].add(worker.token)
+
+    counts = trip_all(worker)
+    assert backend["logins"] == 2
+    assert counts["relogins"] == 1
+    assert counts["accepted"] == 20
+    assert counts["dropped"] == 0
+
+
+def test_unreachable_server_drops_alerts():
+    worker = make_worker("http://127.0.0.1:9/api", sensors=1)
+    worker.args.timeout = 0.5
+    counts = trip_all(worker)
+    assert counts["dropped"] == 1
+    assert counts["accepted"] == 0
+
+
+@pytest.mark.parametrize("text, seconds", [("90", 90), ("90s", 90), ("30m", 1800), ("4h", 14400)])
+def test_parse_duration(text, seconds):
+    assert parse_duration(text) == seconds
+
+
+def test_parse_duration_rejects_garbage():
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_duration("dört saat")
+
+
+def test_drift_report():
+    def window(elapsed, p50, rss):
+        return {"accepted": 1, "elapsed_s": elapsed, "server_rss_mb": rss,
+                "latency_ms": {"p50": p50, "p95": p50, "p99": p50}}
+
+    report = drift_report([window(0, 10, 100), window(3600, 15, 110)])
+    assert report["p50_change_pct"] == 50.0
+    assert report["rss_growth_mb_per_hour"] == 10.0
+    assert drift_report([window(0, 10, None)]) is None
@@ -0,0 +1,93 @@
+"""Server başlatma: argümanlar, gunicorn seçenekleri ve master process'te kurulum yapılmaması"""
+
+import os
+import runpy
+import sys
+
+import pytest
+
+import common.serve as serve_module
+from common.serve import MULTIPROCESS_ENV, parse_args, start_workers
+
+from conftest import EXAMPLES_DIR, TEST_ENV
+
+
+@pytest.fixture
+def gunicorn_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(serve_module, "_run_gunicorn",
+                        lambda app_uri, options: calls.append((app_uri, options)))
+    monkeypatch.delenv(MULTIPROCESS_ENV, raising=False)
+    for name in ("SERVER_MODE", "SERVER_PORT", "SERVER_HOST", "SERVER_WORKERS"):
+        monkeypatch.delenv(name, raising=False)
+    return calls
+
+
+def test_parse_args_defaults_and_env(monkeypatch, gunicorn_calls):
+    monkeypatch.setattr(sys, "argv", ["server.py"])
+    args = parse_args(5002)
+    assert (args.mode, args.port) == ("dev", 5002)
+
+    monkeypatch.setenv("SERVER_PORT", "6000")
+    monkeypatch.setenv("SERVER_MODE", "prefork")
+    args = parse_args(5002)
+    assert (args.mode, args.port) == ("prefork", 6000)
+
+    monkeypatch.setattr(sys, "argv", ["server.py", "--port", "7000", "--mode", "dev"])
+    args = parse_args(5002)
+    assert (args.mode, args.port) == ("dev", 7000)
+
+
+def test_dev_mode_returns_args(monkeypatch, gunicorn_calls):
+    monkeypatch.setattr(sys, "argv", ["server.py", "--port", "7001"])
+    args = start_workers("server:app", port=5002)
+    assert args.port == 7001
+    assert gunicorn_calls == []
+
+
+def test_prefork_mode_runs_gunicorn_and_exits(monkeypatch, gunicorn_calls):
+    monkeypatch.setattr(sys, "argv", ["server.py", "--mode", "prefork", "--port", "7002",
+                                      "--workers", "3", "--threads", "2"])
+    with pytest.raises(SystemExit) as exit_info:
+        start_workers("server:app", port=5002)
+    assert exit_info.value.code == 0
+    assert gunicorn_calls == [("server:app", {
+        "bind": "0.0.0.0:7002",
+        "workers": 3,
+        "preload_app": False,
+        "worker_class": "gthread",
+        "threads": 2,
+    })]
+    assert os.environ[MULTIPROCESS_ENV] == "1"
+
+
+def run_script(example, tmp_path, monkeypatch, *argv):
+    monkeypatch.chdir(tmp_path)
+    for name, value in TEST_ENV.items():
+        monkeypatch.setenv(name, value)
+    path = os.path.join(EXAMPLES_DIR, example, "server.py")
+    monkeypatch.setattr(sys, "argv", [path, *argv])
+    return runpy.run_path(path, run_name="__main__")
+
+
+@pytest.mark.parametrize("example", ["jwt_token_example", "bearer_token_example"])
+def test_master_process_skips_setup(example, tmp_path, monkeypatch, gunicorn_calls):
+    with pytest.raises(SystemExit):
+        run_script(example, tmp_path, monkeypatch, "--mode", "prefork", "--workers", "2")
+    assert len(gunicorn_calls) == 1
+    # Veritabanları ve olay günlüğü yalnızca worker'larda açılır
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("example, default_port", [
+    ("jwt_token_example", 5002), ("bearer_token_example", 5001)
+])
+def test_banner_shows_bound_port(example, default_port, tmp_path, monkeypatch, capsys,
+                                 gunicorn_calls):
+    started = []
+    monkeypatch.setattr(serve_module, "serve", lambda app, args: started.append(args.port))
+    run_script(example, tmp_path, monkeypatch, "--port", "5999")
+    output = capsys.readouterr().out
+    assert started == [5999]
+    assert ":5999" in output
+    assert str(default_port) not in output
@@ -0,0 +1,124 @@
+"""İmzalama anahtarları: kid ile doğrulama, rotasyon, emekliye ayırma ve JWKS endpoint'i"""
+
+import os
+
+from cryptography.hazmat.primitives import serialization
+import jwt
+import pytest
+
+from signing_keys import KeySet, generate_key, retire_key
+
+from conftest import load_server, login
+
+
+@pytest.fixture
+def keys_dir(tmp_path):
+    directory = str(tmp_path / "keys")
+    generate_key(directory, "ed25519", kid="2024-01")
+    return directory
+
+
+def test_generate_and_retire(keys_dir):
+    generate_key(keys_dir, "rsa", kid="2024-02")
+    keys = KeySet.load(keys_dir)
+    assert keys.active_kid == "2024-02"
+    assert keys.algorithms == ["EdDSA", "RS256"]
+    assert oct(os.stat(os.path.join(keys_dir, "2024-02.pem")).st_mode & 0o777) == "0o600"
+    with pytest.raises(FileExistsError):
+        generate_key(keys_dir, kid="2024-02")
+
+    retire_key(keys_dir, "2024-01")
+    assert sorted(os.listdir(keys_dir)) == ["2024-01.pub.pem", "2024-02.pem"]
+    keys = KeySet.load(keys_dir)
+    assert keys.keys["2024-01"].private_key is None
+
+
+def write_public_copy(directory, kid, name=None):
+    """retire_key'in yarıda kalmış hali: açık anahtar yazıldı, özel anahtar silinmedi"""
+    public_key = KeySet.load(directory).keys[kid].public_key
+    pem = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    with open(os.path.join(directory, (name or kid) + ".pub.pem"), "wb") as f:
+        f.write(pem)
+
+
+def test_private_key_wins_over_public_copy(keys_dir):
+    write_public_copy(keys_dir, "2024-01")
+    keys = KeySet.load(keys_dir)
+    assert keys.keys["2024-01"].private_key is not None
+    assert keys.active_kid == "2024-01"
+
+
+def test_mismatched_public_copy_is_rejected(keys_dir):
+    generate_key(keys_dir, kid="2024-02")
+    write_public_copy(keys_dir, "2024-02", name="2024-01")
+    with pytest.raises(ValueError):
+        KeySet.load(keys_dir)
+
+
+def test_keyset_rejects_missing_signing_key(keys_dir):
+    retire_key(keys_dir, "2024-01")
+    with pytest.raises(ValueError):
+        KeySet.load(keys_dir)
+    generate_key(keys_dir, kid="2024-02")
+    with pytest.raises(ValueError):
+        KeySet.load(keys_dir, active_kid="2024-01")
+    with pytest.raises(ValueError):
+        generate_key(keys_dir, "dsa")
+
+
+def test_decode_key_checks_kid_and_alg(keys_dir):
+    keys = KeySet.load(keys_dir)
+    assert keys.decode_key({"kid": "2024-01", "alg": "EdDSA"}, {}) is keys.active.public_key
+    for header in ({"kid": "yok", "alg": "EdDSA"}, {"kid": "2024-01", "alg": "HS256"}, {}):
+        with pytest.raises(jwt.InvalidSignatureError):
+            keys.decode_key(header, {})
+
+
+def keyed_server(tmp_path, monkeypatch, keys_dir):
+    return load_server("jwt_token_example", tmp_path, monkeypatch, JWT_KEYS_DIR=keys_dir)
+
+
+def token_of(headers):
+    return headers["Authorization"].split()[1]
+
+
+def test_tokens_carry_kid_and_verify_with_jwks(tmp_path, monkeypatch, keys_dir):
+    client = keyed_server(tmp_path, monkeypatch, keys_dir).app.test_client()
+    token = token_of(login(client))
+    assert jwt.get_unverified_header(token)["kid"] == "2024-01"
+
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=300"
+    # Başka bir servis token'ı yalnızca JWKS ile doğrulayabilir
+    jwk = jwt.PyJWKSet.from_dict(response.get_json())["2024-01"]
+    assert jwt.decode(token, jwk.key, algorithms=["EdDSA"])["sub"] == "admin"
+
+
+def test_rotation_keeps_old_tokens_valid(tmp_path, monkeypatch, keys_dir):
+    old_headers = login(keyed_server(tmp_path, monkeypatch, keys_dir).app.test_client())
+
+    generate_key(keys_dir, "rsa", kid="2024-02")
+    retire_key(keys_dir, "2024-01")
+    client = keyed_server(tmp_path, monkeypatch, keys_dir).app.test_client()
+    new_headers = login(client)
+    assert jwt.get_unverified_header(token_of(new_headers))["kid"] == "2024-02"
+    assert client.get("/api/protected", headers=new_headers).status_code == 200
+    assert client.get("/api/protected", headers=old_headers).status_code == 200
+    kids = [key["kid"] for key in client.get("/.well-known/jwks.json").get_json()["keys"]]
+    assert kids == ["2024-01", "2024-02"]
+
+
+def test_unknown_kid_is_rejected(tmp_path, monkeypatch, keys_dir):
+    client = keyed_server(tmp_path, monkeypatch, keys_dir).app.test_client()
+    forged = jwt.encode({"sub": "admin", "role": "admin"}, "x" * 32, algorithm="HS256",
+                        headers={"kid": "yok"})
+    response = client.get("/api/protected", headers={"Authorization": f"Bearer {forged}"})
+    assert response.status_code == 401
+
+
+def test_jwks_without_keys(jwt_client):
+    assert jwt_client.get("/.well-known/jwks.json").status_code == 404
@@ -0,0 +1,104 @@
+"""Doğrulanmış JWT önbelleği: exp, iptal, LRU sınırı ve server'da imza doğrulamanın atlanması"""
+
+import time
+
+from token_cache import VerifiedTokenCache
+
+from conftest import login
+
+
+def claims(jti, ttl=60):
+    return {"jti": jti, "sub": "admin", "exp": time.time() + ttl}
+
+
+def test_hit_and_miss():
+    cache = VerifiedTokenCache()
+    assert cache.get("a") is None
+    cache.put("a", claims("1"))
+    assert cache.get("a")["jti"] == "1"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+def test_raw_token_is_not_a_key():
+    cache = VerifiedTokenCache()
+    cache.put("gizli.token.degeri", claims("1"))
+    assert "gizli.token.degeri" not in cache._entries
+
+
+def test_expired_entries_are_dropped():
+    cache = VerifiedTokenCache()
+    cache.put("a", claims("1", ttl=-1))
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+    cache.put("b", {"jti": "2"})  # exp olmayan claim'ler önbelleğe alınmaz
+    assert cache.get("b") is None
+
+
+def test_revoked_tokens_are_not_served():
+    revoked = set()
+    cache = VerifiedTokenCache(is_revoked=revoked.__contains__)
+    cache.put("a", claims("1"))
+    assert cache.get("a") is not None
+    revoked.add("1")
+    assert cache.get("a") is None
+    cache.put("a", claims("1"))
+    assert cache.stats()["size"] == 0
+
+
+def test_revocation_check_runs_outside_the_lock():
+    cache = VerifiedTokenCache()
+    held = []
+
+    def is_revoked(jti):
+        held.append(cache._lock.locked())
+        return False
+
+    cache.is_revoked = is_revoked
+    cache.put("a", claims("1"))
+    assert cache.get("a") is not None
+    assert held and not any(held)
+
+
+def test_lru_eviction():
+    cache = VerifiedTokenCache(max_size=2)
+    cache.put("a", claims("1"))
+    cache.put("b", claims("2"))
+    cache.get("a")
+    cache.put("c", claims("3"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disabled_cache():
+    cache = VerifiedTokenCache(max_size=0)
+    cache.put("a", claims("1"))
+    assert cache.get("a") is None
+
+
+def test_server_reuses_verified_claims(jwt_client):
+    headers = login(jwt_client)
+    for _ in range(3):
+        assert jwt_client.get("/api/protected", headers=headers).status_code == 200
+    stats = jwt_client.get("/api/admin/token-cache", headers=headers).get_json()
+    assert stats["size"] == 1
+    assert stats["hits"] >= 3
+
+
+def test_logout_invalidates_cached_token(jwt_client):
+    headers = login(jwt_client)
+    assert jwt_client.get("/api/protected", headers=headers).status_code == 200
+    assert jwt_client.post("/api/logout", headers=headers).status_code == 200
+    assert jwt_client.get("/api/protected", headers=headers).status_code == 401
+
+
+def test_cached_request_checks_revocation_once(jwt_server, jwt_client, monkeypatch):
+    headers = login(jwt_client)
+    jwt_client.get("/api/protected", headers=headers)
+    lookups = []
+    original = jwt_server.revocation_store.is_revoked
+    monkeypatch.setattr(jwt_server.revocation_store, "is_revoked",
+                        lambda jti: lookups.append(jti) or original(jti))
+    assert jwt_client.get("/api/protected", headers=headers).status_code == 200
+    assert len(lookups) == 1
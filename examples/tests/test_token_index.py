@@ -0,0 +1,177 @@
+"""Bearer token indeksi: anahtarlı hash ile arama, süre, iptal ve token yönetimi endpoint'leri"""
+
+import pytest
+
+import token_index
+from token_index import PURGE_INTERVAL, TOKEN_SCHEME, TokenIndex, token_prefix
+
+from conftest import BEARER_ADMIN, BEARER_USER
+
+
+@pytest.fixture
+def index(tmp_path):
+    return TokenIndex(str(tmp_path / "tokens.db"), "test-key")
+
+
+def test_lookup(index):
+    index.add("api_token_abc", "sensor", "user")
+    assert index.lookup("api_token_abc") == {"user": "sensor", "role": "user"}
+    assert index.lookup("api_token_abd") is None
+
+
+def test_raw_token_is_not_stored(index, tmp_path):
+    index.add("api_token_gizli_deger_123", "sensor", "user")
+    index._connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    assert b"gizli_deger_123" not in (tmp_path / "tokens.db").read_bytes()
+
+
+def test_digest_depends_on_key(tmp_path):
+    a = TokenIndex(str(tmp_path / "a.db"), "key-a")
+    b = TokenIndex(str(tmp_path / "b.db"), "key-b")
+    assert a.digest("token") != b.digest("token")
+    assert a.digest("token") == a.digest("token")
+
+
+@pytest.mark.parametrize("token", [123, None, ["api_token_abc"], {"token": "x"}])
+def test_digest_rejects_non_text(index, token):
+    with pytest.raises(TypeError):
+        index.digest(token)
+
+
+def test_expired_token_is_rejected_and_purged(index):
+    expires_at = index.add("api_token_kisa", "sensor", "user", expires_in=60)
+    assert index.lookup("api_token_kisa") is not None
+    assert index.purge_expired(now=expires_at - 1) == 0
+    assert index.purge_expired(now=expires_at) == 1
+    assert index.lookup("api_token_kisa") is None
+
+
+def later(monkeypatch, seconds):
+    now = token_index.time.time() + seconds
+    monkeypatch.setattr(token_index.time, "time", lambda: now)
+
+
+def test_expired_tokens_are_not_listed(index, monkeypatch):
+    index.add("api_token_kisa", "sensor", "user", expires_in=60)
+    index.add("api_token_uzun", "sensor", "user")
+    later(monkeypatch, 61)
+    tokens, next_key = index.page_tokens()
+    assert [token["token_prefix"] for token in tokens] == [token_prefix("api_token_uzun")]
+    assert next_key is None
+    # Kayıt henüz silinmedi, yalnızca listeden düştü
+    assert len(index) == 2
+
+
+def test_add_purges_expired_tokens_at_most_once_per_interval(index, monkeypatch):
+    index.add("api_token_kisa", "sensor", "user", expires_in=1)
+    later(monkeypatch, PURGE_INTERVAL)
+    index.add("api_token_ikinci", "sensor", "user", expires_in=1)
+    # İlk token ikinci eklemede silindi
+    assert len(index) == 1
+    later(monkeypatch, 2)
+    index.add("api_token_ucuncu", "sensor", "user")
+    # Son silmeden bu yana PURGE_INTERVAL geçmedi; süresi dolan ikinci token duruyor
+    assert len(index) == 2
+    later(monkeypatch, PURGE_INTERVAL)
+    index.add("api_token_dorduncu", "sensor", "user")
+    assert len(index) == 2
+
+
+def test_list_endpoint_drops_expired_tokens(bearer_client, bearer_server, monkeypatch):
+    bearer_client.post("/api/generate-token", json={"user": "sensor", "expires_in": 60})
+    assert len(bearer_client.get("/api/list-tokens?user=sensor").get_json()["tokens"]) == 1
+    later(monkeypatch, 61 + PURGE_INTERVAL)
+    # Önbellekteki liste, süresi dolan token silinince geçersiz olur
+    assert bearer_client.get("/api/list-tokens?user=sensor").get_json()["tokens"] == []
+    assert bearer_client.get("/api/list-tokens", headers={"Accept": "application/x-ndjson"}).data.count(b"sensor") == 0
+
+
+def test_revoke_and_revoke_user(index):
+    for i in range(3):
+        index.add(f"api_token_{i}", "a" if i < 2 else "b", "user")
+    assert index.revoke(["api_token_0", "api_token_yok"]) == 1
+    assert index.revoke_user("a") == 1
+    assert len(index) == 1
+    assert index.lookup("api_token_2") == {"user": "b", "role": "user"}
+
+
+def test_generation_changes_on_writes(index):
+    start = index.generation()
+    index.add("api_token_x", "a", "user")
+    assert index.generation() == start + 1
+    index.add("api_token_x", "a", "user", replace=False)
+    assert index.generation() == start + 1
+    index.revoke(["api_token_x"])
+    assert index.generation() == start + 2
+
+
+def test_index_survives_reopen(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    TokenIndex(path, "k").add("api_token_kalici", "sensor", "user")
+    assert TokenIndex(path, "k").lookup("api_token_kalici") is not None
+    assert TokenIndex(path, "baska-anahtar").lookup("api_token_kalici") is None
+
+
+def test_token_prefix_skips_fixed_scheme():
+    assert token_prefix(f"{TOKEN_SCHEME}AbCdEfGhIjKl") == f"{TOKEN_SCHEME}AbCdEfGh"
+    assert token_prefix("custom-token-value") == "custom-t"
+
+
+def test_generated_tokens_have_distinct_prefixes(bearer_client):
+    tokens = [
+        bearer_client.post("/api/generate-token", json={"user": "sensor"}).get_json()["token"]
+        for _ in range(5)
+    ]
+    listed = bearer_client.get("/api/list-tokens?user=sensor").get_json()["tokens"]
+    prefixes = [token["token_prefix"] for token in listed]
+    assert prefixes == [token_prefix(token) for token in tokens]
+    assert len(set(prefixes)) == 5
+    assert all(len(prefix) > len(TOKEN_SCHEME) for prefix in prefixes)
+
+
+def test_generated_token_authenticates(bearer_client):
+    body = bearer_client.post("/api/generate-token", json={"user": "sensor", "role": "service"}).get_json()
+    response = bearer_client.get("/api/protected", headers={"Authorization": f"Bearer {body['token']}"})
+    assert response.status_code == 200
+    assert response.get_json()["role"] == "service"
+
+
+@pytest.mark.parametrize("body", [
+    {"user": 123},
+    {"user": ""},
+    {"user": ["a"]},
+    {"user": "sensor", "role": 5},
+    {"user": "sensor", "role": None},
+    {"user": "sensor", "expires_in": True},
+    {"user": "sensor", "expires_in": -5},
+    {"user": "sensor", "expires_in": "60"},
+])
+def test_generate_token_validates_fields(bearer_client, body):
+    response = bearer_client.post("/api/generate-token", json=body)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("body", [
+    {"tokens": [123]},
+    {"tokens": ["api_token_admin_12345", None]},
+    {"user": ["admin"]},
+    {"user": 5},
+    {},
+    [],
+])
+def test_revoke_tokens_validates_fields(bearer_client, body):
+    response = bearer_client.post("/api/revoke-tokens", json=body, headers=BEARER_ADMIN)
+    assert response.status_code == 400
+    # Hiçbir token silinmemeli
+    assert bearer_client.get("/api/protected", headers=BEARER_USER).status_code == 200
+
+
+def test_revoke_tokens_requires_admin(bearer_client):
+    response = bearer_client.post("/api/revoke-tokens", json={"user": "admin"}, headers=BEARER_USER)
+    assert response.status_code == 403
+
+
+def test_revoke_user_tokens(bearer_client):
+    response = bearer_client.post("/api/revoke-tokens", json={"user": "user1"}, headers=BEARER_ADMIN)
+    assert response.get_json()["revoked"] == 1
+    assert bearer_client.get("/api/protected", headers=BEARER_USER).status_code == 401
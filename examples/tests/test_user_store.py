@@ -0,0 +1,155 @@
+"""Kullanıcı deposu: PBKDF2 hash formatı, toplu içe aktarma doğrulaması ve login hata yolları"""
+
+import pytest
+
+import user_store
+from user_store import UserStore, check_password, hash_password, parse_password_hash
+
+from conftest import login
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UserStore(str(tmp_path / "users.db"), iterations=1000)
+
+
+def test_hash_roundtrip():
+    encoded = hash_password("gizli", 1000)
+    assert parse_password_hash(encoded)[0] == 1000
+    assert check_password("gizli", encoded)
+    assert not check_password("yanlis", encoded)
+
+
+@pytest.mark.parametrize("encoded", [
+    None,
+    "",
+    "pbkdf2_sha256$1000$c2FsdA",
+    "md5$1000$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$abc$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$0$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$-5$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$999$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$2000001$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$99999999999$c2FsdA$aGFzaA",
+    "pbkdf2_sha256$1000$!!!$aGFzaA",
+    "pbkdf2_sha256$1000$c2FsdA$",
+])
+def test_malformed_hash_is_rejected(encoded):
+    with pytest.raises(ValueError):
+        parse_password_hash(encoded)
+    assert check_password("gizli", encoded) is False
+
+
+def test_import_validates_password_hash(store):
+    with pytest.raises(ValueError):
+        store.import_users([{
+            "username": "bozuk", "role": "user", "email": "b@example.com",
+            "password_hash": "pbkdf2_sha256$1000$!!!$aGFzaA"
+        }])
+    assert store.get_profile("bozuk") is None
+
+
+def test_import_accepts_existing_hash(store):
+    store.import_users([{
+        "username": "tasinan", "role": "user", "email": "t@example.com",
+        "password_hash": hash_password("gizli", 1000)
+    }])
+    assert store.verify_password("tasinan", "gizli")
+
+
+def test_corrupt_stored_hash_fails_login(store):
+    store.add_user("eski", "gizli", "user", "e@example.com")
+    conn = store._connection()
+    with conn:
+        conn.execute("UPDATE users SET password_hash = ? WHERE username = 'eski'",
+                     ("pbkdf2_sha256$x$%%%$???",))
+    assert store.verify_password("eski", "gizli") is False
+
+
+@pytest.mark.parametrize("users", [
+    ["admin"],
+    [42],
+    [{"username": "a", "role": "user", "email": "a@example.com", "password": 123}],
+    [{"username": ["a"], "role": "user", "email": "a@example.com", "password": "x"}],
+])
+def test_import_rejects_invalid_items(store, users):
+    with pytest.raises(ValueError):
+        store.import_users(users)
+
+
+def test_iteration_setting_is_bounded(tmp_path):
+    with pytest.raises(ValueError):
+        UserStore(str(tmp_path / "users.db"), iterations=user_store.MAX_HASH_ITERATIONS + 1)
+
+
+def user(name, **fields):
+    return dict({"username": name, "role": "user", "email": f"{name}@example.com",
+                 "password_hash": hash_password("gizli", 1000)}, **fields)
+
+
+def test_invalid_record_in_later_batch_writes_nothing(store, monkeypatch):
+    monkeypatch.setattr(user_store, "IMPORT_BATCH_SIZE", 2)
+    generation = store.generation()
+    users = [user("a"), user("b"), user("c"), user("d", password_hash="bozuk")]
+    with pytest.raises(ValueError):
+        store.import_users(users)
+    assert len(store) == 0
+    assert store.generation() == generation
+
+    assert store.import_users(users[:3]) == 3
+    assert len(store) == 3
+    assert store.generation() == generation + 1
+
+
+def test_reader_error_rolls_back_import(store, monkeypatch):
+    monkeypatch.setattr(user_store, "IMPORT_BATCH_SIZE", 1)
+
+    def users():
+        yield user("a")
+        yield user("b")
+        raise ValueError("bozuk satır")
+
+    with pytest.raises(ValueError):
+        store.import_users(users())
+    assert len(store) == 0
+
+
+def test_import_checks_roles(store):
+    with pytest.raises(ValueError):
+        store.import_users([user("a", role="root")], roles={"user", "admin"})
+    assert store.import_users([user("a", role="admin")], roles={"user", "admin"}) == 1
+
+
+def test_import_refreshes_cached_profiles(store):
+    store.import_users([user("a")])
+    assert store.get_profile("a")["role"] == "user"
+    store.import_users([user("a", role="admin")])
+    assert store.get_profile("a")["role"] == "admin"
+
+
+def test_failed_import_keeps_listing_consistent(jwt_client):
+    headers = login(jwt_client)
+    before = jwt_client.get("/api/users").get_json()
+    body = [user("yeni"), user("rolsuz", role="root")]
+    response = jwt_client.post("/api/admin/users/import", json=body, headers=headers)
+    assert response.status_code == 400
+    assert "root" in response.get_json()["error"]
+    assert jwt_client.get("/api/users").get_json() == before
+
+
+def test_import_endpoint_returns_400(jwt_client):
+    headers = login(jwt_client)
+    for body in (["admin"], [{"username": "x", "role": "user", "email": "x@example.com",
+                              "password_hash": "pbkdf2_sha256$bad"}]):
+        response = jwt_client.post("/api/admin/users/import", json=body, headers=headers)
+        assert response.status_code == 400
+        assert "Geçersiz kullanıcı kaydı" in response.get_json()["error"]
+
+
+@pytest.mark.parametrize("body", [
+    {"username": ["admin"], "password": "admin123"},
+    {"username": "admin", "password": 123},
+    {"username": "admin", "password": None},
+])
+def test_login_rejects_non_string_fields(jwt_client, body):
+    assert jwt_client.post("/api/login", json=body).status_code == 400